@@ -0,0 +1,77 @@
+import argparse
+import sys
+
+from . import suite
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Time the poser hot paths and gate regressions.",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="*",
+        default=list(suite.SIZES),
+        help="point counts for the sized benchmarks",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument(
+        "--filter",
+        default=None,
+        help="only run benchmarks whose name contains this string",
+    )
+    parser.add_argument(
+        "--save",
+        metavar="PATH",
+        help="write the results to a JSON baseline file",
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="PATH",
+        help="compare the results against a JSON baseline file",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown reported as a regression (default 0.1)",
+    )
+    args = parser.parse_args(argv)
+
+    baseline = suite.load(path=args.compare) if args.compare else {}
+
+    def report(name: str, seconds: float) -> None:
+        line = f"{name:<60}{seconds * 1e6:>14.3f} us"
+        if name in baseline and baseline[name]:
+            line += f"{seconds / baseline[name]:>8.2f}x"
+        print(line, flush=True)
+
+    results = suite.run(
+        sizes=args.sizes,
+        repeat=args.repeat,
+        min_time=args.min_time,
+        pattern=args.filter,
+        report=report,
+    )
+    if args.save:
+        suite.save(path=args.save, results=results)
+    if not args.compare:
+        return 0
+    regressions = suite.compare(
+        results=results,
+        baseline=baseline,
+        threshold=args.threshold,
+    )
+    for (name, reference, seconds, ratio,) in regressions:
+        print(
+            f"REGRESSION {name}: {reference * 1e6:.3f} us -> "
+            f"{seconds * 1e6:.3f} us ({ratio:.2f}x)"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+import dataclasses
+import sys
+import tracemalloc
+from typing import Callable, Tuple
+
+import poser
+import poser.rotation.representations
+
+
+Matrix = poser.rotation.representations.Matrix
+Quaternion = poser.rotation.representations.Quaternion
+OPKDeg = poser.rotation.representations.OPKDeg
+
+
+def unslotted(cls: type) -> type:
+    fields = dataclasses.fields(cls)
+    return dataclasses.make_dataclass(
+        f"Dict{cls.__name__}",
+        [(f.name, f.type, dataclasses.field(default=f.default)) for f in fields],
+    )
+
+
+def allocated_bytes_per_instance(
+    factory: Callable[[], object],
+    count: int,
+) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [factory() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del instances
+    return (after - before - sys.getsizeof([None] * count)) / count
+
+
+def compare(
+    cls: type,
+    count: int,
+) -> Tuple[float, float]:
+    dict_cls = unslotted(cls)
+    return (
+        allocated_bytes_per_instance(factory=dict_cls, count=count),
+        allocated_bytes_per_instance(factory=cls, count=count),
+    )
+
+
+def main(count: int = 100_000) -> None:
+    print(f"{'type':<12}{'dict [B]':>12}{'slots [B]':>12}{'saved':>8}")
+    for cls in (poser.Point, poser.Translation, Matrix, Quaternion, OPKDeg):
+        (with_dict, with_slots,) = compare(cls=cls, count=count)
+        print(
+            f"{cls.__name__:<12}{with_dict:>12.1f}{with_slots:>12.1f}"
+            f"{1.0 - with_slots/with_dict:>8.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main(count=int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,62 @@
+import os
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+import poser
+import poser.parallel
+import poser.rotation.representations
+
+
+OPKDeg = poser.rotation.representations.OPKDeg
+
+
+def main(
+    count: int = 2_000_000,
+    max_workers: int = 0,
+) -> None:
+    pose = poser.Pose(
+        translation=poser.Translation(x=10.0, y=-2.0, z=1.0),
+        rotation=poser.Rotation(
+            rotation=OPKDeg(omega=45.0, phi=-20.0, kappa=130.0)
+        )
+    )
+    source = array("d", range(3 * count))
+    expected = None
+    cpus = os.cpu_count() or 1
+    max_workers = max_workers or cpus
+    workers = sorted(
+        {2**i for i in range(max_workers.bit_length())} | {max_workers}
+    )
+    print(f"{count} points in shared memory, {cpus} cpu cores")
+    print(f"{'workers':>8}{'seconds':>10}{'speedup':>9}{'Mpts/s':>8}")
+    baseline = None
+    for n in workers:
+        with ProcessPoolExecutor(max_workers=n) as executor, \
+                poser.parallel.SharedPointArray(coordinates=source) as points:
+            poser.parallel.transform_points(
+                pose=pose, points=points, workers=n, executor=executor,
+            )
+            points.coordinates[:] = source
+            start = time.perf_counter()
+            poser.parallel.transform_points(
+                pose=pose, points=points, workers=n, executor=executor,
+            )
+            elapsed = time.perf_counter() - start
+            if expected is None:
+                (expected, baseline,) = (points.copy(), elapsed,)
+            elif points != expected:
+                raise RuntimeError(
+                    f"result with {n} workers differs from serial."
+                )
+        print(
+            f"{n:>8}{elapsed:>10.3f}{baseline/elapsed:>9.2f}"
+            f"{count/elapsed/1e6:>8.2f}"
+        )
+
+if __name__ == "__main__":
+    main(
+        count=int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000,
+        max_workers=int(sys.argv[2]) if len(sys.argv) > 2 else 0,
+    )
@@ -0,0 +1,198 @@
+import json
+import platform
+import timeit
+from array import array
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import poser
+import poser.rotation.converter
+import poser.rotation.representations
+
+
+Matrix = poser.rotation.representations.Matrix
+Quaternion = poser.rotation.representations.Quaternion
+OPKDeg = poser.rotation.representations.OPKDeg
+
+Converter = poser.rotation.converter.Converter
+
+
+SIZES = (1, 1_000, 1_000_000)
+
+
+def _pose(
+    omega: float = 45.0,
+    phi: float = -20.0,
+    kappa: float = 130.0,
+) -> poser.Pose:
+    return poser.Pose(
+        translation=poser.Translation(x=10.0, y=-2.0, z=1.0),
+        rotation=poser.Rotation(
+            rotation=OPKDeg(omega=omega, phi=phi, kappa=kappa)
+        )
+    )
+
+
+def scalar_benchmarks() -> Dict[str, Callable[[], object]]:
+    pose = _pose()
+    other = _pose(omega=-10.0, phi=5.0, kappa=-60.0)
+    rotation = pose.rotation
+    matrix = rotation.matrix
+    quaternion = rotation.quaternion
+    opk_deg = rotation.opk_deg
+    return {
+        "construct.Point": lambda: poser.Point(1.0, 2.0, 3.0),
+        "construct.Rotation.quaternion": lambda: poser.Rotation(
+            rotation=Quaternion(w=1.0, x=0.1, y=0.2, z=0.3)
+        ),
+        "construct.Rotation.opk_deg": lambda: poser.Rotation(
+            rotation=OPKDeg(omega=45.0, phi=-20.0, kappa=130.0)
+        ).quaternion,
+        "construct.Pose": lambda: poser.Pose(
+            translation=poser.Translation(1.0, 2.0, 3.0),
+            rotation=poser.Rotation(rotation=Quaternion()),
+        ),
+        "convert.matrix_to_opk_deg": lambda: Converter.matrix_to_opk_deg(
+            matrix=matrix
+        ),
+        "convert.opk_deg_to_matrix": lambda: Converter.opk_deg_to_matrix(
+            opk_deg=opk_deg
+        ),
+        "convert.matrix_to_quaternion": lambda: (
+            Converter.matrix_to_quaternion(matrix=matrix)
+        ),
+        "convert.quaternion_to_matrix": lambda: (
+            Converter.quaternion_to_matrix(quaternion=quaternion)
+        ),
+        "compose.Rotation": lambda: rotation * other.rotation,
+        "compose.Pose": lambda: pose * other,
+        "invert.Rotation": lambda: ~rotation,
+        "invert.Pose": lambda: ~pose,
+        "interpolate.Rotation": lambda: rotation.interpolated(
+            other=other.rotation, factor=0.3
+        ),
+        "interpolate.Pose": lambda: pose.interpolated(
+            other=other, factor=0.3
+        ),
+        "matrix.Pose.as_tuple": lambda: pose.as_tuple,
+    }
+
+
+def sized_benchmarks(
+    size: int,
+) -> Dict[str, Callable[[], object]]:
+    pose = _pose()
+    other = _pose(omega=-10.0, phi=5.0, kappa=-60.0)
+    matrix = pose.rotation.matrix
+    coordinates = array("d", (0.001 * i for i in range(3 * size)))
+    point_array = poser.PointArray(coordinates=coordinates)
+    points = point_array.to_points()
+    out = poser.PointArray.zeros(length=size)
+    opk_degs = array("d", (45.0, -20.0, 130.0)) * size
+    poses = poser.PoseArray.from_poses(poses=[pose] * size)
+    others = poser.PoseArray.from_poses(poses=[other] * size)
+    return {
+        f"transform.Matrix.transformed_points.list[{size}]": lambda: (
+            matrix.transformed_points(points=points)
+        ),
+        f"transform.Pose.transformed_points.list[{size}]": lambda: (
+            pose.transformed_points(points=points)
+        ),
+        f"transform.Pose.transformed_points.PointArray[{size}]": lambda: (
+            pose.transformed_points(points=point_array)
+        ),
+        f"transform.Pose.transformed_points.out[{size}]": lambda: (
+            pose.transformed_points(points=point_array, out=out)
+        ),
+        f"convert.opk_deg_to_quaternion_batch[{size}]": lambda: (
+            Converter.opk_deg_to_quaternion_batch(opk_degs=opk_degs)
+        ),
+        f"compose.PoseArray[{size}]": lambda: poses * others,
+        f"invert.PoseArray[{size}]": lambda: ~poses,
+        f"interpolate.PoseArray[{size}]": lambda: poses.interpolated(
+            other=others, factor=0.3
+        ),
+    }
+
+
+def measure(
+    function: Callable[[], object],
+    repeat: int = 5,
+    min_time: float = 0.2,
+) -> float:
+    timer = timeit.Timer(function)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number=number)
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    best = elapsed
+    for _ in range(repeat - 1):
+        best = min(best, timer.timeit(number=number))
+    return best / number
+
+
+def run(
+    sizes: Iterable[int] = SIZES,
+    repeat: int = 5,
+    min_time: float = 0.2,
+    pattern: Optional[str] = None,
+    report: Optional[Callable[[str, float], None]] = None,
+) -> Dict[str, float]:
+    groups = [scalar_benchmarks] + [
+        (lambda size=size: sized_benchmarks(size=size)) for size in sizes
+    ]
+    results = {}
+    for group in groups:
+        for name, function in group().items():
+            if pattern is not None and pattern not in name:
+                continue
+            results[name] = measure(
+                function=function,
+                repeat=repeat,
+                min_time=min_time,
+            )
+            if report is not None:
+                report(name, results[name])
+    return results
+
+
+def save(
+    path: str,
+    results: Dict[str, float],
+) -> None:
+    with open(path, "w") as file:
+        json.dump(
+            {
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "results": results,
+            },
+            file,
+            indent=2,
+            sort_keys=True,
+        )
+        file.write("\n")
+
+
+def load(
+    path: str,
+) -> Dict[str, float]:
+    with open(path, "r") as file:
+        return json.load(file)["results"]
+
+
+def compare(
+    results: Dict[str, float],
+    baseline: Dict[str, float],
+    threshold: float = 0.1,
+) -> List[Tuple[str, float, float, float]]:
+    regressions = []
+    for name, seconds in results.items():
+        reference = baseline.get(name)
+        if not reference:
+            continue
+        ratio = seconds / reference
+        if ratio > 1.0 + threshold:
+            regressions.append((name, reference, seconds, ratio,))
+    return regressions
@@ -1,17 +1,29 @@
 from poser import translation
 from poser import point
+from poser import point_array
 from poser import pose
+from poser import pose_array
 from poser import rotation
+from poser import trajectory
+from poser import io
 
 Rotation = rotation.Rotation
+RotationArray = rotation.RotationArray
 Translation = translation.Translation
 Point = point.Point
+PointArray = point_array.PointArray
 Pose = pose.Pose
+PoseArray = pose_array.PoseArray
+Trajectory = trajectory.Trajectory
 
 
 __all__ = [
    "Rotation",
+   "RotationArray",
    "Translation",
    "Point",
+   "PointArray",
    "Pose",
+   "PoseArray",
+   "Trajectory",
 ]
@@ -0,0 +1,72 @@
+from array import array
+from typing import Union, Iterable, Iterator, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+FloatArray = array if np is None else np.ndarray
+
+
+def as_float_buffer(
+    values: Optional[Union[array, memoryview, Iterable[float]]],
+) -> Union[array, memoryview]:
+    if values is None:
+        return array("d")
+    if isinstance(values, array) and values.typecode == "d":
+        return values
+    if isinstance(values, (list, tuple)):
+        if values and isinstance(values[0], (list, tuple)):
+            return array("d", _flattened(values=values))
+        return array("d", values)
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return array("d", values)
+    if not view.c_contiguous:
+        raise ValueError("buffer is not contiguous.")
+    if view.format == "d":
+        return view.cast("B").cast("d")
+    if view.format in ("B", "b", "c"):
+        if view.nbytes % 8:
+            raise ValueError("byte buffer length is not a multiple of 8.")
+        return view.cast("B").cast("d")
+    return array("d", view.cast("B").cast(view.format))
+
+
+def as_float_array(
+    values: Optional[Union[array, memoryview, Iterable[float]]],
+) -> FloatArray:
+    if np is None:
+        return as_float_buffer(values=values)
+    if isinstance(values, np.ndarray):
+        if values.dtype == np.float64 and values.flags.c_contiguous:
+            return values.reshape(-1)
+        return np.ascontiguousarray(values, dtype=np.float64).reshape(-1)
+    return np.frombuffer(as_float_buffer(values=values), dtype=np.float64)
+
+
+def is_row_view(
+    values: object,
+    width: int,
+) -> bool:
+    return (
+        np is not None
+        and isinstance(values, np.ndarray)
+        and values.ndim == 2
+        and values.shape[1] == width
+        and values.dtype == np.float64
+        and not values.flags.c_contiguous
+    )
+
+
+def _flattened(
+    values: Union[list, tuple],
+) -> Iterator[float]:
+    for value in values:
+        if isinstance(value, (list, tuple)):
+            yield from _flattened(values=value)
+        else:
+            yield value
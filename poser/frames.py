@@ -0,0 +1,181 @@
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+import poser.pose
+import poser.rotation.representations
+
+
+Pose = poser.pose.Pose
+Translation = poser.translation.Translation
+Rotation = poser.rotation.rotation.Rotation
+Matrix = poser.rotation.representations.Matrix
+Quaternion = poser.rotation.representations.Quaternion
+
+
+class FrameGraph(object):
+    def __init__(self) -> None:
+        self._parents: Dict[str, Optional[str]] = {}
+        self._poses: Dict[str, Pose] = {}
+        self._children: Dict[str, Set[str]] = {}
+        self._cache: Dict[Tuple[str, str], Pose] = {}
+        self._dependents: Dict[str, Set[Tuple[str, str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._parents)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._parents
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._parents)
+
+    def add(
+        self,
+        name: str,
+        parent: Optional[str] = None,
+        pose: Optional[Pose] = None,
+    ) -> None:
+        if name in self._parents:
+            raise ValueError(f"frame {name!r} already exists.")
+        if parent is not None:
+            self._check(name=parent)
+            self._children[parent].add(name)
+        self._parents[name] = parent
+        self._poses[name] = _copied(pose=pose or Pose())
+        self._children[name] = set()
+        self._dependents[name] = set()
+
+    def remove(
+        self,
+        name: str,
+    ) -> None:
+        self._check(name=name)
+        if self._children[name]:
+            raise ValueError(
+                f"frame {name!r} still has children: "
+                f"{sorted(self._children[name])}."
+            )
+        self._invalidate(name=name)
+        parent = self._parents.pop(name)
+        if parent is not None:
+            self._children[parent].discard(name)
+        del self._poses[name]
+        del self._children[name]
+        del self._dependents[name]
+
+    def parent(
+        self,
+        name: str,
+    ) -> Optional[str]:
+        self._check(name=name)
+        return self._parents[name]
+
+    def pose(
+        self,
+        name: str,
+    ) -> Pose:
+        self._check(name=name)
+        return _copied(pose=self._poses[name])
+
+    def set_pose(
+        self,
+        name: str,
+        pose: Pose,
+    ) -> None:
+        self._check(name=name)
+        self._invalidate(name=name)
+        self._poses[name] = _copied(pose=pose)
+
+    def path(
+        self,
+        target: str,
+        source: str,
+    ) -> List[str]:
+        (up, common, down,) = self._path(target=target, source=source)
+        return up + [common] + down[::-1]
+
+    def lookup(
+        self,
+        target: str,
+        source: str,
+    ) -> Pose:
+        return _copied(pose=self._lookup(target=target, source=source))
+
+    def _lookup(
+        self,
+        target: str,
+        source: str,
+    ) -> Pose:
+        key = (target, source,)
+        pose = self._cache.get(key)
+        if pose is not None:
+            return pose
+        (up, common, down,) = self._path(target=target, source=source)
+        if target == source:
+            pose = Pose()
+        elif common == target:
+            parent = self._parents[source]
+            pose = self._poses[source]
+            if parent != target:
+                pose = self._lookup(target=target, source=parent) * pose
+        elif common == source:
+            pose = ~self._lookup(target=source, source=target)
+        else:
+            pose = (
+                ~self._lookup(target=common, source=target)
+                * self._lookup(target=common, source=source)
+            )
+        self._cache[key] = pose
+        for name in up + down:
+            self._dependents[name].add(key)
+        return pose
+
+    def _path(
+        self,
+        target: str,
+        source: str,
+    ) -> Tuple[List[str], str, List[str]]:
+        self._check(name=target)
+        self._check(name=source)
+        up = [target]
+        while self._parents[up[-1]] is not None:
+            up.append(self._parents[up[-1]])
+        ancestors = {name: i for i, name in enumerate(up)}
+        down = [source]
+        while down[-1] not in ancestors:
+            parent = self._parents[down[-1]]
+            if parent is None:
+                raise ValueError(
+                    f"frames {target!r} and {source!r} are not connected."
+                )
+            down.append(parent)
+        common = down.pop()
+        return (up[:ancestors[common]], common, down,)
+
+    def _invalidate(
+        self,
+        name: str,
+    ) -> None:
+        for key in self._dependents[name]:
+            self._cache.pop(key, None)
+        self._dependents[name].clear()
+
+    def _check(
+        self,
+        name: str,
+    ) -> None:
+        if name not in self._parents:
+            raise KeyError(f"frame {name!r} does not exist.")
+
+
+def _copied(
+    pose: Pose,
+) -> Pose:
+    q = pose.rotation.quaternion
+    m = pose.rotation.as_tuple
+    return Pose(
+        translation=Translation._unchecked(*pose.translation.as_tuple),
+        rotation=Rotation._unchecked(
+            quaternion=Quaternion._unchecked(q.w, q.x, q.y, q.z),
+            matrix=Matrix._unchecked(*m[0], *m[1], *m[2]),
+        ),
+    )
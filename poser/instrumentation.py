@@ -0,0 +1,165 @@
+from contextlib import contextmanager
+from functools import partial, wraps
+from threading import Lock
+from time import perf_counter
+from typing import Callable, Dict, Iterator, List, Tuple
+import json
+
+import poser
+import poser.patching
+import poser.pose_array
+import poser.rotation.converter
+import poser.rotation.representations
+import poser.rotation.rotation_array
+
+
+CONSTRUCTORS = ("__init__", "_unchecked")
+TRANSFORMS = (
+    "transform_point",
+    "transform_points",
+    "transformed_point",
+    "transformed_points",
+    "transform_iter",
+)
+
+
+def _targets() -> List[Tuple[type, Tuple[str, ...]]]:
+    representations = poser.rotation.representations
+    return [
+        (
+            poser.rotation.converter.Converter,
+            tuple(
+                name for name, value
+                in vars(poser.rotation.converter.Converter).items()
+                if isinstance(value, staticmethod)
+            ),
+        ),
+        (
+            poser.Rotation,
+            CONSTRUCTORS + TRANSFORMS + (
+                "_update_from_quaternion",
+                "_update_from_matrix",
+                "_update_from_opk_deg",
+            ),
+        ),
+        (poser.Point, CONSTRUCTORS),
+        (poser.Translation, CONSTRUCTORS + TRANSFORMS),
+        (poser.Pose, CONSTRUCTORS + TRANSFORMS),
+        (representations.Matrix, CONSTRUCTORS + TRANSFORMS),
+        (representations.Quaternion, CONSTRUCTORS),
+        (representations.OPKDeg, CONSTRUCTORS),
+        (
+            poser.PointArray,
+            CONSTRUCTORS + (
+                "_transform",
+                "_transformed",
+                "_transformed_into",
+                "_affine",
+            ),
+        ),
+        (poser.RotationArray, CONSTRUCTORS),
+        (poser.PoseArray, CONSTRUCTORS + TRANSFORMS),
+    ]
+
+
+OWNER = __name__
+
+patching = poser.patching
+
+_lock = Lock()
+_counters = {}
+
+
+def enable() -> None:
+    with _lock:
+        if patching.installed(owner=OWNER):
+            return
+        for cls, names in _targets():
+            for name in names:
+                if name not in vars(cls):
+                    continue
+                patching.install(
+                    cls=cls,
+                    name=name,
+                    owner=OWNER,
+                    wrap=partial(
+                        _instrumented, name=f"{cls.__name__}.{name}",
+                    ),
+                )
+
+
+def disable() -> None:
+    with _lock:
+        patching.uninstall(owner=OWNER)
+
+
+def is_enabled() -> bool:
+    return patching.installed(owner=OWNER)
+
+
+def reset() -> None:
+    with _lock:
+        for entry in _counters.values():
+            entry[0] = 0
+            entry[1] = 0.0
+
+
+def snapshot() -> Dict[str, Dict[str, float]]:
+    with _lock:
+        return {
+            name: {"calls": calls, "seconds": seconds}
+            for name, (calls, seconds) in sorted(_counters.items())
+            if calls
+        }
+
+
+def to_json(
+    indent: int = 2,
+) -> str:
+    return json.dumps(snapshot(), indent=indent)
+
+
+@contextmanager
+def instrumented(
+    clear: bool = True,
+) -> Iterator[Callable[[], Dict[str, Dict[str, float]]]]:
+    if clear:
+        reset()
+    enabled = is_enabled()
+    enable()
+    try:
+        yield snapshot
+    finally:
+        if not enabled:
+            disable()
+
+
+def _instrumented(
+    attribute: object,
+    name: str,
+) -> object:
+    if isinstance(attribute, (staticmethod, classmethod)):
+        return type(attribute)(
+            _timed(name=name, function=attribute.__func__)
+        )
+    return _timed(name=name, function=attribute)
+
+
+def _timed(
+    name: str,
+    function: Callable,
+) -> Callable:
+    entry = _counters.setdefault(name, [0, 0.0])
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = perf_counter() - start
+            with _lock:
+                entry[0] += 1
+                entry[1] += elapsed
+
+    return wrapper
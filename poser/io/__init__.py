@@ -0,0 +1,3 @@
+from .point_file import transform_point_file
+from .pose_file import PoseFile
+from .opk_file import read_opk_file, iter_opk_file, write_opk_file
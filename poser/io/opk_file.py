@@ -0,0 +1,227 @@
+from array import array
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+import math
+
+import poser.buffers
+import poser.pose_array
+import poser.rotation.converter
+
+
+Pose = poser.pose.Pose
+PoseArray = poser.pose_array.PoseArray
+PointArray = poser.point_array.PointArray
+RotationArray = poser.rotation.rotation_array.RotationArray
+Converter = poser.rotation.converter.Converter
+
+as_float_buffer = poser.buffers.as_float_buffer
+
+
+OPK_COLUMNS = ("id", "x", "y", "z", "omega", "phi", "kappa")
+ANGLE_UNITS = {
+    "deg": 1.0,
+    "rad": 180.0 / math.pi,
+    "gon": 0.9,
+}
+
+
+def read_opk_file(
+    path: str,
+    columns: Sequence[Optional[str]] = OPK_COLUMNS,
+    delimiter: Optional[str] = None,
+    angle_unit: str = "deg",
+    skip_rows: int = 0,
+    comment: Optional[str] = "#",
+) -> Tuple[Optional[List[str]], PoseArray]:
+    layout = _layout(columns=columns)
+    scale = _scale(angle_unit=angle_unit)
+    with open(path, "r") as file:
+        return _parse(
+            lines=enumerate(islice(file, skip_rows, None), skip_rows + 1),
+            layout=layout,
+            delimiter=delimiter,
+            comment=comment,
+            scale=scale,
+        )
+
+
+def iter_opk_file(
+    path: str,
+    chunk_size: int = 100_000,
+    columns: Sequence[Optional[str]] = OPK_COLUMNS,
+    delimiter: Optional[str] = None,
+    angle_unit: str = "deg",
+    skip_rows: int = 0,
+    comment: Optional[str] = "#",
+) -> Iterator[Tuple[Optional[List[str]], PoseArray]]:
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive.")
+    layout = _layout(columns=columns)
+    scale = _scale(angle_unit=angle_unit)
+    return _iter_opk_file(
+        path=path,
+        chunk_size=chunk_size,
+        layout=layout,
+        delimiter=delimiter,
+        scale=scale,
+        skip_rows=skip_rows,
+        comment=comment,
+    )
+
+
+def write_opk_file(
+    path: str,
+    poses: Union[PoseArray, Iterable[Pose]],
+    ids: Optional[Iterable] = None,
+    columns: Sequence[Optional[str]] = OPK_COLUMNS,
+    delimiter: str = " ",
+    angle_unit: str = "deg",
+    precision: Optional[int] = None,
+    header: Optional[str] = None,
+) -> int:
+    _layout(columns=columns)
+    scale = _scale(angle_unit=angle_unit)
+    if not isinstance(poses, PoseArray):
+        poses = PoseArray.from_poses(poses=poses)
+    count = len(poses)
+    ids = [str(i) for i in (range(count) if ids is None else ids)]
+    if len(ids) != count:
+        raise ValueError(
+            f"ids and poses differ in length: {len(ids)} != {count}."
+        )
+    opk = as_float_buffer(values=poses.rotations.to_opk_deg())
+    if scale != 1.0:
+        opk = array("d", [value / scale for value in opk])
+    t = as_float_buffer(values=poses.translations.coordinates)
+    values = {
+        "id": ids,
+        "x": t[0::3],
+        "y": t[1::3],
+        "z": t[2::3],
+        "omega": opk[0::3],
+        "phi": opk[1::3],
+        "kappa": opk[2::3],
+    }
+    number = repr if precision is None else f"{{:.{precision}f}}".format
+    fields = [
+        ids if name == "id"
+        else [""] * count if name is None
+        else list(map(number, values[name]))
+        for name in columns
+    ]
+    with open(path, "w") as file:
+        if header is not None:
+            file.write(header.rstrip("\n") + "\n")
+        file.writelines(
+            delimiter.join(row) + "\n" for row in zip(*fields)
+        )
+    return count
+
+
+def _iter_opk_file(
+    path: str,
+    chunk_size: int,
+    layout: dict,
+    delimiter: Optional[str],
+    scale: float,
+    skip_rows: int,
+    comment: Optional[str],
+) -> Iterator[Tuple[Optional[List[str]], PoseArray]]:
+    with open(path, "r") as file:
+        lines = enumerate(islice(file, skip_rows, None), skip_rows + 1)
+        while True:
+            chunk = list(islice(lines, chunk_size))
+            if not chunk:
+                return
+            yield _parse(
+                lines=chunk,
+                layout=layout,
+                delimiter=delimiter,
+                comment=comment,
+                scale=scale,
+            )
+
+
+def _layout(
+    columns: Sequence[Optional[str]],
+) -> dict:
+    layout = {}
+    for index, name in enumerate(columns):
+        if name is None:
+            continue
+        if name not in OPK_COLUMNS:
+            raise ValueError(
+                f"column has an unsupported name: {name!r}, "
+                f"expected one of {OPK_COLUMNS} or None."
+            )
+        if name in layout:
+            raise ValueError(f"column {name!r} is given twice.")
+        layout[name] = index
+    missing = [name for name in OPK_COLUMNS[1:] if name not in layout]
+    if missing:
+        raise ValueError(f"columns are missing: {missing}.")
+    return layout
+
+
+def _scale(
+    angle_unit: str,
+) -> float:
+    if angle_unit not in ANGLE_UNITS:
+        raise ValueError(
+            f"angle_unit has an unsupported value: {angle_unit!r}, "
+            f"expected one of {tuple(ANGLE_UNITS)}."
+        )
+    return ANGLE_UNITS[angle_unit]
+
+
+def _parse(
+    lines: Iterable[Tuple[int, str]],
+    layout: dict,
+    delimiter: Optional[str],
+    comment: Optional[str],
+    scale: float,
+) -> Tuple[Optional[List[str]], PoseArray]:
+    width = max(layout.values()) + 1
+    rows = []
+    for number, line in lines:
+        line = line.strip()
+        if not line or comment and line.startswith(comment):
+            continue
+        fields = line.split(delimiter)
+        if len(fields) < width:
+            raise ValueError(
+                f"line {number} has {len(fields)} fields, "
+                f"expected at least {width}."
+            )
+        rows.append(fields)
+    table = list(zip(*rows)) if rows else [()] * width
+    count = len(rows)
+
+    def column(name: str) -> array:
+        try:
+            return array("d", map(float, table[layout[name]]))
+        except ValueError as error:
+            raise ValueError(f"column {name!r}: {error}") from None
+
+    translations = array("d", bytes(24 * count))
+    opk = array("d", bytes(24 * count))
+    for k, name in enumerate(("x", "y", "z",)):
+        translations[k::3] = column(name=name)
+    for k, name in enumerate(("omega", "phi", "kappa",)):
+        opk[k::3] = column(name=name)
+    if scale != 1.0:
+        opk = array("d", [value * scale for value in opk])
+    ids = None
+    if "id" in layout:
+        ids = [value.strip() for value in table[layout["id"]]]
+    return (
+        ids,
+        PoseArray(
+            translations=PointArray(coordinates=translations),
+            rotations=RotationArray(
+                quaternions=Converter.opk_deg_to_quaternion_batch(
+                    opk_degs=opk,
+                ),
+            ),
+        ),
+    )
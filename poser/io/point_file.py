@@ -0,0 +1,119 @@
+from typing import Optional, Tuple
+import mmap
+import os
+import shutil
+import struct
+
+import poser.point_array
+
+
+PointArray = poser.point_array.PointArray
+
+
+def transform_point_file(
+    pose: "poser.Pose",
+    path: str,
+    out_path: Optional[str] = None,
+    dtype: str = "d",
+    record_size: Optional[int] = None,
+    xyz_offset: int = 0,
+    header_size: int = 0,
+    chunk_size: int = 1_000_000,
+) -> int:
+    if dtype not in ("d", "f"):
+        raise ValueError(
+            f"dtype has an unsupported value: {dtype!r}, expected 'd' or 'f'."
+        )
+    itemsize = struct.calcsize(dtype)
+    record_size = record_size or 3 * itemsize
+    if not 0 <= xyz_offset <= record_size - 3 * itemsize:
+        raise ValueError(
+            f"xyz_offset {xyz_offset} does not fit into records of "
+            f"{record_size} bytes."
+        )
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive.")
+    if out_path is not None:
+        shutil.copyfile(path, out_path)
+        path = out_path
+    size = os.path.getsize(path) - header_size
+    if size < 0 or size % record_size:
+        raise ValueError(
+            f"{path} does not hold whole records of {record_size} bytes "
+            f"after a {header_size} byte header."
+        )
+    count = size // record_size
+    if not count:
+        return 0
+    with open(path, "r+b") as file, mmap.mmap(file.fileno(), 0) as mapped:
+        transform = (
+            _transform_aligned
+            if not record_size % itemsize and not xyz_offset % itemsize
+            else _transform_packed
+        )
+        for start in range(0, count, chunk_size):
+            transform(
+                mapped=mapped,
+                start=header_size + start * record_size,
+                count=min(chunk_size, count - start),
+                dtype=dtype,
+                record_size=record_size,
+                xyz_offset=xyz_offset,
+                rotation=pose.rotation.as_tuple,
+                translation=pose.translation.as_tuple,
+            )
+        mapped.flush()
+    return count
+
+
+def _transform_aligned(
+    mapped: mmap.mmap,
+    start: int,
+    count: int,
+    dtype: str,
+    record_size: int,
+    xyz_offset: int,
+    rotation: Tuple[Tuple[float]],
+    translation: Tuple[float],
+) -> None:
+    stop = start + count * record_size
+    itemsize = struct.calcsize(dtype)
+    with memoryview(mapped)[start:stop] as raw, raw.cast(dtype) as records:
+        with records[xyz_offset // itemsize:] as chunk:
+            PointArray._affine(
+                source=chunk,
+                target=chunk,
+                rotation=rotation,
+                translation=translation,
+                stride=record_size // itemsize,
+            )
+
+
+def _transform_packed(
+    mapped: mmap.mmap,
+    start: int,
+    count: int,
+    dtype: str,
+    record_size: int,
+    xyz_offset: int,
+    rotation: Tuple[Tuple[float]],
+    translation: Tuple[float],
+) -> None:
+    (
+        (r11, r12, r13,),
+        (r21, r22, r23,),
+        (r31, r32, r33,),
+    ) = rotation
+    (tx, ty, tz,) = translation
+    xyz = struct.Struct(f"={dtype * 3}")
+    unpack_from, pack_into = xyz.unpack_from, xyz.pack_into
+    stop = start + count * record_size
+    for offset in range(start + xyz_offset, stop, record_size):
+        x, y, z = unpack_from(mapped, offset)
+        pack_into(
+            mapped,
+            offset,
+            r11*x + r12*y + r13*z + tx,
+            r21*x + r22*y + r23*z + ty,
+            r31*x + r32*y + r33*z + tz,
+        )
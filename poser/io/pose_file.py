@@ -0,0 +1,279 @@
+from array import array
+from typing import Iterable, Optional, Tuple, Union
+import mmap
+import os
+import struct
+import sys
+
+import poser.pose_array
+import poser.trajectory
+import poser.buffers
+
+
+Pose = poser.pose.Pose
+PoseArray = poser.pose_array.PoseArray
+PointArray = poser.point_array.PointArray
+RotationArray = poser.rotation.rotation_array.RotationArray
+Translation = poser.translation.Translation
+Rotation = poser.rotation.rotation.Rotation
+Quaternion = poser.rotation.representations.Quaternion
+Trajectory = poser.trajectory.Trajectory
+
+as_float_buffer = poser.buffers.as_float_buffer
+as_float_array = poser.buffers.as_float_array
+np = poser.buffers.np
+FloatArray = poser.buffers.FloatArray
+
+
+MAGIC = b"POSEFILE"
+VERSION = 1
+HEADER = struct.Struct("<8sII")
+RECORD = struct.Struct("<dq7d")
+RECORD_VALUES = RECORD.size // 8
+RECORD_DTYPE = None if np is None else np.dtype(
+    [
+        ("timestamp", "<f8"),
+        ("id", "<q"),
+        ("translation", "<f8", (3,)),
+        ("quaternion", "<f8", (4,)),
+    ]
+)
+
+
+class PoseFile(object):
+    def __init__(
+        self,
+        path: str,
+        writable: bool = False,
+    ) -> None:
+        self.path = path
+        self.writable = writable
+        self._file = open(path, "r+b" if writable else "rb")
+        self._mapped = None
+        header = self._file.read(HEADER.size)
+        if len(header) != HEADER.size:
+            self._file.close()
+            raise ValueError(f"{path} is too short for a pose file header.")
+        (magic, version, record_size,) = HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+            self._file.close()
+            raise ValueError(
+                f"{path} is not a version {VERSION} pose file."
+            )
+        size = os.fstat(self._file.fileno()).st_size - HEADER.size
+        if size % RECORD.size:
+            self._file.close()
+            raise ValueError(f"{path} ends with a truncated record.")
+        self._length = size // RECORD.size
+
+    @classmethod
+    def create(
+        cls,
+        path: str,
+    ) -> "PoseFile":
+        with open(path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+        return cls(path=path, writable=True)
+
+    def __enter__(self) -> "PoseFile":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(
+        self,
+        index: Union[int, slice],
+    ) -> Union[Pose, PoseArray]:
+        if isinstance(index, slice):
+            (start, stop, step,) = index.indices(self._length)
+            if step != 1:
+                raise ValueError("PoseFile slices do not support steps.")
+            return self.read(start=start, stop=stop)[2]
+        return self.record(index=index)[2]
+
+    def record(
+        self,
+        index: int,
+    ) -> Tuple[float, int, Pose]:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("PoseFile index out of range.")
+        (
+            timestamp, identifier, tx, ty, tz, qw, qx, qy, qz,
+        ) = RECORD.unpack_from(
+            self._map(),
+            HEADER.size + index * RECORD.size,
+        )
+        return (
+            timestamp,
+            identifier,
+            Pose(
+                translation=Translation._unchecked(tx, ty, tz),
+                rotation=Rotation(
+                    rotation=Quaternion._unchecked(qw, qx, qy, qz),
+                ),
+            ),
+        )
+
+    def read(
+        self,
+        start: int = 0,
+        stop: Optional[int] = None,
+        copy: bool = False,
+    ) -> Tuple[FloatArray, Union[array, "np.ndarray"], PoseArray]:
+        stop = self._length if stop is None else min(stop, self._length)
+        start = min(max(start, 0), stop)
+        count = stop - start
+        if np is not None:
+            return self._read_numpy(start=start, count=count, copy=copy)
+        values = array("d")
+        identifiers = array("q")
+        if count:
+            with memoryview(self._map()) as view:
+                records = view[
+                    HEADER.size + start * RECORD.size:
+                    HEADER.size + stop * RECORD.size
+                ]
+                values.frombytes(records)
+                with records.cast("q") as fields:
+                    identifiers.extend(fields[1::RECORD_VALUES])
+                records.release()
+        if sys.byteorder != "little":
+            values.byteswap()
+            identifiers.byteswap()
+        translations = array("d", bytes(24 * count))
+        quaternions = array("d", bytes(32 * count))
+        for k in range(3):
+            translations[k::3] = values[2 + k::RECORD_VALUES]
+        for k in range(4):
+            quaternions[k::4] = values[5 + k::RECORD_VALUES]
+        return (
+            values[0::RECORD_VALUES],
+            identifiers,
+            PoseArray(
+                translations=PointArray(coordinates=translations),
+                rotations=RotationArray(quaternions=quaternions),
+            ),
+        )
+
+    def _read_numpy(
+        self,
+        start: int,
+        count: int,
+        copy: bool,
+    ) -> Tuple["np.ndarray", "np.ndarray", PoseArray]:
+        if count:
+            records = np.frombuffer(
+                self._map(),
+                dtype=RECORD_DTYPE,
+                count=count,
+                offset=HEADER.size + start * RECORD.size,
+            )
+        else:
+            records = np.empty(0, dtype=RECORD_DTYPE)
+        fields = (
+            records["timestamp"],
+            records["id"],
+            records["translation"],
+            records["quaternion"],
+        )
+        if copy:
+            fields = [np.ascontiguousarray(field) for field in fields]
+        (timestamps, identifiers, translations, quaternions,) = fields
+        return (
+            timestamps,
+            identifiers,
+            PoseArray(
+                translations=PointArray(coordinates=translations),
+                rotations=RotationArray(quaternions=quaternions),
+            ),
+        )
+
+    def trajectory(
+        self,
+        start: int = 0,
+        stop: Optional[int] = None,
+        out_of_range: str = "raise",
+    ) -> Trajectory:
+        (timestamps, _, poses,) = self.read(start=start, stop=stop)
+        return Trajectory(
+            timestamps=as_float_array(values=timestamps),
+            poses=poses,
+            out_of_range=out_of_range,
+        )
+
+    def append(
+        self,
+        timestamps: Iterable[float],
+        poses: Union[PoseArray, Iterable[Pose]],
+        ids: Optional[Iterable[int]] = None,
+    ) -> None:
+        if not self.writable:
+            raise ValueError(f"{self.path} is not opened for writing.")
+        if not isinstance(poses, PoseArray):
+            poses = PoseArray.from_poses(poses=poses)
+        count = len(poses)
+        timestamps = as_float_buffer(values=timestamps)
+        ids = array(
+            "q",
+            range(self._length, self._length + count) if ids is None else ids,
+        )
+        if not len(timestamps) == len(ids) == count:
+            raise ValueError(
+                f"timestamps, ids and poses differ in length: "
+                f"{len(timestamps)}, {len(ids)}, {count}."
+            )
+        if np is not None:
+            records = np.empty(count, dtype=RECORD_DTYPE)
+            records["timestamp"] = as_float_array(values=timestamps)
+            records["id"] = ids
+            records["translation"] = poses.translations.xyz
+            records["quaternion"] = poses.rotations.wxyz
+            data = records.tobytes()
+        else:
+            values = array("d", bytes(RECORD.size * count))
+            values[0::RECORD_VALUES] = array("d", timestamps)
+            with memoryview(values).cast("B").cast("q") as fields:
+                fields[1::RECORD_VALUES] = ids
+            t = poses.translations.coordinates
+            q = poses.rotations.quaternions
+            for k in range(3):
+                values[2 + k::RECORD_VALUES] = array("d", t[k::3])
+            for k in range(4):
+                values[5 + k::RECORD_VALUES] = array("d", q[k::4])
+            if sys.byteorder != "little":
+                values.byteswap()
+            data = values.tobytes()
+        self._unmap()
+        self._file.seek(0, os.SEEK_END)
+        self._file.write(data)
+        self._file.flush()
+        self._length += count
+
+    def close(self) -> None:
+        self._unmap()
+        self._file.close()
+
+    def _map(self) -> mmap.mmap:
+        if self._mapped is None:
+            self._mapped = mmap.mmap(
+                self._file.fileno(),
+                0,
+                access=mmap.ACCESS_READ,
+            )
+        return self._mapped
+
+    def _unmap(self) -> None:
+        if self._mapped is not None:
+            try:
+                self._mapped.close()
+            except BufferError:
+                # Zero-copy views from read() still reference the map; it is
+                # closed once they are released.
+                pass
+            self._mapped = None
@@ -0,0 +1,723 @@
+from array import array
+from typing import Iterable, Sequence, Tuple, Union
+import math
+
+import poser.buffers
+
+
+as_float_buffer = poser.buffers.as_float_buffer
+as_float_array = poser.buffers.as_float_array
+np = poser.buffers.np
+FloatArray = poser.buffers.FloatArray
+
+SMALL_ANGLE = 0.1
+TINY_ANGLE = 1e-4
+
+Buffer = Union[array, memoryview, Iterable[float]]
+Rows = Tuple[Tuple[float, ...], ...]
+Vector = Tuple[float, float, float]
+
+
+def so3_exp(
+    vector: Sequence[float],
+) -> Tuple[float, float, float, float]:
+    (x, y, z,) = vector
+    return _exp(x, y, z)
+
+
+def so3_log(
+    quaternion: Sequence[float],
+) -> Tuple[float, float, float]:
+    (w, x, y, z,) = quaternion
+    return _log(w, x, y, z)
+
+
+def so3_adjoint(
+    quaternion: Sequence[float],
+) -> Rows:
+    (w, x, y, z,) = quaternion
+    return _rows(values=_matrix(w, x, y, z), size=3)
+
+
+def so3_left_jacobian(
+    vector: Sequence[float],
+    inverse: bool = False,
+) -> Rows:
+    (x, y, z,) = vector
+    return _rows(values=_jacobian(x, y, z, inverse), size=3)
+
+
+def so3_right_jacobian(
+    vector: Sequence[float],
+    inverse: bool = False,
+) -> Rows:
+    (x, y, z,) = vector
+    return _rows(values=_jacobian(-x, -y, -z, inverse), size=3)
+
+
+def se3_exp(
+    twist: Sequence[float],
+) -> Tuple[Tuple[float, float, float], Tuple[float, float, float, float]]:
+    (rho, phi,) = _split(twist=twist)
+    return (
+        _apply(_jacobian(*phi, False), *rho),
+        _exp(*phi),
+    )
+
+
+def se3_log(
+    translation: Sequence[float],
+    quaternion: Sequence[float],
+) -> Tuple[float, float, float, float, float, float]:
+    (tx, ty, tz,) = translation
+    (w, x, y, z,) = quaternion
+    phi = _log(w, x, y, z)
+    return _apply(_jacobian(*phi, True), tx, ty, tz) + phi
+
+
+def se3_adjoint(
+    translation: Sequence[float],
+    quaternion: Sequence[float],
+) -> Rows:
+    (tx, ty, tz,) = translation
+    (w, x, y, z,) = quaternion
+    return _rows(values=_adjoint(tx, ty, tz, w, x, y, z), size=6)
+
+
+def se3_left_jacobian(
+    twist: Sequence[float],
+    inverse: bool = False,
+) -> Rows:
+    (rho, phi,) = _split(twist=twist)
+    return _rows(
+        values=_se3_jacobian(rho=rho, phi=phi, inverse=inverse),
+        size=6,
+    )
+
+
+def se3_right_jacobian(
+    twist: Sequence[float],
+    inverse: bool = False,
+) -> Rows:
+    (rho, phi,) = _split(twist=twist)
+    return _rows(
+        values=_se3_jacobian(
+            rho=_negated(vector=rho),
+            phi=_negated(vector=phi),
+            inverse=inverse,
+        ),
+        size=6,
+    )
+
+
+def so3_exp_batch(
+    vectors: Buffer,
+) -> FloatArray:
+    v = _checked(values=vectors, width=3, name="vectors")
+    if np is not None:
+        return _exp_numpy(phi=v.reshape(-1, 3)).reshape(-1)
+    quaternions = array("d")
+    for i in range(0, len(v), 3):
+        quaternions.extend(_exp(v[i], v[i + 1], v[i + 2]))
+    return quaternions
+
+
+def so3_log_batch(
+    quaternions: Buffer,
+) -> FloatArray:
+    q = _checked(values=quaternions, width=4, name="quaternions")
+    if np is not None:
+        return _log_numpy(q=q.reshape(-1, 4)).reshape(-1)
+    vectors = array("d")
+    for i in range(0, len(q), 4):
+        vectors.extend(_log(q[i], q[i + 1], q[i + 2], q[i + 3]))
+    return vectors
+
+
+def so3_left_jacobian_batch(
+    vectors: Buffer,
+    inverse: bool = False,
+) -> FloatArray:
+    v = _checked(values=vectors, width=3, name="vectors")
+    if np is not None:
+        return _jacobian_numpy(
+            phi=v.reshape(-1, 3),
+            inverse=inverse,
+        ).reshape(-1)
+    jacobians = array("d")
+    for i in range(0, len(v), 3):
+        jacobians.extend(_jacobian(v[i], v[i + 1], v[i + 2], inverse))
+    return jacobians
+
+
+def so3_right_jacobian_batch(
+    vectors: Buffer,
+    inverse: bool = False,
+) -> FloatArray:
+    v = _checked(values=vectors, width=3, name="vectors")
+    if np is not None:
+        return _jacobian_numpy(
+            phi=-v.reshape(-1, 3),
+            inverse=inverse,
+        ).reshape(-1)
+    jacobians = array("d")
+    for i in range(0, len(v), 3):
+        jacobians.extend(_jacobian(-v[i], -v[i + 1], -v[i + 2], inverse))
+    return jacobians
+
+
+def se3_exp_batch(
+    twists: Buffer,
+) -> Tuple[FloatArray, FloatArray]:
+    v = _checked(values=twists, width=6, name="twists")
+    if np is not None:
+        v = v.reshape(-1, 6)
+        (rho, phi,) = (v[:, :3], v[:, 3:],)
+        return (
+            _apply_numpy(
+                m=_jacobian_numpy(phi=phi, inverse=False),
+                v=rho,
+            ).reshape(-1),
+            _exp_numpy(phi=phi).reshape(-1),
+        )
+    translations = array("d")
+    quaternions = array("d")
+    for i in range(0, len(v), 6):
+        (rho, phi,) = _split(twist=v[i:i + 6])
+        translations.extend(_apply(_jacobian(*phi, False), *rho))
+        quaternions.extend(_exp(*phi))
+    return (translations, quaternions)
+
+
+def se3_log_batch(
+    translations: Buffer,
+    quaternions: Buffer,
+) -> FloatArray:
+    (t, q,) = _checked_pair(translations=translations, quaternions=quaternions)
+    if np is not None:
+        phi = _log_numpy(q=q.reshape(-1, 4))
+        rho = _apply_numpy(
+            m=_jacobian_numpy(phi=phi, inverse=True),
+            v=t.reshape(-1, 3),
+        )
+        return np.concatenate((rho, phi,), axis=1).reshape(-1)
+    twists = array("d")
+    for i, j in zip(range(0, len(t), 3), range(0, len(q), 4)):
+        phi = _log(q[j], q[j + 1], q[j + 2], q[j + 3])
+        twists.extend(
+            _apply(_jacobian(*phi, True), t[i], t[i + 1], t[i + 2])
+        )
+        twists.extend(phi)
+    return twists
+
+
+def se3_adjoint_batch(
+    translations: Buffer,
+    quaternions: Buffer,
+) -> FloatArray:
+    (t, q,) = _checked_pair(translations=translations, quaternions=quaternions)
+    if np is not None:
+        r = _matrix_numpy(q=q.reshape(-1, 4))
+        return _blocks_numpy(
+            a=r,
+            b=_multiply_numpy(m1=_hat_numpy(v=t.reshape(-1, 3)), m2=r),
+            d=r,
+        )
+    adjoints = array("d")
+    for i, j in zip(range(0, len(t), 3), range(0, len(q), 4)):
+        adjoints.extend(
+            _adjoint(
+                t[i], t[i + 1], t[i + 2],
+                q[j], q[j + 1], q[j + 2], q[j + 3],
+            )
+        )
+    return adjoints
+
+
+def se3_left_jacobian_batch(
+    twists: Buffer,
+    inverse: bool = False,
+) -> FloatArray:
+    v = _checked(values=twists, width=6, name="twists")
+    if np is not None:
+        v = v.reshape(-1, 6)
+        return _se3_jacobian_numpy(
+            rho=v[:, :3],
+            phi=v[:, 3:],
+            inverse=inverse,
+        )
+    jacobians = array("d")
+    for i in range(0, len(v), 6):
+        (rho, phi,) = _split(twist=v[i:i + 6])
+        jacobians.extend(_se3_jacobian(rho=rho, phi=phi, inverse=inverse))
+    return jacobians
+
+
+def se3_right_jacobian_batch(
+    twists: Buffer,
+    inverse: bool = False,
+) -> FloatArray:
+    v = _checked(values=twists, width=6, name="twists")
+    if np is not None:
+        v = -v.reshape(-1, 6)
+        return _se3_jacobian_numpy(
+            rho=v[:, :3],
+            phi=v[:, 3:],
+            inverse=inverse,
+        )
+    jacobians = array("d")
+    for i in range(0, len(v), 6):
+        (rho, phi,) = _split(twist=v[i:i + 6])
+        jacobians.extend(
+            _se3_jacobian(
+                rho=_negated(vector=rho),
+                phi=_negated(vector=phi),
+                inverse=inverse,
+            )
+        )
+    return jacobians
+
+
+def _checked(
+    values: Buffer,
+    width: int,
+    name: str,
+) -> Union[array, memoryview, FloatArray]:
+    if np is not None:
+        values = as_float_array(values=values)
+    else:
+        values = as_float_buffer(values=values)
+    if len(values) % width:
+        raise ValueError(f"{name} length is not a multiple of {width}.")
+    return values
+
+
+def _checked_pair(
+    translations: Buffer,
+    quaternions: Buffer,
+) -> Tuple[
+    Union[array, memoryview, FloatArray],
+    Union[array, memoryview, FloatArray],
+]:
+    t = _checked(values=translations, width=3, name="translations")
+    q = _checked(values=quaternions, width=4, name="quaternions")
+    if len(t) // 3 != len(q) // 4:
+        raise ValueError(
+            f"translations and quaternions differ in length: "
+            f"{len(t) // 3} != {len(q) // 4}."
+        )
+    return (t, q)
+
+
+def _split(
+    twist: Sequence[float],
+) -> Tuple[Vector, Vector]:
+    (rho_x, rho_y, rho_z, phi_x, phi_y, phi_z,) = twist
+    return ((rho_x, rho_y, rho_z,), (phi_x, phi_y, phi_z,))
+
+
+def _negated(
+    vector: Vector,
+) -> Vector:
+    (x, y, z,) = vector
+    return (-x, -y, -z,)
+
+
+def _rows(
+    values: Tuple[float, ...],
+    size: int,
+) -> Rows:
+    return tuple(
+        tuple(values[i:i + size]) for i in range(0, size * size, size)
+    )
+
+
+def _exp(
+    x: float,
+    y: float,
+    z: float,
+) -> Tuple[float, float, float, float]:
+    t = x*x + y*y + z*z
+    theta = t**0.5
+    if theta < TINY_ANGLE:
+        s = 0.5 - t/48.0
+    else:
+        s = math.sin(0.5*theta) / theta
+    return (math.cos(0.5*theta), s*x, s*y, s*z,)
+
+
+def _log(
+    w: float,
+    x: float,
+    y: float,
+    z: float,
+) -> Tuple[float, float, float]:
+    if w < 0.0:
+        w, x, y, z = -w, -x, -y, -z
+    s = (x*x + y*y + z*z)**0.5
+    if s < TINY_ANGLE * w:
+        r = s / w
+        f = 2.0 * (1.0 - r*r/3.0) / w
+    elif s == 0.0:
+        raise ValueError("cannot take the log of a zero quaternion.")
+    else:
+        f = 2.0 * math.atan2(s, w) / s
+    return (f*x, f*y, f*z,)
+
+
+def _matrix(
+    w: float,
+    x: float,
+    y: float,
+    z: float,
+) -> Tuple[float, ...]:
+    norm = w*w + x*x + y*y + z*z
+    if norm == 0.0:
+        raise ValueError("cannot build a rotation from a zero quaternion.")
+    k = 2.0 / norm
+    wx, wy, wz = k*w*x, k*w*y, k*w*z
+    xx, xy, xz = k*x*x, k*x*y, k*x*z
+    yy, yz, zz = k*y*y, k*y*z, k*z*z
+    return (
+        1.0 - yy - zz, xy - wz, xz + wy,
+        xy + wz, 1.0 - xx - zz, yz - wx,
+        xz - wy, yz + wx, 1.0 - xx - yy,
+    )
+
+
+def _jacobian(
+    x: float,
+    y: float,
+    z: float,
+    inverse: bool,
+) -> Tuple[float, ...]:
+    t = x*x + y*y + z*z
+    small = t < SMALL_ANGLE * SMALL_ANGLE
+    if inverse:
+        a = -0.5
+        if small:
+            b = 1/12 + t*(1/720 + t*(1/30240 + t/1209600))
+        else:
+            half = 0.5 * t**0.5
+            b = (1.0 - half * math.cos(half) / math.sin(half)) / t
+    elif small:
+        a = 0.5 + t*(-1/24 + t*(1/720 - t/40320))
+        b = 1/6 + t*(-1/120 + t*(1/5040 - t/362880))
+    else:
+        theta = t**0.5
+        a = (1.0 - math.cos(theta)) / t
+        b = (theta - math.sin(theta)) / (t * theta)
+    return (
+        1.0 + b*(x*x - t), -a*z + b*x*y, a*y + b*x*z,
+        a*z + b*x*y, 1.0 + b*(y*y - t), -a*x + b*y*z,
+        -a*y + b*x*z, a*x + b*y*z, 1.0 + b*(z*z - t),
+    )
+
+
+def _se3_jacobian(
+    rho: Vector,
+    phi: Vector,
+    inverse: bool,
+) -> Tuple[float, ...]:
+    q = _coupling(rho=rho, phi=phi)
+    if not inverse:
+        j = _jacobian(*phi, False)
+        return _blocks(a=j, b=q, d=j)
+    j = _jacobian(*phi, True)
+    return _blocks(
+        a=j,
+        b=tuple(-value for value in _multiply(_multiply(j, q), j)),
+        d=j,
+    )
+
+
+def _coupling(
+    rho: Vector,
+    phi: Vector,
+) -> Tuple[float, ...]:
+    (x, y, z,) = phi
+    t = x*x + y*y + z*z
+    if t < SMALL_ANGLE * SMALL_ANGLE:
+        c = 1/6 + t*(-1/120 + t*(1/5040 - t/362880))
+        e = 1/24 + t*(-1/720 + t*(1/40320 - t/3628800))
+        f = 1/120 + t*(-1/2520 + t*(1/120960 - t/9979200))
+    else:
+        theta = t**0.5
+        sin, cos = math.sin(theta), math.cos(theta)
+        c = (theta - sin) / (t * theta)
+        e = (t + 2.0*cos - 2.0) / (2.0 * t * t)
+        f = (2.0*theta - 3.0*sin + theta*cos) / (2.0 * t * t * theta)
+    p = _hat(x, y, z)
+    r = _hat(*rho)
+    pr = _multiply(p, r)
+    rp = _multiply(r, p)
+    prp = _multiply(pr, p)
+    ppr = _multiply(p, pr)
+    rpp = _multiply(rp, p)
+    prpp = _multiply(prp, p)
+    pprp = _multiply(p, prp)
+    return tuple(
+        0.5*r[i]
+        + c*(pr[i] + rp[i] + prp[i])
+        + e*(ppr[i] + rpp[i] - 3.0*prp[i])
+        + f*(prpp[i] + pprp[i])
+        for i in range(9)
+    )
+
+
+def _adjoint(
+    tx: float,
+    ty: float,
+    tz: float,
+    w: float,
+    x: float,
+    y: float,
+    z: float,
+) -> Tuple[float, ...]:
+    r = _matrix(w, x, y, z)
+    return _blocks(a=r, b=_multiply(_hat(tx, ty, tz), r), d=r)
+
+
+def _blocks(
+    a: Tuple[float, ...],
+    b: Tuple[float, ...],
+    d: Tuple[float, ...],
+) -> Tuple[float, ...]:
+    zeros = (0.0, 0.0, 0.0,)
+    return (
+        a[0:3] + b[0:3] + a[3:6] + b[3:6] + a[6:9] + b[6:9]
+        + zeros + d[0:3] + zeros + d[3:6] + zeros + d[6:9]
+    )
+
+
+def _hat(
+    x: float,
+    y: float,
+    z: float,
+) -> Tuple[float, ...]:
+    return (
+        0.0, -z, y,
+        z, 0.0, -x,
+        -y, x, 0.0,
+    )
+
+
+def _multiply(
+    m1: Tuple[float, ...],
+    m2: Tuple[float, ...],
+) -> Tuple[float, ...]:
+    return tuple(
+        m1[i]*m2[j] + m1[i + 1]*m2[j + 3] + m1[i + 2]*m2[j + 6]
+        for i in (0, 3, 6) for j in (0, 1, 2)
+    )
+
+
+def _apply(
+    m: Tuple[float, ...],
+    x: float,
+    y: float,
+    z: float,
+) -> Tuple[float, float, float]:
+    return (
+        m[0]*x + m[1]*y + m[2]*z,
+        m[3]*x + m[4]*y + m[5]*z,
+        m[6]*x + m[7]*y + m[8]*z,
+    )
+
+
+def _exp_numpy(
+    phi: "np.ndarray",
+) -> "np.ndarray":
+    t = np.einsum("ij,ij->i", phi, phi)
+    theta = np.sqrt(t)
+    tiny = theta < TINY_ANGLE
+    s = np.where(
+        tiny,
+        0.5 - t/48.0,
+        np.sin(0.5*theta) / np.where(tiny, 1.0, theta),
+    )
+    quaternions = np.empty((len(phi), 4))
+    quaternions[:, 0] = np.cos(0.5*theta)
+    quaternions[:, 1:] = s[:, None] * phi
+    return quaternions
+
+
+def _log_numpy(
+    q: "np.ndarray",
+) -> "np.ndarray":
+    q = np.where(q[:, :1] < 0.0, -q, q)
+    w = q[:, 0]
+    v = q[:, 1:]
+    s = np.sqrt(np.einsum("ij,ij->i", v, v))
+    tiny = s < TINY_ANGLE * w
+    if np.any(~tiny & (s == 0.0)):
+        raise ValueError("cannot take the log of a zero quaternion.")
+    w_tiny = np.where(tiny, w, 1.0)
+    r = s / w_tiny
+    f = np.where(
+        tiny,
+        2.0 * (1.0 - r*r/3.0) / w_tiny,
+        2.0 * np.arctan2(s, w) / np.where(tiny, 1.0, s),
+    )
+    return f[:, None] * v
+
+
+def _matrix_numpy(
+    q: "np.ndarray",
+) -> "np.ndarray":
+    (w, x, y, z,) = q.T
+    norm = w*w + x*x + y*y + z*z
+    if np.any(norm == 0.0):
+        raise ValueError("cannot build a rotation from a zero quaternion.")
+    k = 2.0 / norm
+    wx, wy, wz = k*w*x, k*w*y, k*w*z
+    xx, xy, xz = k*x*x, k*x*y, k*x*z
+    yy, yz, zz = k*y*y, k*y*z, k*z*z
+    return np.stack(
+        (
+            1.0 - yy - zz, xy - wz, xz + wy,
+            xy + wz, 1.0 - xx - zz, yz - wx,
+            xz - wy, yz + wx, 1.0 - xx - yy,
+        ),
+        axis=1,
+    ).reshape(-1, 3, 3)
+
+
+def _jacobian_numpy(
+    phi: "np.ndarray",
+    inverse: bool,
+) -> "np.ndarray":
+    (x, y, z,) = phi.T
+    t = x*x + y*y + z*z
+    small = t < SMALL_ANGLE * SMALL_ANGLE
+    large = np.where(small, 1.0, t)
+    if inverse:
+        a = np.full(len(t), -0.5)
+        half = 0.5 * np.sqrt(large)
+        b = np.where(
+            small,
+            1/12 + t*(1/720 + t*(1/30240 + t/1209600)),
+            (1.0 - half * np.cos(half) / np.sin(half)) / large,
+        )
+    else:
+        theta = np.sqrt(large)
+        a = np.where(
+            small,
+            0.5 + t*(-1/24 + t*(1/720 - t/40320)),
+            (1.0 - np.cos(theta)) / large,
+        )
+        b = np.where(
+            small,
+            1/6 + t*(-1/120 + t*(1/5040 - t/362880)),
+            (theta - np.sin(theta)) / (large * theta),
+        )
+    return np.stack(
+        (
+            1.0 + b*(x*x - t), -a*z + b*x*y, a*y + b*x*z,
+            a*z + b*x*y, 1.0 + b*(y*y - t), -a*x + b*y*z,
+            -a*y + b*x*z, a*x + b*y*z, 1.0 + b*(z*z - t),
+        ),
+        axis=1,
+    ).reshape(-1, 3, 3)
+
+
+def _se3_jacobian_numpy(
+    rho: "np.ndarray",
+    phi: "np.ndarray",
+    inverse: bool,
+) -> "np.ndarray":
+    q = _coupling_numpy(rho=rho, phi=phi)
+    j = _jacobian_numpy(phi=phi, inverse=inverse)
+    if inverse:
+        q = -_multiply_numpy(m1=_multiply_numpy(m1=j, m2=q), m2=j)
+    return _blocks_numpy(a=j, b=q, d=j)
+
+
+def _coupling_numpy(
+    rho: "np.ndarray",
+    phi: "np.ndarray",
+) -> "np.ndarray":
+    t = np.einsum("ij,ij->i", phi, phi)
+    small = t < SMALL_ANGLE * SMALL_ANGLE
+    large = np.where(small, 1.0, t)
+    theta = np.sqrt(large)
+    sin, cos = np.sin(theta), np.cos(theta)
+    c = np.where(
+        small,
+        1/6 + t*(-1/120 + t*(1/5040 - t/362880)),
+        (theta - sin) / (large * theta),
+    )[:, None, None]
+    e = np.where(
+        small,
+        1/24 + t*(-1/720 + t*(1/40320 - t/3628800)),
+        (large + 2.0*cos - 2.0) / (2.0 * large * large),
+    )[:, None, None]
+    f = np.where(
+        small,
+        1/120 + t*(-1/2520 + t*(1/120960 - t/9979200)),
+        (2.0*theta - 3.0*sin + theta*cos) / (2.0 * large * large * theta),
+    )[:, None, None]
+    p = _hat_numpy(v=phi)
+    r = _hat_numpy(v=rho)
+    pr = _multiply_numpy(m1=p, m2=r)
+    rp = _multiply_numpy(m1=r, m2=p)
+    prp = _multiply_numpy(m1=pr, m2=p)
+    ppr = _multiply_numpy(m1=p, m2=pr)
+    rpp = _multiply_numpy(m1=rp, m2=p)
+    prpp = _multiply_numpy(m1=prp, m2=p)
+    pprp = _multiply_numpy(m1=p, m2=prp)
+    return (
+        0.5*r
+        + c*(pr + rp + prp)
+        + e*(ppr + rpp - 3.0*prp)
+        + f*(prpp + pprp)
+    )
+
+
+def _blocks_numpy(
+    a: "np.ndarray",
+    b: "np.ndarray",
+    d: "np.ndarray",
+) -> "np.ndarray":
+    blocks = np.zeros((len(a), 6, 6))
+    blocks[:, :3, :3] = a
+    blocks[:, :3, 3:] = b
+    blocks[:, 3:, 3:] = d
+    return blocks.reshape(-1)
+
+
+def _hat_numpy(
+    v: "np.ndarray",
+) -> "np.ndarray":
+    (x, y, z,) = v.T
+    zeros = np.zeros(len(v))
+    return np.stack(
+        (
+            zeros, -z, y,
+            z, zeros, -x,
+            -y, x, zeros,
+        ),
+        axis=1,
+    ).reshape(-1, 3, 3)
+
+
+def _multiply_numpy(
+    m1: "np.ndarray",
+    m2: "np.ndarray",
+) -> "np.ndarray":
+    return (
+        m1[:, :, 0, None]*m2[:, None, 0, :]
+        + m1[:, :, 1, None]*m2[:, None, 1, :]
+        + m1[:, :, 2, None]*m2[:, None, 2, :]
+    )
+
+
+def _apply_numpy(
+    m: "np.ndarray",
+    v: "np.ndarray",
+) -> "np.ndarray":
+    return (
+        m[:, :, 0]*v[:, 0, None]
+        + m[:, :, 1]*v[:, 1, None]
+        + m[:, :, 2]*v[:, 2, None]
+    )
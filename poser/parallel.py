@@ -0,0 +1,185 @@
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Tuple, Union, Iterable, Optional
+import os
+
+import poser.buffers
+import poser.point_array
+
+
+PointArray = poser.point_array.PointArray
+
+as_float_buffer = poser.buffers.as_float_buffer
+as_float_array = poser.buffers.as_float_array
+
+
+class SharedPointArray(PointArray):
+    def __init__(
+        self,
+        coordinates: Optional[Union[array, memoryview, Iterable[float]]] = None,
+    ) -> None:
+        values = as_float_buffer(values=coordinates)
+        self.shared_memory = shared_memory.SharedMemory(
+            create=True, size=max(8 * len(values), 1),
+        )
+        self._view = self.shared_memory.buf[:8 * len(values)].cast("d")
+        self._view[:] = values
+        super().__init__(coordinates=self._view)
+
+    def __enter__(self) -> "SharedPointArray":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._view is None:
+            return
+        self.coordinates = as_float_array(values=None)
+        self._view.release()
+        self._view = None
+        self.shared_memory.close()
+        self.shared_memory.unlink()
+
+
+def transform_points(
+    pose: "poser.Pose",
+    points: PointArray,
+    workers: Optional[int] = None,
+    chunks_per_worker: int = 4,
+    executor: Optional[Executor] = None,
+) -> None:
+    if not isinstance(points, PointArray):
+        raise TypeError("points is not a PointArray instance.")
+    if isinstance(points, SharedPointArray):
+        workers = workers or os.cpu_count() or 1
+        if workers >= 2 and len(points) >= 2:
+            _transform_shared(
+                name=points.shared_memory.name,
+                n=len(points),
+                rotation=pose.rotation.as_tuple,
+                translation=pose.translation.as_tuple,
+                workers=workers,
+                chunks_per_worker=chunks_per_worker,
+                executor=executor,
+            )
+            return
+    transform_buffer(
+        buffer=points.coordinates,
+        rotation=pose.rotation.as_tuple,
+        translation=pose.translation.as_tuple,
+        workers=workers,
+        chunks_per_worker=chunks_per_worker,
+        executor=executor,
+    )
+
+
+def transform_buffer(
+    buffer: Union[array, memoryview],
+    rotation: Tuple[Tuple[float]],
+    translation: Tuple[float],
+    workers: Optional[int] = None,
+    chunks_per_worker: int = 4,
+    executor: Optional[Executor] = None,
+) -> None:
+    workers = workers or os.cpu_count() or 1
+    n = len(buffer) // 3
+    if workers < 2 or n < 2:
+        PointArray._affine(
+            source=buffer,
+            target=buffer,
+            rotation=rotation,
+            translation=translation,
+        )
+        return
+    # Plain buffers are copied into a temporary segment and back; use a
+    # SharedPointArray to transform large clouds without the two copies.
+    view = _as_double_view(buffer=buffer)
+    shm = shared_memory.SharedMemory(create=True, size=24 * n)
+    shared = shm.buf[:24 * n].cast("d")
+    try:
+        shared[:] = view
+        _transform_shared(
+            name=shm.name,
+            n=n,
+            rotation=rotation,
+            translation=translation,
+            workers=workers,
+            chunks_per_worker=chunks_per_worker,
+            executor=executor,
+        )
+        view[:] = shared
+    finally:
+        view.release()
+        shared.release()
+        shm.close()
+        shm.unlink()
+
+
+def _transform_shared(
+    name: str,
+    n: int,
+    rotation: Tuple[Tuple[float]],
+    translation: Tuple[float],
+    workers: int,
+    chunks_per_worker: int,
+    executor: Optional[Executor] = None,
+) -> None:
+    if executor is None:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            _transform_shared(
+                name=name,
+                n=n,
+                rotation=rotation,
+                translation=translation,
+                workers=workers,
+                chunks_per_worker=chunks_per_worker,
+                executor=executor,
+            )
+        return
+    chunks = min(n, workers * max(chunks_per_worker, 1))
+    bounds = [3 * (n * i // chunks) for i in range(chunks + 1)]
+    for _ in executor.map(
+        _transform_slice,
+        [name] * chunks,
+        bounds[:-1],
+        bounds[1:],
+        [rotation] * chunks,
+        [translation] * chunks,
+    ):
+        pass
+
+
+def _as_double_view(
+    buffer: Union[array, memoryview],
+) -> memoryview:
+    view = memoryview(buffer)
+    if view.format != "d":
+        raise TypeError(
+            f"buffer has an unsupported format: {view.format!r}"
+        )
+    return view.cast("B").cast("d")
+
+
+def _transform_slice(
+    name: str,
+    start: int,
+    stop: int,
+    rotation: Tuple[Tuple[float]],
+    translation: Tuple[float],
+) -> None:
+    shm = shared_memory.SharedMemory(name=name)
+    view = shm.buf[8 * start:8 * stop]
+    chunk = view.cast("d")
+    try:
+        PointArray._affine(
+            source=chunk,
+            target=chunk,
+            rotation=rotation,
+            translation=translation,
+        )
+    finally:
+        chunk.release()
+        view.release()
+        shm.close()
@@ -0,0 +1,61 @@
+from threading import RLock
+from typing import Callable, List, Tuple
+
+
+_lock = RLock()
+_originals = {}
+_layers = {}
+
+
+def install(
+    cls: type,
+    name: str,
+    owner: str,
+    wrap: Callable[[object], object],
+) -> None:
+    with _lock:
+        key = (cls, name,)
+        if key not in _originals:
+            _originals[key] = vars(cls)[name]
+            _layers[key] = []
+        _layers[key].append((owner, wrap,))
+        _rebuild(key=key)
+
+
+def uninstall(
+    owner: str,
+) -> None:
+    with _lock:
+        for key in list(_layers):
+            layers = _layers[key]
+            remaining = [layer for layer in layers if layer[0] != owner]
+            if len(remaining) == len(layers):
+                continue
+            _layers[key] = remaining
+            _rebuild(key=key)
+
+
+def installed(
+    owner: str,
+) -> bool:
+    with _lock:
+        return any(
+            layer[0] == owner
+            for layers in _layers.values()
+            for layer in layers
+        )
+
+
+def _rebuild(
+    key: Tuple[type, str],
+) -> None:
+    (cls, name,) = key
+    attribute = _originals[key]
+    layers: List[Tuple[str, Callable]] = _layers[key]
+    for (_, wrap,) in layers:
+        attribute = wrap(attribute)
+    setattr(cls, name, attribute)
+    if not layers:
+        del _originals[key]
+        del _layers[key]
+
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Tuple, List
 
 
-@dataclass
+@dataclass(slots=True)
 class Point(object):
     x: float = 0.0
     y: float = 0.0
@@ -16,6 +16,19 @@ class Point(object):
         if not isinstance(self.z, float):
             self.z = float(self.z)
 
+    @classmethod
+    def _unchecked(
+        cls,
+        x: float,
+        y: float,
+        z: float,
+    ) -> "Point":
+        point = object.__new__(cls)
+        point.x = x
+        point.y = y
+        point.z = z
+        return point
+
     @property
     def as_tuple(self) -> Tuple[float]:
         return (self.x, self.y, self.z,)
@@ -0,0 +1,346 @@
+from array import array
+from copy import copy
+from typing import Tuple, List, Union, Iterable, Iterator, Optional
+
+import poser.point
+import poser.buffers
+
+
+Point = poser.point.Point
+
+as_float_buffer = poser.buffers.as_float_buffer
+as_float_array = poser.buffers.as_float_array
+is_row_view = poser.buffers.is_row_view
+np = poser.buffers.np
+FloatArray = poser.buffers.FloatArray
+
+
+class PointArray(object):
+    def __init__(
+        self,
+        coordinates: Optional[Union[array, memoryview, Iterable[float]]] = None,
+    ) -> None:
+        if is_row_view(values=coordinates, width=3):
+            self._coordinates = None
+            self._xyz = coordinates
+            return
+        self.coordinates = as_float_array(values=coordinates)
+        if len(self.coordinates) % 3:
+            raise ValueError(
+                "coordinates length is not a multiple of 3."
+            )
+
+    @property
+    def coordinates(self) -> FloatArray:
+        if self._coordinates is None:
+            self._coordinates = as_float_array(values=self._xyz)
+            self._xyz = None
+        return self._coordinates
+
+    @coordinates.setter
+    def coordinates(self, coordinates: FloatArray) -> None:
+        self._coordinates = coordinates
+        self._xyz = None
+
+    @classmethod
+    def from_points(
+        cls,
+        points: Iterable[Point],
+    ) -> "PointArray":
+        coordinates = array("d")
+        for point in points:
+            if not isinstance(point, Point):
+                raise TypeError(
+                    "point is neither a Point nor a Translation instance."
+                )
+            coordinates.append(point.x)
+            coordinates.append(point.y)
+            coordinates.append(point.z)
+        return cls(coordinates=coordinates)
+
+    @classmethod
+    def zeros(
+        cls,
+        length: int,
+    ) -> "PointArray":
+        return cls(coordinates=array("d", bytes(24 * length)))
+
+    def __len__(self) -> int:
+        if self._xyz is not None:
+            return len(self._xyz)
+        return len(self._coordinates) // 3
+
+    @property
+    def xyz(self) -> "np.ndarray":
+        if np is None:
+            raise ImportError("PointArray.xyz requires numpy.")
+        if self._xyz is not None:
+            return self._xyz
+        return self._coordinates.reshape(-1, 3)
+
+    def __getitem__(
+        self,
+        index: Union[int, slice],
+    ) -> Union[Point, "PointArray"]:
+        if isinstance(index, slice):
+            if np is not None:
+                return PointArray(coordinates=self.xyz[index].copy())
+            c = self.coordinates
+            (start, stop, step,) = index.indices(len(self))
+            if step == 1:
+                return PointArray(
+                    coordinates=array("d", c[3*start:3*max(start, stop)])
+                )
+            coordinates = array("d")
+            for i in range(start, stop, step):
+                coordinates.extend(c[3*i:3*i + 3])
+            return PointArray(coordinates=coordinates)
+        i = self._index(index=index)
+        c = as_float_buffer(values=self.coordinates)
+        return Point._unchecked(c[i], c[i + 1], c[i + 2])
+
+    def __setitem__(
+        self,
+        index: int,
+        point: Point,
+    ) -> None:
+        if not isinstance(point, Point):
+            raise TypeError(
+                "point is neither a Point nor a Translation instance."
+            )
+        i = self._index(index=index)
+        c = self.coordinates
+        c[i] = point.x
+        c[i + 1] = point.y
+        c[i + 2] = point.z
+
+    def __iter__(self) -> Iterator[Point]:
+        c = as_float_buffer(values=self.coordinates)
+        for i in range(0, len(c), 3):
+            yield Point._unchecked(c[i], c[i + 1], c[i + 2])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PointArray):
+            return NotImplemented
+        return self.coordinates.tolist() == other.coordinates.tolist()
+
+    @property
+    def as_tuple(self) -> Tuple[Tuple[float]]:
+        c = as_float_buffer(values=self.coordinates)
+        return tuple(
+            (c[i], c[i + 1], c[i + 2],)
+            for i in range(0, len(c), 3)
+        )
+
+    @property
+    def as_list(self) -> List[List[float]]:
+        c = as_float_buffer(values=self.coordinates)
+        return [
+            [c[i], c[i + 1], c[i + 2]]
+            for i in range(0, len(c), 3)
+        ]
+
+    def copy(self) -> "PointArray":
+        return PointArray(coordinates=copy(self.coordinates))
+
+    def to_points(self) -> List[Point]:
+        return list(self)
+
+    def _index(self, index: int) -> int:
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("PointArray index out of range.")
+        return 3 * index
+
+    def _transform(
+        self,
+        rotation: Tuple[Tuple[float]] = (
+            (1.0, 0.0, 0.0,),
+            (0.0, 1.0, 0.0,),
+            (0.0, 0.0, 1.0,),
+        ),
+        translation: Tuple[float] = (0.0, 0.0, 0.0,),
+    ) -> None:
+        self._affine(
+            source=self.coordinates,
+            target=self.coordinates,
+            rotation=rotation,
+            translation=translation,
+        )
+
+    def _transformed(
+        self,
+        rotation: Tuple[Tuple[float]] = (
+            (1.0, 0.0, 0.0,),
+            (0.0, 1.0, 0.0,),
+            (0.0, 0.0, 1.0,),
+        ),
+        translation: Tuple[float] = (0.0, 0.0, 0.0,),
+    ) -> "PointArray":
+        result = PointArray.zeros(length=len(self))
+        self._affine(
+            source=self.coordinates,
+            target=result.coordinates,
+            rotation=rotation,
+            translation=translation,
+        )
+        return result
+
+    @staticmethod
+    def _transformed_into(
+        points: Union[list, tuple, "PointArray"],
+        out: Union[list, "PointArray", array, memoryview],
+        rotation: Tuple[Tuple[float]] = (
+            (1.0, 0.0, 0.0,),
+            (0.0, 1.0, 0.0,),
+            (0.0, 0.0, 1.0,),
+        ),
+        translation: Tuple[float] = (0.0, 0.0, 0.0,),
+    ) -> Union[list, "PointArray", array, memoryview]:
+        if isinstance(out, list):
+            if len(out) != len(points):
+                raise ValueError(
+                    f"out holds {len(out)} points, expected {len(points)}."
+                )
+            targets = out
+        else:
+            target = PointArray._writable_buffer(out=out)
+            if len(target) != 3 * len(points):
+                raise ValueError(
+                    f"out holds {len(target)} values, "
+                    f"expected {3 * len(points)}."
+                )
+            if isinstance(points, PointArray):
+                PointArray._affine(
+                    source=points.coordinates,
+                    target=target,
+                    rotation=rotation,
+                    translation=translation,
+                )
+                return out
+            targets = None
+        (
+            (r11, r12, r13,),
+            (r21, r22, r23,),
+            (r31, r32, r33,),
+        ) = rotation
+        (tx, ty, tz,) = translation
+        if isinstance(points, PointArray):
+            c = points.coordinates
+            for i, result in enumerate(targets):
+                if not isinstance(result, Point):
+                    raise TypeError(
+                        "out holds neither Point nor Translation instances."
+                    )
+                j = 3 * i
+                x, y, z = c[j], c[j + 1], c[j + 2]
+                result.x = r11*x + r12*y + r13*z + tx
+                result.y = r21*x + r22*y + r23*z + ty
+                result.z = r31*x + r32*y + r33*z + tz
+            return out
+        for i, point in enumerate(points):
+            if not isinstance(point, Point):
+                raise TypeError(
+                    "point is neither a Point nor a Translation instance."
+                )
+            x, y, z = point.x, point.y, point.z
+            if targets is None:
+                j = 3 * i
+                target[j] = r11*x + r12*y + r13*z + tx
+                target[j + 1] = r21*x + r22*y + r23*z + ty
+                target[j + 2] = r31*x + r32*y + r33*z + tz
+                continue
+            result = targets[i]
+            if not isinstance(result, Point):
+                raise TypeError(
+                    "out holds neither Point nor Translation instances."
+                )
+            result.x = r11*x + r12*y + r13*z + tx
+            result.y = r21*x + r22*y + r23*z + ty
+            result.z = r31*x + r32*y + r33*z + tz
+        return out
+
+    @staticmethod
+    def _writable_buffer(
+        out: Union["PointArray", array, memoryview],
+    ) -> Union[array, memoryview]:
+        if isinstance(out, PointArray):
+            return out.coordinates
+        if isinstance(out, array) and out.typecode in ("d", "f"):
+            return out
+        try:
+            view = memoryview(out)
+        except TypeError:
+            raise TypeError(
+                f"out has an unsupported type: {type(out)}"
+            ) from None
+        if view.readonly:
+            raise TypeError("out is not a writable buffer.")
+        if not view.c_contiguous:
+            raise ValueError("out buffer is not contiguous.")
+        if view.format not in ("d", "f"):
+            raise TypeError(
+                f"out buffer has an unsupported format: {view.format!r}"
+            )
+        return view.cast("B").cast(view.format)
+
+    @staticmethod
+    def _affine(
+        source: Union[array, memoryview],
+        target: Union[array, memoryview],
+        rotation: Tuple[Tuple[float]],
+        translation: Tuple[float],
+        stride: int = 3,
+    ) -> None:
+        if np is not None:
+            if len(source) >= 3:
+                PointArray._affine_numpy(
+                    source=PointArray._strided(buffer=source, stride=stride),
+                    target=PointArray._strided(buffer=target, stride=stride),
+                    rotation=rotation,
+                    translation=translation,
+                )
+            return
+        (
+            (r11, r12, r13,),
+            (r21, r22, r23,),
+            (r31, r32, r33,),
+        ) = rotation
+        (tx, ty, tz,) = translation
+        for i in range(0, len(source), stride):
+            x = source[i]
+            y = source[i + 1]
+            z = source[i + 2]
+            target[i] = r11*x + r12*y + r13*z + tx
+            target[i + 1] = r21*x + r22*y + r23*z + ty
+            target[i + 2] = r31*x + r32*y + r33*z + tz
+
+    @staticmethod
+    def _affine_numpy(
+        source: "np.ndarray",
+        target: "np.ndarray",
+        rotation: Tuple[Tuple[float]],
+        translation: Tuple[float],
+    ) -> None:
+        transposed = np.array(rotation, dtype=np.float64).T
+        if target.dtype == np.float64:
+            np.matmul(source, transposed, out=target)
+            target += translation
+        else:
+            target[...] = source @ transposed + translation
+
+    @staticmethod
+    def _strided(
+        buffer: Union[array, memoryview, "np.ndarray"],
+        stride: int,
+    ) -> "np.ndarray":
+        values = np.asarray(buffer)
+        if stride == 3:
+            return values.reshape(-1, 3)
+        return np.lib.stride_tricks.as_strided(
+            values,
+            shape=((len(values) - 3) // stride + 1, 3),
+            strides=(stride * values.itemsize, values.itemsize),
+        )
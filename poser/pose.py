@@ -1,19 +1,42 @@
-from dataclasses import dataclass
-from typing import Tuple, List, Optional, Union
+from array import array
+from dataclasses import dataclass, field
+from typing import Tuple, List, Optional, Union, Iterable, Iterator, Sequence
 
 import poser
+import poser.lie
+import poser.parallel
+import poser.streaming
 import poser.rotation.rotation
+import poser.rotation.representations
 
 
 Point = poser.point.Point
 Translation = poser.translation.Translation
+PointArray = poser.point_array.PointArray
 Rotation = poser.rotation.rotation.Rotation
+Matrix = poser.rotation.representations.Matrix
+Quaternion = poser.rotation.representations.Quaternion
 
+np = poser.buffers.np
 
-@dataclass
+
+class _PoseCache(object):
+    __slots__ = ("matrix_key", "matrix", "inverse_key", "inverse",)
+
+    def __init__(self) -> None:
+        self.matrix_key = None
+        self.matrix = None
+        self.inverse_key = None
+        self.inverse = None
+
+
+@dataclass(slots=True)
 class Pose(object):
     translation: Optional[Translation] = None
     rotation: Optional[Rotation] = None
+    _cache: Optional[_PoseCache] = field(
+        default=None, init=False, repr=False, compare=False,
+    )
 
     def __post_init__(self) -> None:
         if not self.translation:
@@ -22,15 +45,34 @@ class Pose(object):
             self.rotation = Rotation()
 
     def __invert__(self) -> "Pose":
-        inverted_rotation = ~self.rotation
-        return Pose(
-            translation=inverted_rotation.transformed_point(
+        cache = self._cache_entry()
+        t = self.translation
+        q = self.rotation.quaternion
+        key = (q.w, q.x, q.y, q.z, t.x, t.y, t.z,)
+        if cache.inverse_key != key:
+            inverted_rotation = ~self.rotation
+            translation = inverted_rotation.transformed_point(
                 ~self.translation
+            )
+            r = inverted_rotation.quaternion
+            cache.inverse_key = key
+            cache.inverse = (
+                translation.as_tuple,
+                (r.w, r.x, r.y, r.z,),
+                inverted_rotation.as_tuple,
+            )
+        (t, q, m,) = cache.inverse
+        return Pose(
+            translation=Translation._unchecked(*t),
+            rotation=Rotation._unchecked(
+                quaternion=Quaternion._unchecked(*q),
+                matrix=Matrix._unchecked(*m[0], *m[1], *m[2]),
             ),
-            rotation=inverted_rotation,
         )
     
     def __mul__(self, other: "Pose"):
+        if not isinstance(other, Pose):
+            return NotImplemented
         return Pose(
             translation=(
                 self.translation 
@@ -43,14 +85,22 @@ class Pose(object):
     
     @property
     def as_tuple(self) -> Tuple[Tuple[float]]:
-        r = self.rotation.as_tuple
-        t = self.translation.as_tuple
-        return (
-            (r[0][0], r[0][1], r[0][2], t[0],),
-            (r[1][0], r[1][1], r[1][2], t[1],),
-            (r[2][0], r[2][1], r[2][2], t[2],),
-            (0.0, 0.0, 0.0, 1.0,),
+        cache = self._cache_entry()
+        m = self.rotation.matrix
+        t = self.translation
+        key = (
+            m.r11, m.r12, m.r13, m.r21, m.r22, m.r23, m.r31, m.r32, m.r33,
+            t.x, t.y, t.z,
         )
+        if cache.matrix_key != key:
+            cache.matrix_key = key
+            cache.matrix = (
+                (m.r11, m.r12, m.r13, t.x,),
+                (m.r21, m.r22, m.r23, t.y,),
+                (m.r31, m.r32, m.r33, t.z,),
+                (0.0, 0.0, 0.0, 1.0,),
+            )
+        return cache.matrix
     
     @as_tuple.setter
     def as_tuple(self, matrix: Tuple[Tuple[float]]) -> None:
@@ -60,17 +110,11 @@ class Pose(object):
         self.translation.as_tuple = (
             matrix[0][3], matrix[1][3], matrix[2][3]
         )
+        self._invalidate_cache()
 
     @property
     def as_list(self) -> List[List[float]]:
-        r = self.rotation.as_list
-        t = self.translation.as_list
-        return [
-            r[0] + [t[0]],
-            r[1] + [t[1]],
-            r[2] + [t[2]],
-            [0.0, 0.0, 0.0, 1.0],
-        ]        
+        return [list(row) for row in self.as_tuple]
 
     @as_list.setter
     def as_list(self, matrix: List[List[float]]) -> None:
@@ -80,6 +124,7 @@ class Pose(object):
         self.translation.as_list = (
             matrix[0][3], matrix[1][3], matrix[2][3]
         )
+        self._invalidate_cache()
 
     def interpolated(
         self,
@@ -97,36 +142,218 @@ class Pose(object):
             ),
         )
     
+    def interpolated_many(
+        self,
+        other: "Pose",
+        factors: Iterable[float],
+    ) -> "poser.PoseArray":
+        factors = array("d", factors)
+        if np is not None:
+            t1 = np.array(self.translation.as_tuple)
+            t2 = np.array(other.translation.as_tuple)
+            translations = (
+                t1 + np.frombuffer(factors)[:, None] * (t2 - t1)
+            ).reshape(-1)
+        else:
+            (x1, y1, z1,) = self.translation.as_tuple
+            (x2, y2, z2,) = other.translation.as_tuple
+            dx, dy, dz = x2 - x1, y2 - y1, z2 - z1
+            translations = array("d")
+            for f in factors:
+                translations.extend((x1 + f*dx, y1 + f*dy, z1 + f*dz,))
+        return poser.pose_array.PoseArray(
+            translations=PointArray(coordinates=translations),
+            rotations=self.rotation.interpolated_many(
+                other=other.rotation,
+                factors=factors,
+            ),
+        )
+
+    @classmethod
+    def exp(
+        cls,
+        twist: Sequence[float],
+    ) -> "Pose":
+        (t, q,) = poser.lie.se3_exp(twist=twist)
+        return cls(
+            translation=Translation._unchecked(*t),
+            rotation=Rotation(rotation=Quaternion._unchecked(*q)),
+        )
+
+    def log(self) -> Tuple[float, float, float, float, float, float]:
+        q = self.rotation.quaternion
+        return poser.lie.se3_log(
+            translation=self.translation.as_tuple,
+            quaternion=(q.w, q.x, q.y, q.z,),
+        )
+
+    def adjoint(self) -> Tuple[Tuple[float]]:
+        q = self.rotation.quaternion
+        return poser.lie.se3_adjoint(
+            translation=self.translation.as_tuple,
+            quaternion=(q.w, q.x, q.y, q.z,),
+        )
+
+    @staticmethod
+    def left_jacobian(
+        twist: Sequence[float],
+        inverse: bool = False,
+    ) -> Tuple[Tuple[float]]:
+        return poser.lie.se3_left_jacobian(twist=twist, inverse=inverse)
+
+    @staticmethod
+    def right_jacobian(
+        twist: Sequence[float],
+        inverse: bool = False,
+    ) -> Tuple[Tuple[float]]:
+        return poser.lie.se3_right_jacobian(twist=twist, inverse=inverse)
+
     def transform_point(
         self,
         point: Union[Point, Translation],
     ) -> None:
-        self.rotation.transform_point(point=point)
-        self.translation.transform_point(point=point)
+        if not isinstance(point, Point):
+            raise TypeError(
+                "point is neither a Point nor a Translation instance."
+            )
+        (point.x, point.y, point.z,) = self._affine(
+            x=point.x,
+            y=point.y,
+            z=point.z,
+            rotation=self.rotation.as_tuple,
+            translation=self.translation.as_tuple,
+        )
 
     def transform_points(
         self,
-        points: Union[list, tuple],
+        points: Union[list, tuple, PointArray],
+        workers: Optional[int] = None,
     ) -> None:
-        self.rotation.transform_points(points=points)
-        self.translation.transform_points(points=points)
+        if workers is not None and workers != 1:
+            if not isinstance(points, PointArray):
+                raise TypeError(
+                    "parallel transformation requires a PointArray."
+                )
+            poser.parallel.transform_points(
+                pose=self,
+                points=points,
+                workers=workers,
+            )
+            return
+        if isinstance(points, PointArray):
+            points._transform(
+                rotation=self.rotation.as_tuple,
+                translation=self.translation.as_tuple,
+            )
+            return
+        (
+            (r11, r12, r13,),
+            (r21, r22, r23,),
+            (r31, r32, r33,),
+        ) = self.rotation.as_tuple
+        (tx, ty, tz,) = self.translation.as_tuple
+        for point in points:
+            if not isinstance(point, Point):
+                raise TypeError(
+                    "point is neither a Point nor a Translation instance."
+                )
+            x, y, z = point.x, point.y, point.z
+            point.x = r11*x + r12*y + r13*z + tx
+            point.y = r21*x + r22*y + r23*z + ty
+            point.z = r31*x + r32*y + r33*z + tz
 
     def transformed_point(
         self,
         point: Union[Point, Translation],
     ) -> Union[Point, Translation]:
-        return self.translation.transformed_point(
-            point=self.rotation.transformed_point(
-                point=point,
+        if not isinstance(point, Point):
+            raise TypeError(
+                "point is neither a Point nor a Translation instance."
+            )
+        return type(point)._unchecked(
+            *self._affine(
+                x=point.x,
+                y=point.y,
+                z=point.z,
+                rotation=self.rotation.as_tuple,
+                translation=self.translation.as_tuple,
             )
         )
     
     def transformed_points(
         self,
-        points: Union[list, tuple],
-    ) -> Union[list, tuple]:
-        return self.translation.transformed_points(
-            points=self.rotation.transformed_points(
+        points: Union[list, tuple, PointArray],
+        out: Union[list, PointArray, array, memoryview, None] = None,
+    ) -> Union[list, tuple, PointArray, array, memoryview]:
+        if out is not None:
+            return PointArray._transformed_into(
                 points=points,
+                out=out,
+                rotation=self.rotation.as_tuple,
+                translation=self.translation.as_tuple,
+            )
+        if isinstance(points, PointArray):
+            return points._transformed(
+                rotation=self.rotation.as_tuple,
+                translation=self.translation.as_tuple,
+            )
+        if not isinstance(points, (list, tuple)):
+            return None
+        (
+            (r11, r12, r13,),
+            (r21, r22, r23,),
+            (r31, r32, r33,),
+        ) = self.rotation.as_tuple
+        (tx, ty, tz,) = self.translation.as_tuple
+        transformed = [
+            type(point)._unchecked(
+                r11*point.x + r12*point.y + r13*point.z + tx,
+                r21*point.x + r22*point.y + r23*point.z + ty,
+                r31*point.x + r32*point.y + r33*point.z + tz,
             )
+            for point in points
+            if isinstance(point, Point)
+        ]
+        if isinstance(points, tuple):
+            return tuple(transformed)
+        return transformed
+
+    def transform_iter(
+        self,
+        points: Iterable,
+        chunk_size: int = 1024,
+    ) -> Iterator[Union[list, PointArray, array]]:
+        return poser.streaming.transform_iter(
+            points=points,
+            rotation=self.rotation.as_tuple,
+            translation=self.translation.as_tuple,
+            chunk_size=chunk_size,
+        )
+
+    def _cache_entry(self) -> _PoseCache:
+        if self._cache is None:
+            self._cache = _PoseCache()
+        return self._cache
+
+    def _invalidate_cache(self) -> None:
+        self._cache = None
+
+    @staticmethod
+    def _affine(
+        x: float,
+        y: float,
+        z: float,
+        rotation: Tuple[Tuple[float]],
+        translation: Tuple[float],
+    ) -> (float, float, float):
+        (
+            (r11, r12, r13,),
+            (r21, r22, r23,),
+            (r31, r32, r33,),
+        ) = rotation
+        (tx, ty, tz,) = translation
+        return (
+            r11*x + r12*y + r13*z + tx,
+            r21*x + r22*y + r23*z + ty,
+            r31*x + r32*y + r33*z + tz,
         )
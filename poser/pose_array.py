@@ -0,0 +1,415 @@
+from array import array
+from typing import Union, Iterable, Iterator, Optional, Sequence, List
+
+import poser
+import poser.lie
+import poser.pose
+import poser.rotation.rotation_array
+
+
+Translation = poser.translation.Translation
+PointArray = poser.point_array.PointArray
+RotationArray = poser.rotation.rotation_array.RotationArray
+Pose = poser.pose.Pose
+
+as_float_buffer = poser.buffers.as_float_buffer
+np = poser.buffers.np
+FloatArray = poser.buffers.FloatArray
+
+
+class PoseArray(object):
+    def __init__(
+        self,
+        translations: Optional[Union[PointArray, Iterable[float]]] = None,
+        rotations: Optional[Union[RotationArray, Iterable[float]]] = None,
+    ) -> None:
+        if not isinstance(translations, (PointArray, type(None))):
+            translations = PointArray(coordinates=translations)
+        if not isinstance(rotations, (RotationArray, type(None))):
+            rotations = RotationArray(quaternions=rotations)
+        if translations is None:
+            translations = PointArray.zeros(
+                length=0 if rotations is None else len(rotations)
+            )
+        if rotations is None:
+            rotations = RotationArray.identity(length=len(translations))
+        if len(translations) != len(rotations):
+            raise ValueError(
+                f"translations and rotations differ in length: "
+                f"{len(translations)} != {len(rotations)}."
+            )
+        self.translations = translations
+        self.rotations = rotations
+
+    @classmethod
+    def identity(
+        cls,
+        length: int,
+    ) -> "PoseArray":
+        return cls(
+            translations=PointArray.zeros(length=length),
+            rotations=RotationArray.identity(length=length),
+        )
+
+    @classmethod
+    def from_poses(
+        cls,
+        poses: Iterable[Pose],
+    ) -> "PoseArray":
+        translations = array("d")
+        quaternions = array("d")
+        for pose in poses:
+            if not isinstance(pose, Pose):
+                raise TypeError(
+                    "pose is not a Pose instance."
+                )
+            t = pose.translation
+            q = pose.rotation.quaternion
+            translations.extend((t.x, t.y, t.z,))
+            quaternions.extend((q.w, q.x, q.y, q.z,))
+        return cls(
+            translations=PointArray(coordinates=translations),
+            rotations=RotationArray(quaternions=quaternions),
+        )
+
+    def __len__(self) -> int:
+        return len(self.rotations)
+
+    def __getitem__(
+        self,
+        index: Union[int, slice],
+    ) -> Union[Pose, "PoseArray"]:
+        if isinstance(index, slice):
+            return PoseArray(
+                translations=self.translations[index],
+                rotations=self.rotations[index],
+            )
+        point = self.translations[index]
+        return Pose(
+            translation=Translation._unchecked(point.x, point.y, point.z),
+            rotation=self.rotations[index],
+        )
+
+    def __iter__(self) -> Iterator[Pose]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __invert__(self) -> "PoseArray":
+        rotations = ~self.rotations
+        translations = PointArray.zeros(length=len(self))
+        self._rotate(
+            matrices=rotations.to_matrix(),
+            source=self.translations.coordinates,
+            target=translations.coordinates,
+            sign=-1.0,
+        )
+        return PoseArray(
+            translations=translations,
+            rotations=rotations,
+        )
+
+    def __mul__(
+        self,
+        other: Union["PoseArray", Pose],
+    ) -> "PoseArray":
+        if isinstance(other, Pose):
+            other = PoseArray.from_poses(poses=(other,))
+        if not isinstance(other, PoseArray):
+            return NotImplemented
+        return self._compose(first=self, second=other)
+
+    def __rmul__(
+        self,
+        other: Pose,
+    ) -> "PoseArray":
+        if not isinstance(other, Pose):
+            return NotImplemented
+        return self._compose(
+            first=PoseArray.from_poses(poses=(other,)),
+            second=self,
+        )
+
+    def interpolated(
+        self,
+        other: Union["PoseArray", Pose],
+        factor: Union[float, Sequence[float]],
+    ) -> "PoseArray":
+        if isinstance(other, Pose):
+            other = PoseArray.from_poses(poses=(other,))
+        if not isinstance(other, PoseArray):
+            raise TypeError(
+                "other is neither a PoseArray nor a Pose instance."
+            )
+        rotations = self.rotations.interpolated(
+            other=other.rotations,
+            factor=factor,
+        )
+        factors = (
+            None if isinstance(factor, (int, float))
+            else as_float_buffer(values=factor)
+        )
+        if np is not None:
+            f = factor if factors is None else np.asarray(factors)[:, None]
+            translations = PointArray(
+                coordinates=np.broadcast_to(
+                    self.translations.xyz * (1.0 - f)
+                    + other.translations.xyz * f,
+                    (len(rotations), 3),
+                ).copy()
+            )
+            return PoseArray(
+                translations=translations,
+                rotations=rotations,
+            )
+        t1 = self.translations.coordinates
+        t2 = other.translations.coordinates
+        s1 = 3 if len(self) > 1 else 0
+        s2 = 3 if len(other) > 1 else 0
+        f = factor
+        translations = PointArray.zeros(length=len(rotations))
+        t = translations.coordinates
+        i1 = i2 = 0
+        for j, i in enumerate(range(0, len(t), 3)):
+            if factors is not None:
+                f = factors[j]
+            t[i] = t1[i1] * (1.0-f) + t2[i2] * f
+            t[i + 1] = t1[i1 + 1] * (1.0-f) + t2[i2 + 1] * f
+            t[i + 2] = t1[i1 + 2] * (1.0-f) + t2[i2 + 2] * f
+            i1 += s1
+            i2 += s2
+        return PoseArray(
+            translations=translations,
+            rotations=rotations,
+        )
+
+    @classmethod
+    def exp(
+        cls,
+        twists: Union[array, memoryview, Iterable[float]],
+    ) -> "PoseArray":
+        (translations, quaternions,) = poser.lie.se3_exp_batch(twists=twists)
+        return cls(
+            translations=PointArray(coordinates=translations),
+            rotations=RotationArray(quaternions=quaternions),
+        )
+
+    def log(self) -> FloatArray:
+        return poser.lie.se3_log_batch(
+            translations=self.translations.coordinates,
+            quaternions=self.rotations.quaternions,
+        )
+
+    def adjoint(self) -> FloatArray:
+        return poser.lie.se3_adjoint_batch(
+            translations=self.translations.coordinates,
+            quaternions=self.rotations.quaternions,
+        )
+
+    @staticmethod
+    def left_jacobian(
+        twists: Union[array, memoryview, Iterable[float]],
+        inverse: bool = False,
+    ) -> FloatArray:
+        return poser.lie.se3_left_jacobian_batch(
+            twists=twists,
+            inverse=inverse,
+        )
+
+    @staticmethod
+    def right_jacobian(
+        twists: Union[array, memoryview, Iterable[float]],
+        inverse: bool = False,
+    ) -> FloatArray:
+        return poser.lie.se3_right_jacobian_batch(
+            twists=twists,
+            inverse=inverse,
+        )
+
+    def transform_points(
+        self,
+        points: Union[PointArray, Sequence[PointArray]],
+    ) -> None:
+        matrices = self.rotations.to_matrix()
+        t = self.translations.coordinates
+        if isinstance(points, PointArray):
+            self._check_length(points=points)
+            self._rotate(
+                matrices=matrices,
+                source=points.coordinates,
+                target=points.coordinates,
+                translations=t,
+            )
+            return
+        self._check_length(points=points)
+        for i, point_array in enumerate(points):
+            point_array._transform(
+                rotation=self._matrix(matrices=matrices, index=i),
+                translation=(t[3*i], t[3*i + 1], t[3*i + 2],),
+            )
+
+    def transformed_points(
+        self,
+        points: Union[PointArray, Sequence[PointArray]],
+    ) -> Union[PointArray, List[PointArray]]:
+        matrices = self.rotations.to_matrix()
+        t = self.translations.coordinates
+        if isinstance(points, PointArray):
+            self._check_length(points=points)
+            result = PointArray.zeros(length=len(points))
+            self._rotate(
+                matrices=matrices,
+                source=points.coordinates,
+                target=result.coordinates,
+                translations=t,
+            )
+            return result
+        self._check_length(points=points)
+        return [
+            point_array._transformed(
+                rotation=self._matrix(matrices=matrices, index=i),
+                translation=(t[3*i], t[3*i + 1], t[3*i + 2],),
+            )
+            for i, point_array in enumerate(points)
+        ]
+
+    def take(
+        self,
+        indices: Iterable[int],
+    ) -> "PoseArray":
+        length = len(self)
+        if np is not None:
+            if not isinstance(indices, (np.ndarray, array, Sequence)):
+                indices = list(indices)
+            indices = np.asarray(indices, dtype=np.intp)
+            if ((indices < -length) | (indices >= length)).any():
+                raise IndexError("PoseArray index out of range.")
+            return PoseArray(
+                translations=PointArray(
+                    coordinates=self.translations.xyz[indices]
+                ),
+                rotations=RotationArray(
+                    quaternions=self.rotations.wxyz[indices]
+                ),
+            )
+        t = self.translations.coordinates
+        q = self.rotations.quaternions
+        translations = array("d")
+        quaternions = array("d")
+        for index in indices:
+            if not -length <= index < length:
+                raise IndexError("PoseArray index out of range.")
+            if index < 0:
+                index += length
+            translations.extend(t[3*index:3*index + 3])
+            quaternions.extend(q[4*index:4*index + 4])
+        return PoseArray(
+            translations=PointArray(coordinates=translations),
+            rotations=RotationArray(quaternions=quaternions),
+        )
+
+    def to_poses(self) -> List[Pose]:
+        return list(self)
+
+    def _check_length(
+        self,
+        points: Union[PointArray, Sequence[PointArray]],
+    ) -> None:
+        if len(points) != len(self):
+            raise ValueError(
+                f"expected one point entry per pose: "
+                f"{len(points)} != {len(self)}."
+            )
+
+    @staticmethod
+    def _compose(
+        first: "PoseArray",
+        second: "PoseArray",
+    ) -> "PoseArray":
+        rotations = RotationArray(
+            quaternions=RotationArray._multiply(
+                q1=first.rotations.quaternions,
+                q2=second.rotations.quaternions,
+            )
+        )
+        if np is not None:
+            translations = PointArray.zeros(length=len(rotations))
+            if len(rotations):
+                translations.xyz[...] = (
+                    np.matmul(
+                        first.rotations.to_matrix().reshape(-1, 3, 3),
+                        second.translations.xyz[..., None],
+                    )[..., 0]
+                    + first.translations.xyz
+                )
+            return PoseArray(
+                translations=translations,
+                rotations=rotations,
+            )
+        m = first.rotations.to_matrix()
+        t1 = first.translations.coordinates
+        t2 = second.translations.coordinates
+        s1 = 3 if len(first) > 1 else 0
+        s2 = 3 if len(second) > 1 else 0
+        translations = PointArray.zeros(length=len(rotations))
+        t = translations.coordinates
+        i1 = i2 = 0
+        for i in range(0, len(t), 3):
+            k = 3 * i1
+            x, y, z = t2[i2], t2[i2 + 1], t2[i2 + 2]
+            t[i] = m[k]*x + m[k + 1]*y + m[k + 2]*z + t1[i1]
+            t[i + 1] = m[k + 3]*x + m[k + 4]*y + m[k + 5]*z + t1[i1 + 1]
+            t[i + 2] = m[k + 6]*x + m[k + 7]*y + m[k + 8]*z + t1[i1 + 2]
+            i1 += s1
+            i2 += s2
+        return PoseArray(
+            translations=translations,
+            rotations=rotations,
+        )
+
+    @staticmethod
+    def _matrix(
+        matrices: array,
+        index: int,
+    ) -> tuple:
+        k = 9 * index
+        return (
+            tuple(matrices[k:k + 3]),
+            tuple(matrices[k + 3:k + 6]),
+            tuple(matrices[k + 6:k + 9]),
+        )
+
+    @staticmethod
+    def _rotate(
+        matrices: array,
+        source: Union[array, memoryview],
+        target: Union[array, memoryview],
+        translations: Optional[Union[array, memoryview]] = None,
+        sign: float = 1.0,
+    ) -> None:
+        if np is not None:
+            xyz = np.matmul(
+                np.asarray(matrices).reshape(-1, 3, 3),
+                np.asarray(source).reshape(-1, 3, 1),
+            )[..., 0]
+            if sign != 1.0:
+                xyz *= sign
+            if translations is not None:
+                xyz += np.asarray(translations).reshape(-1, 3)
+            np.asarray(target).reshape(-1, 3)[...] = xyz
+            return
+        m = matrices
+        for i in range(0, len(source), 3):
+            k = 3 * i
+            x, y, z = source[i], source[i + 1], source[i + 2]
+            x, y, z = (
+                sign * (m[k]*x + m[k + 1]*y + m[k + 2]*z),
+                sign * (m[k + 3]*x + m[k + 4]*y + m[k + 5]*z),
+                sign * (m[k + 6]*x + m[k + 7]*y + m[k + 8]*z),
+            )
+            if translations is not None:
+                x += translations[i]
+                y += translations[i + 1]
+                z += translations[i + 2]
+            target[i] = x
+            target[i + 1] = y
+            target[i + 2] = z
@@ -0,0 +1,235 @@
+from array import array
+from threading import Lock
+from typing import Optional, Tuple
+import math
+import time
+
+import poser
+import poser.pose_array
+import poser.trajectory
+
+
+Pose = poser.pose.Pose
+PoseArray = poser.pose_array.PoseArray
+PointArray = poser.point_array.PointArray
+RotationArray = poser.rotation.rotation_array.RotationArray
+Translation = poser.translation.Translation
+Rotation = poser.rotation.rotation.Rotation
+Quaternion = poser.rotation.representations.Quaternion
+Trajectory = poser.trajectory.Trajectory
+
+
+class PoseRingBuffer(object):
+    def __init__(
+        self,
+        capacity: int,
+        max_age: Optional[float] = None,
+        out_of_range: str = "raise",
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be positive.")
+        if max_age is not None and max_age < 0.0:
+            raise ValueError("max_age must not be negative.")
+        self.capacity = capacity
+        self.max_age = max_age
+        self.out_of_range = Trajectory._check_policy(policy=out_of_range)
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._translations = array("d", bytes(24 * capacity))
+        self._quaternions = array("d", bytes(32 * capacity))
+        self._start = 0
+        self._count = 0
+        self._sequence = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(
+        self,
+        timestamp: float,
+        pose: Pose,
+    ) -> None:
+        t = pose.translation
+        q = pose.rotation.quaternion
+        capacity = self.capacity
+        with self._lock:
+            count = self._count
+            start = self._start
+            if count:
+                last = self._timestamps[(start + count - 1) % capacity]
+                if not timestamp > last:
+                    raise ValueError(
+                        f"timestamp {timestamp} is not after the latest "
+                        f"timestamp {last}."
+                    )
+            if count == capacity:
+                start = (start + 1) % capacity
+                count -= 1
+            if self.max_age is not None:
+                oldest = timestamp - self.max_age
+                while count and self._timestamps[start] < oldest:
+                    start = (start + 1) % capacity
+                    count -= 1
+            slot = (start + count) % capacity
+            self._sequence += 1
+            self._timestamps[slot] = timestamp
+            translations = self._translations
+            translations[3*slot] = t.x
+            translations[3*slot + 1] = t.y
+            translations[3*slot + 2] = t.z
+            quaternions = self._quaternions
+            quaternions[4*slot] = q.w
+            quaternions[4*slot + 1] = q.x
+            quaternions[4*slot + 2] = q.y
+            quaternions[4*slot + 3] = q.z
+            self._start = start
+            self._count = count + 1
+            self._sequence += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sequence += 1
+            self._start = 0
+            self._count = 0
+            self._sequence += 1
+
+    @property
+    def start(self) -> float:
+        return self._read(self._bounds)[0]
+
+    @property
+    def end(self) -> float:
+        return self._read(self._bounds)[1]
+
+    def latest(self) -> Tuple[float, Pose]:
+        (timestamp, values,) = self._read(self._latest)
+        return (timestamp, self._pose(values=values))
+
+    def at(
+        self,
+        timestamp: float,
+        out_of_range: Optional[str] = None,
+    ) -> Pose:
+        policy = Trajectory._check_policy(
+            policy=self.out_of_range if out_of_range is None else out_of_range
+        )
+        (t0, t1, v0, v1,) = self._read(lambda: self._bracket(t=timestamp))
+        if not t0 <= timestamp <= t1:
+            if policy == "raise":
+                raise ValueError(
+                    f"time {timestamp} is outside the buffered range "
+                    f"[{t0}, {t1}]."
+                )
+            if policy == "nan":
+                return self._pose(values=(math.nan,) * 7)
+        if t1 == t0:
+            return self._pose(values=v0)
+        factor = (timestamp - t0) / (t1 - t0)
+        if policy == "clamp":
+            factor = 0.0 if factor < 0.0 else 1.0 if factor > 1.0 else factor
+        return self._pose(values=v0).interpolated(
+            other=self._pose(values=v1),
+            factor=factor,
+        )
+
+    def to_trajectory(self) -> Trajectory:
+        (timestamps, translations, quaternions,) = self._read(self._copy)
+        return Trajectory(
+            timestamps=timestamps,
+            poses=PoseArray(
+                translations=PointArray(coordinates=translations),
+                rotations=RotationArray(quaternions=quaternions),
+            ),
+            out_of_range=self.out_of_range,
+        )
+
+    def _read(
+        self,
+        reader,
+    ):
+        while True:
+            sequence = self._sequence
+            if sequence & 1:
+                time.sleep(0)
+                continue
+            result = reader()
+            if self._sequence == sequence:
+                return result
+
+    def _check_count(self) -> int:
+        count = self._count
+        if not count:
+            raise ValueError("pose ring buffer is empty.")
+        return count
+
+    def _bounds(self) -> Tuple[float, float]:
+        count = self._check_count()
+        ts = self._timestamps
+        start = self._start
+        return (ts[start], ts[(start + count - 1) % self.capacity])
+
+    def _latest(self) -> Tuple[float, Tuple[float, ...]]:
+        count = self._check_count()
+        slot = (self._start + count - 1) % self.capacity
+        return (self._timestamps[slot], self._values(slot=slot))
+
+    def _bracket(
+        self,
+        t: float,
+    ) -> Tuple[float, float, Tuple[float, ...], Tuple[float, ...]]:
+        count = self._check_count()
+        ts = self._timestamps
+        start = self._start
+        capacity = self.capacity
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if ts[(start + mid) % capacity] <= t:
+                lo = mid + 1
+            else:
+                hi = mid
+        i = min(max(lo - 1, 0), max(count - 2, 0))
+        s0 = (start + i) % capacity
+        s1 = (start + min(i + 1, count - 1)) % capacity
+        return (ts[s0], ts[s1], self._values(slot=s0), self._values(slot=s1))
+
+    def _copy(self) -> Tuple[array, array, array]:
+        count = self._count
+        start = self._start
+        stop = start + count
+        capacity = self.capacity
+        if stop <= capacity:
+            return (
+                self._timestamps[start:stop],
+                self._translations[3*start:3*stop],
+                self._quaternions[4*start:4*stop],
+            )
+        stop -= capacity
+        return (
+            self._timestamps[start:] + self._timestamps[:stop],
+            self._translations[3*start:] + self._translations[:3*stop],
+            self._quaternions[4*start:] + self._quaternions[:4*stop],
+        )
+
+    def _values(
+        self,
+        slot: int,
+    ) -> Tuple[float, ...]:
+        t = self._translations
+        q = self._quaternions
+        return (
+            t[3*slot], t[3*slot + 1], t[3*slot + 2],
+            q[4*slot], q[4*slot + 1], q[4*slot + 2], q[4*slot + 3],
+        )
+
+    @staticmethod
+    def _pose(
+        values: Tuple[float, ...],
+    ) -> Pose:
+        (x, y, z, w, qx, qy, qz,) = values
+        return Pose(
+            translation=Translation._unchecked(x, y, z),
+            rotation=Rotation(
+                rotation=Quaternion._unchecked(w, qx, qy, qz),
+            ),
+        )
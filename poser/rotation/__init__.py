@@ -1 +1,2 @@
 from .rotation import Rotation
+from .rotation_array import RotationArray
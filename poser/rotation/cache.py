@@ -0,0 +1,202 @@
+from collections import OrderedDict
+from functools import partial
+from operator import attrgetter
+from threading import Lock
+from typing import Callable, Dict, Tuple, Union
+import struct
+
+from . import representations
+from . import converter
+from .. import patching
+
+
+Matrix = representations.Matrix
+Quaternion = representations.Quaternion
+OPKDeg = representations.OPKDeg
+
+Converter = converter.Converter
+
+
+MATRIX_FIELDS = ("r11", "r12", "r13", "r21", "r22", "r23", "r31", "r32", "r33")
+QUATERNION_FIELDS = ("w", "x", "y", "z")
+OPK_DEG_FIELDS = ("omega", "phi", "kappa")
+
+OWNER = __name__
+
+CACHED_METHODS = {
+    "matrix_to_opk_deg": ("matrix", MATRIX_FIELDS, OPKDeg, OPK_DEG_FIELDS),
+    "opk_deg_to_matrix": ("opk_deg", OPK_DEG_FIELDS, Matrix, MATRIX_FIELDS),
+    "matrix_to_quaternion": (
+        "matrix", MATRIX_FIELDS, Quaternion, QUATERNION_FIELDS,
+    ),
+    "quaternion_to_matrix": (
+        "quaternion", QUATERNION_FIELDS, Matrix, MATRIX_FIELDS,
+    ),
+}
+
+
+class ConversionCache(object):
+    def __init__(
+        self,
+        capacity: int = 4096,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be positive.")
+        self._capacity = capacity
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be positive.")
+        with self._lock:
+            self._capacity = capacity
+            self._evict()
+
+    def get(
+        self,
+        key: Tuple[str, bytes],
+        compute: Callable[[], tuple],
+    ) -> tuple:
+        entries = self._entries
+        with self._lock:
+            value = entries.get(key)
+            if value is not None:
+                entries.move_to_end(key)
+                self.hits += 1
+                return value
+            self.misses += 1
+        value = compute()
+        with self._lock:
+            entries[key] = value
+            self._evict()
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "capacity": self._capacity,
+            }
+
+    def _evict(self) -> None:
+        while len(self._entries) > self._capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+_lock = Lock()
+_cache = None
+
+
+def enable(
+    capacity: int = 4096,
+) -> ConversionCache:
+    global _cache
+    with _lock:
+        if _cache is not None:
+            _cache.capacity = capacity
+            return _cache
+        _cache = ConversionCache(capacity=capacity)
+        for name, layout in CACHED_METHODS.items():
+            patching.install(
+                cls=Converter,
+                name=name,
+                owner=OWNER,
+                wrap=partial(
+                    _wrapped, name=name, layout=layout, cache=_cache,
+                ),
+            )
+        return _cache
+
+
+def disable() -> None:
+    global _cache
+    with _lock:
+        patching.uninstall(owner=OWNER)
+        _cache = None
+
+
+def is_enabled() -> bool:
+    return _cache is not None
+
+
+def stats() -> Dict[str, Union[int, bool]]:
+    cache = _cache
+    if cache is None:
+        return {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "size": 0,
+            "capacity": 0,
+            "enabled": False,
+        }
+    return dict(cache.stats(), enabled=True)
+
+
+def clear() -> None:
+    cache = _cache
+    if cache is not None:
+        cache.clear()
+
+
+def _wrapped(
+    attribute: staticmethod,
+    name: str,
+    layout: tuple,
+    cache: ConversionCache,
+) -> staticmethod:
+    return staticmethod(
+        _cached(
+            name=name,
+            original=attribute.__func__,
+            layout=layout,
+            cache=cache,
+        )
+    )
+
+
+def _cached(
+    name: str,
+    original: Callable,
+    layout: tuple,
+    cache: ConversionCache,
+) -> Callable:
+    (parameter, source_fields, result_type, result_fields,) = layout
+    source = attrgetter(*source_fields)
+    result = attrgetter(*result_fields)
+    pack = struct.Struct(f"<{len(source_fields)}d").pack
+
+    def method(*args, **kwargs):
+        value = args[0] if args else kwargs[parameter]
+        values = cache.get(
+            key=(name, pack(*source(value))),
+            compute=lambda: result(original(value)),
+        )
+        return result_type._unchecked(*values)
+
+    method.__name__ = name
+    method.__doc__ = original.__doc__
+    return method
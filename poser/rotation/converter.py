@@ -1,5 +1,9 @@
+from array import array
+from typing import Sequence, Tuple, Union
 import math
 
+import poser.buffers
+
 from . import representations
 
 
@@ -7,6 +11,11 @@ Matrix = representations.Matrix
 Quaternion = representations.Quaternion
 OPKDeg = representations.OPKDeg
 
+as_float_buffer = poser.buffers.as_float_buffer
+as_float_array = poser.buffers.as_float_array
+np = poser.buffers.np
+FloatArray = poser.buffers.FloatArray
+
 
 class Converter(object):
     @staticmethod
@@ -17,12 +26,12 @@ class Converter(object):
         phi = math.atan2(m.r13, (m.r23**2 + m.r33**2)**0.5)
 
         if not -1e-10 < math.cos(phi) < 1e-10:
-            return OPKDeg(
+            return OPKDeg._unchecked(
                 omega=math.degrees(math.atan2(-m.r23, m.r33)),
                 phi=math.degrees(phi),
                 kappa=math.degrees(math.atan2(-m.r12, m.r11))
             )
-        return OPKDeg(
+        return OPKDeg._unchecked(
             omega=0.0,
             phi=math.degrees(phi),
             kappa=math.degrees(
@@ -43,7 +52,7 @@ class Converter(object):
             math.cos(math.radians(a))
             for a in (opk_deg.omega, opk_deg.phi, opk_deg.kappa)
         )
-        return Matrix(
+        return Matrix._unchecked(
             r11=cp*ck,
             r12=-cp*sk,
             r13=sp,
@@ -64,7 +73,7 @@ class Converter(object):
         if t > 0.0:
             d = (t + 1)**0.5
             f = 0.5 / d
-            return Quaternion(
+            return Quaternion._unchecked(
                 w=0.5 * d,
                 x=(m[2][1] - m[1][2]) * f,
                 y=(m[0][2] - m[2][0]) * f,
@@ -89,7 +98,7 @@ class Converter(object):
         q[j] = (m[j][i] + m[i][j]) * f
         q[k] = (m[k][i] + m[i][k]) * f
 
-        return Quaternion(
+        return Quaternion._unchecked(
             w=q[3], x=q[0], y=q[1], z=q[2],
         )
     
@@ -102,7 +111,7 @@ class Converter(object):
         wx2, wy2, wz2 = w*x*2, w*y*2, w*z*2
         xx2, xy2, xz2 = x*x*2, x*y*2, x*z*2
         yy2, yz2, zz2 = y*y*2, y*z*2, z*z*2
-        return Matrix(
+        return Matrix._unchecked(
             r11=1 - yy2 - zz2,
             r12=xy2 - wz2,
             r13=xz2 + wy2,
@@ -110,6 +119,333 @@ class Converter(object):
             r22=1 - xx2 - zz2,
             r23=yz2 - wx2,
             r31=xz2 - wy2,
-            r32=yz2 + wy2,
+            r32=yz2 + wx2,
             r33=1 - xx2 - yy2,
         )
+
+    # Batch results are flat and row-major: 9 values per matrix, 4 per
+    # quaternion (w, x, y, z) and 3 per OPK triple. Pass shaped=True to get
+    # (N, 3, 3), (N, 4) or (N, 3) arrays instead (requires numpy).
+    @staticmethod
+    def matrix_to_opk_deg_batch(
+        matrices: Union[Sequence[float], Sequence[Sequence[float]]],
+        shaped: bool = False,
+    ) -> FloatArray:
+        if np is not None:
+            return Converter._shaped(
+                values=Converter._matrix_to_opk_deg_numpy(
+                    m=as_float_array(values=matrices).reshape(-1, 9),
+                ),
+                shape=(3,),
+                shaped=shaped,
+            )
+        atan2, cos, degrees = math.atan2, math.cos, math.degrees
+        half_pi = math.pi*0.5
+        m = as_float_buffer(values=matrices)
+        opk_degs = array("d", bytes(8 * (len(m) // 9 * 3)))
+        for i, j in zip(range(0, len(m), 9), range(0, len(opk_degs), 3)):
+            r11, r12, r13 = m[i], m[i + 1], m[i + 2]
+            r22, r23 = m[i + 4], m[i + 5]
+            r32, r33 = m[i + 7], m[i + 8]
+            phi = atan2(r13, (r23**2 + r33**2)**0.5)
+            opk_degs[j + 1] = degrees(phi)
+            if not -1e-10 < cos(phi) < 1e-10:
+                opk_degs[j] = degrees(atan2(-r23, r33))
+                opk_degs[j + 2] = degrees(atan2(-r12, r11))
+            else:
+                opk_degs[j + 2] = degrees(
+                    atan2(r32, r22) if phi == half_pi
+                    else atan2(-r32, r22)
+                )
+        return Converter._shaped(
+            values=opk_degs,
+            shape=(3,),
+            shaped=shaped,
+        )
+
+    @staticmethod
+    def opk_deg_to_matrix_batch(
+        opk_degs: Union[Sequence[float], Sequence[Sequence[float]]],
+        shaped: bool = False,
+    ) -> FloatArray:
+        if np is not None:
+            return Converter._shaped(
+                values=Converter._opk_deg_to_matrix_numpy(
+                    a=as_float_array(values=opk_degs).reshape(-1, 3),
+                ),
+                shape=(3, 3,),
+                shaped=shaped,
+            )
+        sin, cos, radians = math.sin, math.cos, math.radians
+        a = as_float_buffer(values=opk_degs)
+        matrices = array("d", bytes(8 * (len(a) // 3 * 9)))
+        for i, j in zip(range(0, len(a), 3), range(0, len(matrices), 9)):
+            o, p, k = radians(a[i]), radians(a[i + 1]), radians(a[i + 2])
+            so, sp, sk = sin(o), sin(p), sin(k)
+            co, cp, ck = cos(o), cos(p), cos(k)
+            matrices[j:j + 9] = array(
+                "d",
+                (
+                    cp*ck,
+                    -cp*sk,
+                    sp,
+                    co*sk + so*sp*ck,
+                    co*ck - so*sp*sk,
+                    -so*cp,
+                    so*sk - co*sp*ck,
+                    so*ck + co*sp*sk,
+                    co*cp,
+                ),
+            )
+        return Converter._shaped(
+            values=matrices,
+            shape=(3, 3,),
+            shaped=shaped,
+        )
+
+    @staticmethod
+    def matrix_to_quaternion_batch(
+        matrices: Union[Sequence[float], Sequence[Sequence[float]]],
+        shaped: bool = False,
+    ) -> FloatArray:
+        if np is not None:
+            return Converter._shaped(
+                values=Converter._matrix_to_quaternion_numpy(
+                    m=as_float_array(values=matrices).reshape(-1, 9),
+                ),
+                shape=(4,),
+                shaped=shaped,
+            )
+        m = as_float_buffer(values=matrices)
+        quaternions = array("d", bytes(8 * (len(m) // 9 * 4)))
+        for i, j in zip(range(0, len(m), 9), range(0, len(quaternions), 4)):
+            (m11, m12, m13, m21, m22, m23, m31, m32, m33) = m[i:i + 9]
+            t = m11 + m22 + m33
+            if t > 0.0:
+                d = (t + 1)**0.5
+                f = 0.5 / d
+                quaternions[j] = 0.5 * d
+                quaternions[j + 1] = (m32 - m23) * f
+                quaternions[j + 2] = (m13 - m31) * f
+                quaternions[j + 3] = (m21 - m12) * f
+            elif m11 >= m22 and m11 >= m33:
+                d = (m11 - m22 - m33 + 1)**0.5
+                f = 0.5 / d
+                quaternions[j] = (m32 - m23) * f
+                quaternions[j + 1] = 0.5 * d
+                quaternions[j + 2] = (m21 + m12) * f
+                quaternions[j + 3] = (m31 + m13) * f
+            elif m22 >= m33:
+                d = (m22 - m33 - m11 + 1)**0.5
+                f = 0.5 / d
+                quaternions[j] = (m13 - m31) * f
+                quaternions[j + 1] = (m21 + m12) * f
+                quaternions[j + 2] = 0.5 * d
+                quaternions[j + 3] = (m32 + m23) * f
+            else:
+                d = (m33 - m11 - m22 + 1)**0.5
+                f = 0.5 / d
+                quaternions[j] = (m21 - m12) * f
+                quaternions[j + 1] = (m31 + m13) * f
+                quaternions[j + 2] = (m32 + m23) * f
+                quaternions[j + 3] = 0.5 * d
+        return Converter._shaped(
+            values=quaternions,
+            shape=(4,),
+            shaped=shaped,
+        )
+
+    @staticmethod
+    def quaternion_to_matrix_batch(
+        quaternions: Union[Sequence[float], Sequence[Sequence[float]]],
+        shaped: bool = False,
+    ) -> FloatArray:
+        if np is not None:
+            return Converter._shaped(
+                values=Converter._quaternion_to_matrix_numpy(
+                    q=as_float_array(values=quaternions).reshape(-1, 4),
+                ),
+                shape=(3, 3,),
+                shaped=shaped,
+            )
+        q = as_float_buffer(values=quaternions)
+        matrices = array("d", bytes(8 * (len(q) // 4 * 9)))
+        for i, j in zip(range(0, len(q), 4), range(0, len(matrices), 9)):
+            w, x, y, z = q[i], q[i + 1], q[i + 2], q[i + 3]
+            norm = (w*w + x*x + y*y + z*z)**0.5
+            if norm == 0.0:
+                raise ValueError("cannot convert a zero quaternion.")
+            if norm != 1.0:
+                w, x, y, z = w/norm, x/norm, y/norm, z/norm
+            wx2, wy2, wz2 = w*x*2, w*y*2, w*z*2
+            xx2, xy2, xz2 = x*x*2, x*y*2, x*z*2
+            yy2, yz2, zz2 = y*y*2, y*z*2, z*z*2
+            matrices[j:j + 9] = array(
+                "d",
+                (
+                    1 - yy2 - zz2,
+                    xy2 - wz2,
+                    xz2 + wy2,
+                    xy2 + wz2,
+                    1 - xx2 - zz2,
+                    yz2 - wx2,
+                    xz2 - wy2,
+                    yz2 + wx2,
+                    1 - xx2 - yy2,
+                ),
+            )
+        return Converter._shaped(
+            values=matrices,
+            shape=(3, 3,),
+            shaped=shaped,
+        )
+
+    @staticmethod
+    def opk_deg_to_quaternion_batch(
+        opk_degs: Union[Sequence[float], Sequence[Sequence[float]]],
+        shaped: bool = False,
+    ) -> FloatArray:
+        return Converter.matrix_to_quaternion_batch(
+            matrices=Converter.opk_deg_to_matrix_batch(
+                opk_degs=opk_degs,
+            ),
+            shaped=shaped,
+        )
+
+    @staticmethod
+    def quaternion_to_opk_deg_batch(
+        quaternions: Union[Sequence[float], Sequence[Sequence[float]]],
+        shaped: bool = False,
+    ) -> FloatArray:
+        return Converter.matrix_to_opk_deg_batch(
+            matrices=Converter.quaternion_to_matrix_batch(
+                quaternions=quaternions,
+            ),
+            shaped=shaped,
+        )
+
+    @staticmethod
+    def _shaped(
+        values: FloatArray,
+        shape: Tuple[int, ...],
+        shaped: bool,
+    ) -> FloatArray:
+        if not shaped:
+            return values
+        if np is None:
+            raise ImportError("shaped batch output requires numpy.")
+        return values.reshape(-1, *shape)
+
+    @staticmethod
+    def _matrix_to_opk_deg_numpy(
+        m: "np.ndarray",
+    ) -> "np.ndarray":
+        (r11, r12, r13, _, r22, r23, _, r32, r33,) = m.T
+        phi = np.arctan2(r13, np.sqrt(r23*r23 + r33*r33))
+        cos_phi = np.cos(phi)
+        regular = (cos_phi <= -1e-10) | (cos_phi >= 1e-10)
+        opk_degs = np.empty((len(m), 3))
+        opk_degs[:, 0] = np.where(regular, np.arctan2(-r23, r33), 0.0)
+        opk_degs[:, 1] = phi
+        opk_degs[:, 2] = np.where(
+            regular,
+            np.arctan2(-r12, r11),
+            np.where(
+                phi == math.pi*0.5,
+                np.arctan2(r32, r22),
+                np.arctan2(-r32, r22),
+            ),
+        )
+        return np.degrees(opk_degs, out=opk_degs).reshape(-1)
+
+    @staticmethod
+    def _opk_deg_to_matrix_numpy(
+        a: "np.ndarray",
+    ) -> "np.ndarray":
+        (o, p, k,) = np.radians(a).T
+        so, sp, sk = np.sin(o), np.sin(p), np.sin(k)
+        co, cp, ck = np.cos(o), np.cos(p), np.cos(k)
+        return np.stack(
+            (
+                cp*ck,
+                -cp*sk,
+                sp,
+                co*sk + so*sp*ck,
+                co*ck - so*sp*sk,
+                -so*cp,
+                so*sk - co*sp*ck,
+                so*ck + co*sp*sk,
+                co*cp,
+            ),
+            axis=1,
+        ).reshape(-1)
+
+    @staticmethod
+    def _matrix_to_quaternion_numpy(
+        m: "np.ndarray",
+    ) -> "np.ndarray":
+        (m11, m12, m13, m21, m22, m23, m31, m32, m33,) = m.T
+        t = m11 + m22 + m33
+        branches = [
+            t > 0.0,
+            (m11 >= m22) & (m11 >= m33),
+            m22 >= m33,
+        ]
+        d = np.sqrt(
+            np.select(
+                branches,
+                [t + 1, m11 - m22 - m33 + 1, m22 - m33 - m11 + 1],
+                m33 - m11 - m22 + 1,
+            )
+        )
+        half = 0.5 * d
+        f = 0.5 / d
+        quaternions = np.empty((len(m), 4))
+        quaternions[:, 0] = np.select(
+            branches,
+            [half, (m32 - m23) * f, (m13 - m31) * f],
+            (m21 - m12) * f,
+        )
+        quaternions[:, 1] = np.select(
+            branches,
+            [(m32 - m23) * f, half, (m21 + m12) * f],
+            (m31 + m13) * f,
+        )
+        quaternions[:, 2] = np.select(
+            branches,
+            [(m13 - m31) * f, (m21 + m12) * f, half],
+            (m32 + m23) * f,
+        )
+        quaternions[:, 3] = np.select(
+            branches,
+            [(m21 - m12) * f, (m31 + m13) * f, (m32 + m23) * f],
+            half,
+        )
+        return quaternions.reshape(-1)
+
+    @staticmethod
+    def _quaternion_to_matrix_numpy(
+        q: "np.ndarray",
+    ) -> "np.ndarray":
+        norms = np.sqrt(np.einsum("ij,ij->i", q, q))
+        if not norms.all():
+            raise ValueError("cannot convert a zero quaternion.")
+        q = q / norms[:, None]
+        (w, x, y, z,) = q.T
+        wx2, wy2, wz2 = w*x*2, w*y*2, w*z*2
+        xx2, xy2, xz2 = x*x*2, x*y*2, x*z*2
+        yy2, yz2, zz2 = y*y*2, y*z*2, z*z*2
+        return np.stack(
+            (
+                1 - yy2 - zz2,
+                xy2 - wz2,
+                xz2 + wy2,
+                xy2 + wz2,
+                1 - xx2 - zz2,
+                yz2 - wx2,
+                xz2 - wy2,
+                yz2 + wx2,
+                1 - xx2 - yy2,
+            ),
+            axis=1,
+        ).reshape(-1)
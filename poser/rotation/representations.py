@@ -1,15 +1,18 @@
-from typing import Tuple, List, Union
+from array import array
+from typing import Tuple, List, Union, Iterable, Iterator
 from dataclasses import dataclass
 import math
 
 import poser
+import poser.streaming
 
 
 Point = poser.point.Point
 Translation = poser.translation.Translation
+PointArray = poser.point_array.PointArray
 
 
-@dataclass
+@dataclass(slots=True)
 class Matrix(object):
     r11: float = 1.0
     r12: float = 0.0
@@ -40,11 +43,36 @@ class Matrix(object):
             self.r32 = float(self.r32)
         if not isinstance(self.r33, float):
             self.r33 = float(self.r33) 
+
+    @classmethod
+    def _unchecked(
+        cls,
+        r11: float,
+        r12: float,
+        r13: float,
+        r21: float,
+        r22: float,
+        r23: float,
+        r31: float,
+        r32: float,
+        r33: float,
+    ) -> "Matrix":
+        matrix = object.__new__(cls)
+        matrix.r11 = r11
+        matrix.r12 = r12
+        matrix.r13 = r13
+        matrix.r21 = r21
+        matrix.r22 = r22
+        matrix.r23 = r23
+        matrix.r31 = r31
+        matrix.r32 = r32
+        matrix.r33 = r33
+        return matrix
     
     def __invert__(
         self,
     ) -> "Matrix":
-        return Matrix(
+        return Matrix._unchecked(
             r11=self.r11,
             r12=self.r21,
             r13=self.r31,
@@ -70,7 +98,7 @@ class Matrix(object):
             (b21, b22, b23,),
             (b31, b32, b33,),
         ) = other.as_tuple
-        return Matrix(
+        return Matrix._unchecked(
             r11=a11*b11 + a12*b21 + a13*b31,
             r12=a11*b12 + a12*b22 + a13*b32,
             r13=a11*b13 + a12*b23 + a13*b33,
@@ -155,8 +183,11 @@ class Matrix(object):
     
     def transform_points(
         self,
-        points: Union[list, tuple],
+        points: Union[list, tuple, PointArray],
     ) -> None:
+        if isinstance(points, PointArray):
+            points._transform(rotation=self.as_tuple)
+            return
         (
             (r11, r12, r13,),
             (r21, r22, r23,),
@@ -187,7 +218,7 @@ class Matrix(object):
         point: Union[Point, Translation]
     ) -> Union[Point, Translation]:
         if isinstance(point, Translation):
-            return Translation(
+            return Translation._unchecked(
                 *self._rotate(
                     x=point.x,
                     y=point.y,
@@ -204,7 +235,7 @@ class Matrix(object):
                 )
             )
         elif isinstance(point, Point):
-            return Point(
+            return Point._unchecked(
                 *self._rotate(
                     x=point.x,
                     y=point.y,
@@ -227,8 +258,17 @@ class Matrix(object):
         
     def transformed_points(
         self,
-        points: Union[list, tuple]
-    ) -> Union[list, tuple]:
+        points: Union[list, tuple, PointArray],
+        out: Union[list, PointArray, array, memoryview, None] = None,
+    ) -> Union[list, tuple, PointArray, array, memoryview]:
+        if out is not None:
+            return PointArray._transformed_into(
+                points=points,
+                out=out,
+                rotation=self.as_tuple,
+            )
+        if isinstance(points, PointArray):
+            return points._transformed(rotation=self.as_tuple)
         (
             (r11, r12, r13,),
             (r21, r22, r23,),
@@ -236,7 +276,7 @@ class Matrix(object):
         ) = self.as_tuple
         if isinstance(points, tuple):
             return tuple(
-                Translation(
+                Translation._unchecked(
                     *self._rotate(
                         x=point.x,
                         y=point.y,
@@ -252,7 +292,7 @@ class Matrix(object):
                         r33=r33,
                     )
                 ) if isinstance(point, Translation) else
-                Point(
+                Point._unchecked(
                     *self._rotate(
                         x=point.x,
                         y=point.y,
@@ -273,7 +313,7 @@ class Matrix(object):
             )
         elif isinstance(points, list):
             return [
-                Translation(
+                Translation._unchecked(
                     *self._rotate(
                         x=point.x,
                         y=point.y,
@@ -289,7 +329,7 @@ class Matrix(object):
                         r33=r33,
                     )
                 ) if isinstance(point, Translation) else
-                Point(
+                Point._unchecked(
                     *self._rotate(
                         x=point.x,
                         y=point.y,
@@ -309,6 +349,17 @@ class Matrix(object):
                 if (isinstance(point, Point) or isinstance(point, Translation))
             ]
 
+    def transform_iter(
+        self,
+        points: Iterable,
+        chunk_size: int = 1024,
+    ) -> Iterator[Union[list, PointArray, array]]:
+        return poser.streaming.transform_iter(
+            points=points,
+            rotation=self.as_tuple,
+            chunk_size=chunk_size,
+        )
+
     @staticmethod
     def _rotate(
         x: float, 
@@ -331,7 +382,7 @@ class Matrix(object):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Quaternion(object):
     w: float = 1.0
     x: float = 0.0
@@ -348,13 +399,28 @@ class Quaternion(object):
         if not isinstance(self.z, float):
             self.z = float(self.z)
 
+    @classmethod
+    def _unchecked(
+        cls,
+        w: float,
+        x: float,
+        y: float,
+        z: float,
+    ) -> "Quaternion":
+        quaternion = object.__new__(cls)
+        quaternion.w = w
+        quaternion.x = x
+        quaternion.y = y
+        quaternion.z = z
+        return quaternion
+
     def __abs__(self) -> float:
         w, x, y, z = self.w, self.x, self.y, self.z
         return (w*w + x*x + y*y + z*z)**0.5
     
     def __invert__(self) -> "Quaternion":
         self.normalize()
-        return Quaternion(
+        return Quaternion._unchecked(
             w=self.w,
             x=-self.x,
             y=-self.y,
@@ -369,7 +435,7 @@ class Quaternion(object):
         other.normalize()
         w1, x1, y1, z1 = self.w, self.x, self.y, self.z
         w2, x2, y2, z2 = other.w, other.x, other.y, other.z
-        return Quaternion(
+        return Quaternion._unchecked(
             w=w1*w2 - x1*x2 - y1*y2 - z1*z2,
             x=w1*x2 + x1*w2 + y1*z2 - z1*y2,
             y=w1*y2 - x1*z2 + y1*w2 + z1*x2,
@@ -389,7 +455,7 @@ class Quaternion(object):
         norm = abs(self)
         if norm == 1.0:
             return self
-        return Quaternion(
+        return Quaternion._unchecked(
             w=self.w/norm,
             x=self.x/norm,
             y=self.y/norm,
@@ -401,26 +467,75 @@ class Quaternion(object):
         other: "Quaternion",
         factor: float,
     ) -> "Quaternion":
-        self.normalize()
-        other.normalize()
-        w1, x1, y1, z1 = self.w, self.x, self.y, self.z
-        w2, x2, y2, z2 = other.w, other.x, other.y, other.z
-        
-        omega = math.acos(w1*w2 + x1*x2 + y1*y2 + z1*z2)
+        return Quaternion._unchecked(
+            *self._slerp(
+                q1=(self.w, self.x, self.y, self.z,),
+                q2=(other.w, other.x, other.y, other.z,),
+                factors=(factor,),
+            )
+        )
+
+    def interpolated_many(
+        self,
+        other: "Quaternion",
+        factors: Iterable[float],
+    ) -> List["Quaternion"]:
+        q = self._slerp(
+            q1=(self.w, self.x, self.y, self.z,),
+            q2=(other.w, other.x, other.y, other.z,),
+            factors=factors,
+        )
+        return [
+            Quaternion._unchecked(q[i], q[i + 1], q[i + 2], q[i + 3])
+            for i in range(0, len(q), 4)
+        ]
+
+    @staticmethod
+    def _slerp(
+        q1: Tuple[float],
+        q2: Tuple[float],
+        factors: Iterable[float],
+    ) -> array:
+        (w1, x1, y1, z1,) = q1
+        (w2, x2, y2, z2,) = q2
+        norm1 = (w1*w1 + x1*x1 + y1*y1 + z1*z1)**0.5
+        norm2 = (w2*w2 + x2*x2 + y2*y2 + z2*z2)**0.5
+        if norm1 == 0.0 or norm2 == 0.0:
+            raise ValueError("cannot interpolate a zero quaternion.")
+        w1, x1, y1, z1 = w1/norm1, x1/norm1, y1/norm1, z1/norm1
+        w2, x2, y2, z2 = w2/norm2, x2/norm2, y2/norm2, z2/norm2
+        dot = w1*w2 + x1*x2 + y1*y2 + z1*z2
+        if dot < 0.0:
+            dot = -dot
+            w2, x2, y2, z2 = -w2, -x2, -y2, -z2
+        result = array("d")
+        extend = result.extend
+        if dot > 1.0 - 1e-6:
+            dw, dx, dy, dz = w2 - w1, x2 - x1, y2 - y1, z2 - z1
+            for f in factors:
+                w = w1 + f*dw
+                x = x1 + f*dx
+                y = y1 + f*dy
+                z = z1 + f*dz
+                norm = (w*w + x*x + y*y + z*z)**0.5
+                extend((w/norm, x/norm, y/norm, z/norm,))
+            return result
+        omega = math.acos(dot)
         sin_omega = math.sin(omega)
-        
-        f1 = math.sin((1 - factor)*omega) / sin_omega
-        f2 = math.sin(factor*omega) / sin_omega
-        
-        return Quaternion(
-            w=f1*w1 + f2*w2,
-            x=f1*x1 + f2*x2,
-            y=f1*y1 + f2*y2,
-            z=f1*z1 + f2*z2,
-        ) 
+        sin = math.sin
+        for f in factors:
+            f1 = sin((1.0 - f)*omega) / sin_omega
+            f2 = sin(f*omega) / sin_omega
+            extend((
+                f1*w1 + f2*w2,
+                f1*x1 + f2*x2,
+                f1*y1 + f2*y2,
+                f1*z1 + f2*z2,
+            ))
+        return result
 
 
-@dataclass
+@dataclass(slots=True)
 class OPKDeg(object):
     omega: float = 0.0
     phi: float = 0.0
@@ -433,3 +548,16 @@ class OPKDeg(object):
             self.phi = float(self.phi)
         if not isinstance(self.kappa, float):
             self.kappa = float(self.kappa)
+
+    @classmethod
+    def _unchecked(
+        cls,
+        omega: float,
+        phi: float,
+        kappa: float,
+    ) -> "OPKDeg":
+        opk_deg = object.__new__(cls)
+        opk_deg.omega = omega
+        opk_deg.phi = phi
+        opk_deg.kappa = kappa
+        return opk_deg
@@ -1,7 +1,9 @@
-from dataclasses import dataclass
-from typing import Union, Tuple, List
+from array import array
+from typing import Union, Tuple, List, Iterable, Iterator, Sequence
 
 import poser
+import poser.lie
+import poser.streaming
 
 from . import representations
 from . import converter
@@ -9,6 +11,7 @@ from . import converter
 
 Point = poser.point.Point
 Translation = poser.translation.Translation
+PointArray = poser.point_array.PointArray
 
 Matrix = representations.Matrix
 Quaternion = representations.Quaternion
@@ -17,30 +20,56 @@ OPKDeg = representations.OPKDeg
 Converter = converter.Converter
 
 
-@dataclass(init=False)
 class Rotation(object):
-    quaternion: Quaternion = None
-    matrix: Matrix = None
-    opk_deg: OPKDeg = None
+    __slots__ = ("_quaternion", "_matrix", "_opk_deg", "_version",)
 
     def __init__(
         self,
-        rotation: Union[Quaternion, Matrix, OPKDeg] = Quaternion()
+        rotation: Union[Quaternion, Matrix, OPKDeg, None] = None,
     ) -> None:
+        self._version = 0
+        if rotation is None:
+            rotation = Quaternion()
         if isinstance(rotation, Quaternion):
             self.quaternion = rotation
-            self._update_from_quaternion()
         elif isinstance(rotation, Matrix):
             self.matrix = rotation
-            self._update_from_matrix()
         elif isinstance(rotation, OPKDeg):
             self.opk_deg = rotation
-            self._update_from_opk_deg()
         else:
             raise TypeError(
                 f"rotation has an unsupported type: "
                 f"{type(rotation)}"
             )
+
+    @classmethod
+    def _unchecked(
+        cls,
+        quaternion: Quaternion,
+        matrix: Matrix,
+    ) -> "Rotation":
+        rotation = object.__new__(cls)
+        rotation._quaternion = quaternion
+        rotation._matrix = matrix
+        rotation._opk_deg = None
+        rotation._version = 0
+        return rotation
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"quaternion={self.quaternion!r}, "
+            f"matrix={self.matrix!r}, "
+            f"opk_deg={self.opk_deg!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            (self.quaternion, self.matrix, self.opk_deg,)
+            == (other.quaternion, other.matrix, other.opk_deg,)
+        )
     
     def __invert__(
         self,
@@ -53,10 +82,56 @@ class Rotation(object):
         self,
         other: "Rotation",
     ) -> "Rotation":
+        if not isinstance(other, Rotation):
+            return NotImplemented
         return Rotation(
             rotation=self.quaternion * other.quaternion
         )
         
+    @property
+    def quaternion(self) -> Quaternion:
+        if self._quaternion is None:
+            self._quaternion = Converter.matrix_to_quaternion(
+                matrix=self.matrix,
+            )
+        return self._quaternion
+
+    @quaternion.setter
+    def quaternion(self, quaternion: Quaternion) -> None:
+        self._quaternion = quaternion
+        self._update_from_quaternion()
+
+    @property
+    def matrix(self) -> Matrix:
+        if self._matrix is None:
+            if self._quaternion is not None:
+                self._matrix = Converter.quaternion_to_matrix(
+                    quaternion=self._quaternion,
+                )
+            else:
+                self._matrix = Converter.opk_deg_to_matrix(
+                    opk_deg=self._opk_deg,
+                )
+        return self._matrix
+
+    @matrix.setter
+    def matrix(self, matrix: Matrix) -> None:
+        self._matrix = matrix
+        self._update_from_matrix()
+
+    @property
+    def opk_deg(self) -> OPKDeg:
+        if self._opk_deg is None:
+            self._opk_deg = Converter.matrix_to_opk_deg(
+                matrix=self.matrix,
+            )
+        return self._opk_deg
+
+    @opk_deg.setter
+    def opk_deg(self, opk_deg: OPKDeg) -> None:
+        self._opk_deg = opk_deg
+        self._update_from_opk_deg()
+
     @property
     def as_tuple(self) -> Tuple[Tuple[float]]:
         return self.matrix.as_tuple
@@ -87,6 +162,51 @@ class Rotation(object):
             )
         )
     
+    def interpolated_many(
+        self,
+        other: "Rotation",
+        factors: Iterable[float],
+    ) -> "poser.RotationArray":
+        q1 = self.quaternion
+        q2 = other.quaternion
+        return poser.rotation.rotation_array.RotationArray(
+            quaternions=Quaternion._slerp(
+                q1=(q1.w, q1.x, q1.y, q1.z,),
+                q2=(q2.w, q2.x, q2.y, q2.z,),
+                factors=factors,
+            )
+        )
+
+    @classmethod
+    def exp(
+        cls,
+        vector: Sequence[float],
+    ) -> "Rotation":
+        return cls(
+            rotation=Quaternion._unchecked(*poser.lie.so3_exp(vector=vector))
+        )
+
+    def log(self) -> Tuple[float, float, float]:
+        q = self.quaternion
+        return poser.lie.so3_log(quaternion=(q.w, q.x, q.y, q.z,))
+
+    def adjoint(self) -> Tuple[Tuple[float]]:
+        return self.as_tuple
+
+    @staticmethod
+    def left_jacobian(
+        vector: Sequence[float],
+        inverse: bool = False,
+    ) -> Tuple[Tuple[float]]:
+        return poser.lie.so3_left_jacobian(vector=vector, inverse=inverse)
+
+    @staticmethod
+    def right_jacobian(
+        vector: Sequence[float],
+        inverse: bool = False,
+    ) -> Tuple[Tuple[float]]:
+        return poser.lie.so3_right_jacobian(vector=vector, inverse=inverse)
+
     def transform_point(
         self,
         point: Union[Point, Translation]
@@ -95,7 +215,7 @@ class Rotation(object):
 
     def transform_points(
         self,
-        points: Union[list, tuple],
+        points: Union[list, tuple, PointArray],
     ) -> None:
         self.matrix.transform_points(points=points)
 
@@ -107,31 +227,33 @@ class Rotation(object):
     
     def transformed_points(
         self,
-        points: Union[list, tuple],
-    ) -> Union[list, tuple]:
-        return self.matrix.transformed_points(points=points)
+        points: Union[list, tuple, PointArray],
+        out: Union[list, PointArray, array, memoryview, None] = None,
+    ) -> Union[list, tuple, PointArray, array, memoryview]:
+        return self.matrix.transformed_points(points=points, out=out)
         
-    def _update_from_quaternion(self):
-        self.matrix = Converter.quaternion_to_matrix(
-            quaternion=self.quaternion,
-        )
-        self.opk_deg = Converter.matrix_to_opk_deg(
-            matrix=self.matrix,
+    def transform_iter(
+        self,
+        points: Iterable,
+        chunk_size: int = 1024,
+    ) -> Iterator[Union[list, PointArray, array]]:
+        return poser.streaming.transform_iter(
+            points=points,
+            rotation=self.as_tuple,
+            chunk_size=chunk_size,
         )
 
-    def _update_from_matrix(self):
-        self.opk_deg = Converter.matrix_to_opk_deg(
-            matrix=self.matrix,
-        )
-        self.quaternion = Converter.matrix_to_quaternion(
-            matrix=self.matrix,
-        )
+    def _update_from_quaternion(self) -> None:
+        self._version += 1
+        self._matrix = None
+        self._opk_deg = None
 
-    def _update_from_opk_deg(self):
-        self.matrix = Converter.opk_deg_to_matrix(
-            opk_deg=self.opk_deg,
-        )
-        self.quaternion = Converter.matrix_to_quaternion(
-            matrix=self.matrix,
-        )
-        
\ No newline at end of file
+    def _update_from_matrix(self) -> None:
+        self._version += 1
+        self._quaternion = None
+        self._opk_deg = None
+
+    def _update_from_opk_deg(self) -> None:
+        self._version += 1
+        self._quaternion = None
+        self._matrix = None
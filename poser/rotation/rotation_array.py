@@ -0,0 +1,403 @@
+from array import array
+import math
+from typing import Union, Iterable, Iterator, Optional, Sequence
+
+import poser.buffers
+import poser.lie
+
+from . import representations
+from . import converter
+from . import rotation
+
+
+Quaternion = representations.Quaternion
+
+Converter = converter.Converter
+Rotation = rotation.Rotation
+
+as_float_buffer = poser.buffers.as_float_buffer
+as_float_array = poser.buffers.as_float_array
+is_row_view = poser.buffers.is_row_view
+np = poser.buffers.np
+FloatArray = poser.buffers.FloatArray
+
+
+class RotationArray(object):
+    def __init__(
+        self,
+        quaternions: Optional[Union[array, memoryview, Iterable[float]]] = None,
+    ) -> None:
+        if is_row_view(values=quaternions, width=4):
+            self._quaternions = None
+            self._wxyz = quaternions
+            return
+        self.quaternions = as_float_array(values=quaternions)
+        if len(self.quaternions) % 4:
+            raise ValueError(
+                "quaternions length is not a multiple of 4."
+            )
+
+    @property
+    def quaternions(self) -> FloatArray:
+        if self._quaternions is None:
+            self._quaternions = as_float_array(values=self._wxyz)
+            self._wxyz = None
+        return self._quaternions
+
+    @quaternions.setter
+    def quaternions(self, quaternions: FloatArray) -> None:
+        self._quaternions = quaternions
+        self._wxyz = None
+
+    @classmethod
+    def identity(
+        cls,
+        length: int,
+    ) -> "RotationArray":
+        return cls(quaternions=array("d", (1.0, 0.0, 0.0, 0.0)) * length)
+
+    @classmethod
+    def from_rotations(
+        cls,
+        rotations: Iterable[Rotation],
+    ) -> "RotationArray":
+        quaternions = array("d")
+        for rotation in rotations:
+            if not isinstance(rotation, Rotation):
+                raise TypeError(
+                    "rotation is not a Rotation instance."
+                )
+            q = rotation.quaternion
+            quaternions.extend((q.w, q.x, q.y, q.z,))
+        return cls(quaternions=quaternions)
+
+    @classmethod
+    def from_matrix(
+        cls,
+        matrices: Union[Sequence[float], Sequence[Sequence[float]]],
+    ) -> "RotationArray":
+        return cls(
+            quaternions=Converter.matrix_to_quaternion_batch(
+                matrices=matrices,
+            )
+        )
+
+    @classmethod
+    def from_opk_deg(
+        cls,
+        opk_degs: Union[Sequence[float], Sequence[Sequence[float]]],
+    ) -> "RotationArray":
+        return cls(
+            quaternions=Converter.opk_deg_to_quaternion_batch(
+                opk_degs=opk_degs,
+            )
+        )
+
+    def __len__(self) -> int:
+        if self._wxyz is not None:
+            return len(self._wxyz)
+        return len(self._quaternions) // 4
+
+    @property
+    def wxyz(self) -> "np.ndarray":
+        if np is None:
+            raise ImportError("RotationArray.wxyz requires numpy.")
+        if self._wxyz is not None:
+            return self._wxyz
+        return self._quaternions.reshape(-1, 4)
+
+    def __getitem__(
+        self,
+        index: Union[int, slice],
+    ) -> Union[Rotation, "RotationArray"]:
+        if isinstance(index, slice):
+            if np is not None:
+                return RotationArray(quaternions=self.wxyz[index].copy())
+            q = self.quaternions
+            (start, stop, step,) = index.indices(len(self))
+            if step == 1:
+                return RotationArray(
+                    quaternions=array("d", q[4*start:4*max(start, stop)])
+                )
+            quaternions = array("d")
+            for i in range(start, stop, step):
+                quaternions.extend(q[4*i:4*i + 4])
+            return RotationArray(quaternions=quaternions)
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("RotationArray index out of range.")
+        q = as_float_buffer(values=self.quaternions)
+        i = 4 * index
+        return Rotation(
+            rotation=Quaternion._unchecked(
+                w=q[i], x=q[i + 1], y=q[i + 2], z=q[i + 3],
+            )
+        )
+
+    def __iter__(self) -> Iterator[Rotation]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __invert__(self) -> "RotationArray":
+        if np is not None:
+            q = self.wxyz
+            inverted = q / np.sqrt(np.einsum("ij,ij->i", q, q))[:, None]
+            inverted[:, 1:] *= -1.0
+            return RotationArray(quaternions=inverted)
+        q = self.quaternions
+        inverted = array("d", bytes(8 * len(q)))
+        for i in range(0, len(q), 4):
+            w, x, y, z = q[i], q[i + 1], q[i + 2], q[i + 3]
+            norm = (w*w + x*x + y*y + z*z)**0.5
+            inverted[i] = w / norm
+            inverted[i + 1] = -x / norm
+            inverted[i + 2] = -y / norm
+            inverted[i + 3] = -z / norm
+        return RotationArray(quaternions=inverted)
+
+    def __mul__(
+        self,
+        other: Union["RotationArray", Rotation],
+    ) -> "RotationArray":
+        if isinstance(other, Rotation):
+            q = other.quaternion
+            other = RotationArray(quaternions=(q.w, q.x, q.y, q.z,))
+        if not isinstance(other, RotationArray):
+            return NotImplemented
+        return RotationArray(
+            quaternions=self._multiply(
+                q1=self.quaternions,
+                q2=other.quaternions,
+            )
+        )
+
+    def __rmul__(
+        self,
+        other: Rotation,
+    ) -> "RotationArray":
+        if not isinstance(other, Rotation):
+            return NotImplemented
+        q = other.quaternion
+        return RotationArray(
+            quaternions=self._multiply(
+                q1=array("d", (q.w, q.x, q.y, q.z,)),
+                q2=self.quaternions,
+            )
+        )
+
+    def interpolated(
+        self,
+        other: Union["RotationArray", Rotation],
+        factor: Union[float, Sequence[float]],
+    ) -> "RotationArray":
+        if isinstance(other, Rotation):
+            q = other.quaternion
+            other = RotationArray(quaternions=(q.w, q.x, q.y, q.z,))
+        if not isinstance(other, RotationArray):
+            raise TypeError(
+                "other is neither a RotationArray nor a Rotation instance."
+            )
+        return RotationArray(
+            quaternions=self._slerp(
+                q1=self.quaternions,
+                q2=other.quaternions,
+                factor=factor,
+            )
+        )
+
+    @classmethod
+    def exp(
+        cls,
+        vectors: Union[array, memoryview, Iterable[float]],
+    ) -> "RotationArray":
+        return cls(quaternions=poser.lie.so3_exp_batch(vectors=vectors))
+
+    def log(self) -> FloatArray:
+        return poser.lie.so3_log_batch(quaternions=self.quaternions)
+
+    def adjoint(self) -> FloatArray:
+        return self.to_matrix()
+
+    @staticmethod
+    def left_jacobian(
+        vectors: Union[array, memoryview, Iterable[float]],
+        inverse: bool = False,
+    ) -> FloatArray:
+        return poser.lie.so3_left_jacobian_batch(
+            vectors=vectors,
+            inverse=inverse,
+        )
+
+    @staticmethod
+    def right_jacobian(
+        vectors: Union[array, memoryview, Iterable[float]],
+        inverse: bool = False,
+    ) -> FloatArray:
+        return poser.lie.so3_right_jacobian_batch(
+            vectors=vectors,
+            inverse=inverse,
+        )
+
+    def to_matrix(self) -> FloatArray:
+        return Converter.quaternion_to_matrix_batch(
+            quaternions=self.quaternions,
+        )
+
+    def to_opk_deg(self) -> FloatArray:
+        return Converter.quaternion_to_opk_deg_batch(
+            quaternions=self.quaternions,
+        )
+
+    def to_rotations(self) -> list:
+        return list(self)
+
+    @staticmethod
+    def _multiply(
+        q1: Union[array, memoryview],
+        q2: Union[array, memoryview],
+    ) -> array:
+        n1, n2 = len(q1) // 4, len(q2) // 4
+        if n1 != n2 and n1 != 1 and n2 != 1:
+            raise ValueError(
+                f"cannot broadcast rotation arrays of lengths "
+                f"{n1} and {n2}."
+            )
+        if np is not None:
+            return RotationArray._multiply_numpy(
+                q1=as_float_array(values=q1).reshape(-1, 4),
+                q2=as_float_array(values=q2).reshape(-1, 4),
+            )
+        s1 = 4 if n1 > 1 else 0
+        s2 = 4 if n2 > 1 else 0
+        n = max(n1, n2) if n1 and n2 else 0
+        product = array("d", bytes(32 * n))
+        i1 = i2 = 0
+        for i in range(0, 4 * n, 4):
+            w1, x1, y1, z1 = q1[i1], q1[i1 + 1], q1[i1 + 2], q1[i1 + 3]
+            w2, x2, y2, z2 = q2[i2], q2[i2 + 1], q2[i2 + 2], q2[i2 + 3]
+            norm = (
+                (w1*w1 + x1*x1 + y1*y1 + z1*z1)
+                * (w2*w2 + x2*x2 + y2*y2 + z2*z2)
+            )**0.5
+            product[i] = (w1*w2 - x1*x2 - y1*y2 - z1*z2) / norm
+            product[i + 1] = (w1*x2 + x1*w2 + y1*z2 - z1*y2) / norm
+            product[i + 2] = (w1*y2 - x1*z2 + y1*w2 + z1*x2) / norm
+            product[i + 3] = (w1*z2 + x1*y2 - y1*x2 + z1*w2) / norm
+            i1 += s1
+            i2 += s2
+        return product
+
+    @staticmethod
+    def _slerp(
+        q1: Union[array, memoryview],
+        q2: Union[array, memoryview],
+        factor: Union[float, Sequence[float]],
+    ) -> array:
+        acos, sin = math.acos, math.sin
+        n1, n2 = len(q1) // 4, len(q2) // 4
+        if isinstance(factor, (int, float)):
+            factors = None
+            n = max(n1, n2) if n1 and n2 else 0
+        else:
+            factors = as_float_buffer(values=factor)
+            n = len(factors)
+        for length in (n1, n2):
+            if length != n and length != 1:
+                raise ValueError(
+                    f"cannot broadcast {length} rotations to {n} factors."
+                )
+        if factors is not None and n1 == n2 == 1:
+            return Quaternion._slerp(q1=q1[0:4], q2=q2[0:4], factors=factors)
+        if np is not None:
+            return RotationArray._slerp_numpy(
+                q1=as_float_array(values=q1).reshape(-1, 4),
+                q2=as_float_array(values=q2).reshape(-1, 4),
+                factor=factor if factors is None else np.asarray(factors),
+            )
+        s1 = 4 if n1 > 1 else 0
+        s2 = 4 if n2 > 1 else 0
+        f = factor
+        result = array("d", bytes(32 * n))
+        i1 = i2 = 0
+        for j, i in enumerate(range(0, 4 * n, 4)):
+            if factors is not None:
+                f = factors[j]
+            w1, x1, y1, z1 = q1[i1], q1[i1 + 1], q1[i1 + 2], q1[i1 + 3]
+            w2, x2, y2, z2 = q2[i2], q2[i2 + 1], q2[i2 + 2], q2[i2 + 3]
+            norm1 = (w1*w1 + x1*x1 + y1*y1 + z1*z1)**0.5
+            norm2 = (w2*w2 + x2*x2 + y2*y2 + z2*z2)**0.5
+            dot = (w1*w2 + x1*x2 + y1*y2 + z1*z2) / (norm1 * norm2)
+            f1, f2 = 1.0 / norm1, 1.0 / norm2
+            if dot < 0.0:
+                dot = -dot
+                f2 = -f2
+            if dot > 1.0 - 1e-6:
+                f1 *= 1.0 - f
+                f2 *= f
+            else:
+                omega = acos(dot)
+                sin_omega = sin(omega)
+                f1 *= sin((1.0 - f)*omega) / sin_omega
+                f2 *= sin(f*omega) / sin_omega
+            w = f1*w1 + f2*w2
+            x = f1*x1 + f2*x2
+            y = f1*y1 + f2*y2
+            z = f1*z1 + f2*z2
+            norm = (w*w + x*x + y*y + z*z)**0.5
+            result[i] = w / norm
+            result[i + 1] = x / norm
+            result[i + 2] = y / norm
+            result[i + 3] = z / norm
+            i1 += s1
+            i2 += s2
+        return result
+
+    @staticmethod
+    def _multiply_numpy(
+        q1: "np.ndarray",
+        q2: "np.ndarray",
+    ) -> "np.ndarray":
+        if not len(q1) or not len(q2):
+            return np.empty(0)
+        (w1, x1, y1, z1,) = q1.T
+        (w2, x2, y2, z2,) = q2.T
+        product = np.stack(
+            (
+                w1*w2 - x1*x2 - y1*y2 - z1*z2,
+                w1*x2 + x1*w2 + y1*z2 - z1*y2,
+                w1*y2 - x1*z2 + y1*w2 + z1*x2,
+                w1*z2 + x1*y2 - y1*x2 + z1*w2,
+            ),
+            axis=1,
+        )
+        product /= np.sqrt(
+            np.einsum("ij,ij->i", q1, q1) * np.einsum("ij,ij->i", q2, q2)
+        )[:, None]
+        return product.reshape(-1)
+
+    @staticmethod
+    def _slerp_numpy(
+        q1: "np.ndarray",
+        q2: "np.ndarray",
+        factor: Union[float, "np.ndarray"],
+    ) -> "np.ndarray":
+        if not len(q1) or not len(q2):
+            return np.empty(0)
+        q1 = q1 / np.sqrt(np.einsum("ij,ij->i", q1, q1))[:, None]
+        q2 = q2 / np.sqrt(np.einsum("ij,ij->i", q2, q2))[:, None]
+        dot = (q1 * q2).sum(axis=1)
+        sign = np.where(dot < 0.0, -1.0, 1.0)
+        dot = np.minimum(np.abs(dot), 1.0)
+        near = dot > 1.0 - 1e-6
+        omega = np.arccos(dot)
+        sin_omega = np.where(near, 1.0, np.sin(omega))
+        f1 = np.where(near, 1.0 - factor, np.sin((1.0 - factor)*omega))
+        f2 = np.where(near, factor, np.sin(factor*omega))
+        result = (
+            (f1 / sin_omega)[:, None] * q1
+            + (sign * f2 / sin_omega)[:, None] * q2
+        )
+        result /= np.sqrt(np.einsum("ij,ij->i", result, result))[:, None]
+        return result.reshape(-1)
@@ -0,0 +1,304 @@
+from array import array
+from heapq import heappush, heapreplace
+from typing import Iterable, List, Tuple, Union
+import math
+import struct
+import sys
+
+import poser.buffers
+import poser.point
+import poser.point_array
+import poser.pose_array
+
+
+Point = poser.point.Point
+PointArray = poser.point_array.PointArray
+PoseArray = poser.pose_array.PoseArray
+
+as_float_buffer = poser.buffers.as_float_buffer
+
+
+MAGIC = b"POSERKDT"
+VERSION = 1
+HEADER = struct.Struct("<8sIqII")
+
+
+class KDTree(object):
+    def __init__(
+        self,
+        points: Union[PointArray, PoseArray, Iterable[Point], Iterable[float]],
+        leaf_size: int = 16,
+    ) -> None:
+        if leaf_size < 1:
+            raise ValueError("leaf_size must be positive.")
+        self.leaf_size = leaf_size
+        coordinates = self._coordinates(points=points)
+        n = len(coordinates) // 3
+        xs = coordinates[0::3]
+        ys = coordinates[1::3]
+        zs = coordinates[2::3]
+        order = list(range(n))
+        axes = array("b", [-1]) * self._node_count(n=n, leaf_size=leaf_size)
+        splits = array("d", bytes(8 * len(axes)))
+        values = (xs, ys, zs,)
+        bounds = [(min(v), max(v)) if n else (0.0, 0.0) for v in values]
+        stack = [(0, 0, n, bounds,)]
+        while stack:
+            (node, lo, hi, bounds,) = stack.pop()
+            if hi - lo <= leaf_size:
+                continue
+            spreads = [upper - lower for (lower, upper,) in bounds]
+            axis = spreads.index(max(spreads))
+            key = values[axis].__getitem__
+            order[lo:hi] = sorted(order[lo:hi], key=key)
+            mid = (lo + hi) // 2
+            split = key(order[mid])
+            axes[node] = axis
+            splits[node] = split
+            left = list(bounds)
+            right = list(bounds)
+            left[axis] = (bounds[axis][0], split,)
+            right[axis] = (split, bounds[axis][1],)
+            stack.append((2*node + 1, lo, mid, left,))
+            stack.append((2*node + 2, mid, hi, right,))
+        self.order = array("q", order)
+        self.axes = axes
+        self.splits = splits
+        self.xs = array("d", map(xs.__getitem__, order))
+        self.ys = array("d", map(ys.__getitem__, order))
+        self.zs = array("d", map(zs.__getitem__, order))
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def query(
+        self,
+        point: Union[Point, Tuple[float]],
+        k: int = 1,
+    ) -> Tuple[List[int], List[float]]:
+        if k < 1:
+            raise ValueError("k must be positive.")
+        (qx, qy, qz,) = self._xyz(point=point)
+        xs, ys, zs = self.xs, self.ys, self.zs
+        axes, splits = self.axes, self.splits
+        leaf_size = self.leaf_size
+        q = (qx, qy, qz,)
+        heap = []
+        worst = math.inf
+        stack = [(0.0, 0, 0, len(self),)]
+        while stack:
+            (plane, node, lo, hi,) = stack.pop()
+            if plane > worst:
+                continue
+            if hi - lo <= leaf_size:
+                for j in range(lo, hi):
+                    dx = xs[j] - qx
+                    dy = ys[j] - qy
+                    dz = zs[j] - qz
+                    d2 = dx*dx + dy*dy + dz*dz
+                    if len(heap) < k:
+                        heappush(heap, (-d2, j))
+                        if len(heap) == k:
+                            worst = -heap[0][0]
+                    elif d2 < worst:
+                        heapreplace(heap, (-d2, j))
+                        worst = -heap[0][0]
+                continue
+            diff = q[axes[node]] - splits[node]
+            mid = (lo + hi) // 2
+            near = (0.0, 2*node + 1, lo, mid,)
+            far = (diff*diff, 2*node + 2, mid, hi,)
+            if diff > 0.0:
+                near, far = (0.0, 2*node + 2, mid, hi,), (
+                    diff*diff, 2*node + 1, lo, mid,
+                )
+            stack.append(far)
+            stack.append(near)
+        heap.sort(reverse=True)
+        order = self.order
+        return (
+            [order[j] for (_, j,) in heap],
+            [math.sqrt(-d2) for (d2, _,) in heap],
+        )
+
+    def query_radius(
+        self,
+        point: Union[Point, Tuple[float]],
+        radius: float,
+    ) -> List[int]:
+        (qx, qy, qz,) = self._xyz(point=point)
+        xs, ys, zs = self.xs, self.ys, self.zs
+        axes, splits = self.axes, self.splits
+        leaf_size = self.leaf_size
+        q = (qx, qy, qz,)
+        r2 = radius * radius
+        found = []
+        stack = [(0, 0, len(self),)]
+        while stack:
+            (node, lo, hi,) = stack.pop()
+            if hi - lo <= leaf_size:
+                for j in range(lo, hi):
+                    dx = xs[j] - qx
+                    dy = ys[j] - qy
+                    dz = zs[j] - qz
+                    if dx*dx + dy*dy + dz*dz <= r2:
+                        found.append(j)
+                continue
+            diff = q[axes[node]] - splits[node]
+            mid = (lo + hi) // 2
+            if diff <= radius:
+                stack.append((2*node + 1, lo, mid,))
+            if diff >= -radius:
+                stack.append((2*node + 2, mid, hi,))
+        order = self.order
+        return [order[j] for j in found]
+
+    def query_box(
+        self,
+        lower: Union[Point, Tuple[float]],
+        upper: Union[Point, Tuple[float]],
+    ) -> List[int]:
+        low = self._xyz(point=lower)
+        high = self._xyz(point=upper)
+        (x0, y0, z0,) = low
+        (x1, y1, z1,) = high
+        xs, ys, zs = self.xs, self.ys, self.zs
+        axes, splits = self.axes, self.splits
+        leaf_size = self.leaf_size
+        found = []
+        stack = [(0, 0, len(self),)]
+        while stack:
+            (node, lo, hi,) = stack.pop()
+            if hi - lo <= leaf_size:
+                for j in range(lo, hi):
+                    if (
+                        x0 <= xs[j] <= x1
+                        and y0 <= ys[j] <= y1
+                        and z0 <= zs[j] <= z1
+                    ):
+                        found.append(j)
+                continue
+            axis = axes[node]
+            split = splits[node]
+            mid = (lo + hi) // 2
+            if low[axis] <= split:
+                stack.append((2*node + 1, lo, mid,))
+            if high[axis] >= split:
+                stack.append((2*node + 2, mid, hi,))
+        order = self.order
+        return [order[j] for j in found]
+
+    def query_many(
+        self,
+        points: Union[PointArray, Iterable[Point], Iterable[float]],
+        k: int = 1,
+    ) -> Tuple[array, array]:
+        coordinates = self._coordinates(points=points)
+        indices = array("q")
+        distances = array("d")
+        for i in range(0, len(coordinates), 3):
+            (found, found_distances,) = self.query(
+                point=coordinates[i:i + 3],
+                k=k,
+            )
+            indices.extend(found)
+            distances.extend(found_distances)
+        return (indices, distances)
+
+    def query_radius_many(
+        self,
+        points: Union[PointArray, Iterable[Point], Iterable[float]],
+        radius: float,
+    ) -> List[List[int]]:
+        coordinates = self._coordinates(points=points)
+        return [
+            self.query_radius(point=coordinates[i:i + 3], radius=radius)
+            for i in range(0, len(coordinates), 3)
+        ]
+
+    def save(
+        self,
+        path: str,
+    ) -> None:
+        arrays = (
+            self.order, self.xs, self.ys, self.zs, self.axes, self.splits,
+        )
+        if sys.byteorder != "little":
+            arrays = [array(a.typecode, a) for a in arrays]
+            for a in arrays:
+                a.byteswap()
+        with open(path, "wb") as file:
+            file.write(
+                HEADER.pack(
+                    MAGIC, VERSION, len(self), self.leaf_size, len(self.axes),
+                )
+            )
+            for a in arrays:
+                a.tofile(file)
+
+    @classmethod
+    def load(
+        cls,
+        path: str,
+    ) -> "KDTree":
+        with open(path, "rb") as file:
+            header = file.read(HEADER.size)
+            if len(header) != HEADER.size:
+                raise ValueError(f"{path} is too short for a KDTree header.")
+            (magic, version, n, leaf_size, node_count,) = HEADER.unpack(header)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not a version {VERSION} KDTree.")
+            tree = object.__new__(cls)
+            tree.leaf_size = leaf_size
+            arrays = []
+            try:
+                for (typecode, count,) in (
+                    ("q", n), ("d", n), ("d", n), ("d", n),
+                    ("b", node_count), ("d", node_count),
+                ):
+                    a = array(typecode)
+                    a.fromfile(file, count)
+                    arrays.append(a)
+            except EOFError:
+                raise ValueError(f"{path} is truncated.") from None
+        if sys.byteorder != "little":
+            for a in arrays:
+                a.byteswap()
+        (
+            tree.order, tree.xs, tree.ys, tree.zs, tree.axes, tree.splits,
+        ) = arrays
+        return tree
+
+    @staticmethod
+    def _coordinates(
+        points: Union[PointArray, PoseArray, Iterable[Point], Iterable[float]],
+    ) -> Union[array, memoryview]:
+        if isinstance(points, PoseArray):
+            points = points.translations
+        if isinstance(points, (list, tuple)) and points and isinstance(
+            points[0], Point
+        ):
+            points = PointArray.from_points(points=points)
+        if not isinstance(points, PointArray):
+            points = PointArray(coordinates=points)
+        return as_float_buffer(values=points.coordinates)
+
+    @staticmethod
+    def _xyz(
+        point: Union[Point, Tuple[float]],
+    ) -> Tuple[float, float, float]:
+        if isinstance(point, Point):
+            return (point.x, point.y, point.z,)
+        (x, y, z,) = point
+        return (x, y, z,)
+
+    @staticmethod
+    def _node_count(
+        n: int,
+        leaf_size: int,
+    ) -> int:
+        depth = 0
+        while n > leaf_size:
+            n -= n // 2
+            depth += 1
+        return 2**(depth + 1) - 1
@@ -0,0 +1,403 @@
+from array import array
+from bisect import bisect_right
+from typing import Iterable, Optional, Sequence, Tuple, Union
+import math
+
+import poser
+import poser.pose_array
+import poser.trajectory
+
+
+Pose = poser.pose.Pose
+PoseArray = poser.pose_array.PoseArray
+PointArray = poser.point_array.PointArray
+RotationArray = poser.rotation.rotation_array.RotationArray
+Translation = poser.translation.Translation
+Rotation = poser.rotation.rotation.Rotation
+Quaternion = poser.rotation.representations.Quaternion
+Trajectory = poser.trajectory.Trajectory
+
+as_float_buffer = poser.buffers.as_float_buffer
+as_float_array = poser.buffers.as_float_array
+np = poser.buffers.np
+
+
+class SplineTrajectory(object):
+    def __init__(
+        self,
+        poses: Union[PoseArray, Iterable[Pose]],
+        timestamps: Optional[Iterable[float]] = None,
+        out_of_range: str = "raise",
+    ) -> None:
+        if not isinstance(poses, PoseArray):
+            poses = PoseArray.from_poses(poses=poses)
+        if not len(poses):
+            raise ValueError("a spline needs at least one pose.")
+        if timestamps is None:
+            timestamps = array("d", range(len(poses)))
+        self.timestamps = as_float_buffer(values=timestamps)
+        self.poses = poses
+        self.out_of_range = Trajectory._check_policy(policy=out_of_range)
+        if len(self.timestamps) != len(self.poses):
+            raise ValueError(
+                f"timestamps and poses differ in length: "
+                f"{len(self.timestamps)} != {len(self.poses)}."
+            )
+        ts = self.timestamps
+        for i in range(1, len(ts)):
+            if not ts[i - 1] < ts[i]:
+                raise ValueError(
+                    f"timestamps are not strictly increasing at index {i}."
+                )
+        self._coefficients = self._hermite(
+            timestamps=ts,
+            points=as_float_buffer(values=poses.translations.coordinates),
+        )
+        (self._keys, self._inner, self._angles,) = self._squad(
+            timestamps=ts,
+            quaternions=as_float_buffer(values=poses.rotations.quaternions),
+        )
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @property
+    def start(self) -> float:
+        return self.timestamps[0]
+
+    @property
+    def end(self) -> float:
+        return self.timestamps[-1]
+
+    def at(
+        self,
+        times: Union[float, Sequence[float]],
+        out_of_range: Optional[str] = None,
+    ) -> Union[Pose, PoseArray]:
+        policy = Trajectory._check_policy(
+            policy=self.out_of_range if out_of_range is None else out_of_range
+        )
+        if isinstance(times, (int, float)):
+            (i, u,) = self._segment(t=times, lo=0, policy=policy)
+            (x, y, z, w, qx, qy, qz,) = self._evaluate(i=i, u=u)
+            return Pose(
+                translation=Translation._unchecked(x, y, z),
+                rotation=Rotation(
+                    rotation=Quaternion._unchecked(w, qx, qy, qz),
+                ),
+            )
+        if np is not None:
+            return self._at_numpy(
+                queries=as_float_array(values=times),
+                policy=policy,
+            )
+        queries = as_float_buffer(values=times)
+        translations = array("d")
+        quaternions = array("d")
+        lo = 0
+        previous = self.timestamps[0]
+        for t in queries:
+            if t < previous:
+                lo = 0
+            previous = t
+            (i, u,) = self._segment(t=t, lo=lo, policy=policy)
+            if i >= 0:
+                lo = i
+            values = self._evaluate(i=i, u=u)
+            translations.extend(values[:3])
+            quaternions.extend(values[3:])
+        return PoseArray(
+            translations=PointArray(coordinates=translations),
+            rotations=RotationArray(quaternions=quaternions),
+        )
+
+    def _at_numpy(
+        self,
+        queries: "np.ndarray",
+        policy: str,
+    ) -> PoseArray:
+        ts = as_float_array(values=self.timestamps)
+        n = len(ts)
+        inside = (queries >= ts[0]) & (queries <= ts[-1])
+        if policy == "raise" and not inside.all():
+            raise ValueError(
+                f"time {float(queries[np.argmin(inside)])} is outside the "
+                f"trajectory range [{float(ts[0])}, {float(ts[-1])}]."
+            )
+        if policy == "clamp":
+            queries = np.where(
+                inside, queries, np.where(queries < ts[0], ts[0], ts[-1]),
+            )
+        if n == 1:
+            i = np.zeros(len(queries), dtype=np.intp)
+            u = np.zeros(len(queries))
+        else:
+            i = np.searchsorted(ts, queries, side="right") - 1
+            np.clip(i, 0, n - 2, out=i)
+            u = (queries - ts[i]) / (ts[i + 1] - ts[i])
+        c = np.frombuffer(self._coefficients).reshape(-1, 3, 4)[i]
+        v = u[:, None]
+        translations = c[..., 0] + v*(c[..., 1] + v*(c[..., 2] + v*c[..., 3]))
+        keys = np.frombuffer(self._keys).reshape(-1, 4)
+        inner = np.frombuffer(self._inner).reshape(-1, 2, 4)[i]
+        g = np.frombuffer(self._angles).reshape(-1, 4)[i]
+        a = self._slerp_numpy(
+            q1=keys[i], q2=keys[i + 1], omega=g[:, 0], sin_omega=g[:, 1], f=u,
+        )
+        b = self._slerp_numpy(
+            q1=inner[:, 0], q2=inner[:, 1],
+            omega=g[:, 2], sin_omega=g[:, 3], f=u,
+        )
+        omega = np.arccos(np.clip(np.einsum("ij,ij->i", a, b), -1.0, 1.0))
+        quaternions = self._slerp_numpy(
+            q1=a, q2=b,
+            omega=omega, sin_omega=np.sin(omega), f=2.0*u*(1.0 - u),
+        )
+        if policy == "nan":
+            outside = ~inside
+            translations[outside] = np.nan
+            quaternions[outside] = np.nan
+        return PoseArray(
+            translations=PointArray(coordinates=translations),
+            rotations=RotationArray(quaternions=quaternions),
+        )
+
+    @staticmethod
+    def _slerp_numpy(
+        q1: "np.ndarray",
+        q2: "np.ndarray",
+        omega: "np.ndarray",
+        sin_omega: "np.ndarray",
+        f: "np.ndarray",
+    ) -> "np.ndarray":
+        near = sin_omega < 1e-6
+        divisor = np.where(near, 1.0, sin_omega)
+        f1 = np.where(near, 1.0 - f, np.sin((1.0 - f)*omega) / divisor)
+        f2 = np.where(near, f, np.sin(f*omega) / divisor)
+        result = f1[:, None]*q1 + f2[:, None]*q2
+        norms = np.sqrt(np.einsum("ij,ij->i", result, result))
+        result /= np.where(near, norms, 1.0)[:, None]
+        return result
+
+    def _segment(
+        self,
+        t: float,
+        lo: int,
+        policy: str,
+    ) -> Tuple[int, float]:
+        ts = self.timestamps
+        n = len(ts)
+        first, last = ts[0], ts[n - 1]
+        if not first <= t <= last:
+            if policy == "raise":
+                raise ValueError(
+                    f"time {t} is outside the trajectory range "
+                    f"[{first}, {last}]."
+                )
+            if policy == "nan":
+                return (-1, math.nan)
+            if policy == "clamp":
+                t = first if t < first else last
+        if n == 1:
+            return (0, 0.0)
+        i = bisect_right(ts, t, lo) - 1
+        if i < 0:
+            i = 0
+        elif i > n - 2:
+            i = n - 2
+        return (i, (t - ts[i]) / (ts[i + 1] - ts[i]))
+
+    def _evaluate(
+        self,
+        i: int,
+        u: float,
+    ) -> Tuple[float, ...]:
+        if i < 0:
+            return (math.nan,) * 7
+        c = self._coefficients
+        k = 12 * i
+        x = c[k] + u*(c[k + 1] + u*(c[k + 2] + u*c[k + 3]))
+        y = c[k + 4] + u*(c[k + 5] + u*(c[k + 6] + u*c[k + 7]))
+        z = c[k + 8] + u*(c[k + 9] + u*(c[k + 10] + u*c[k + 11]))
+        q = self._keys
+        s = self._inner
+        g = self._angles
+        j = 4 * i
+        a = self._slerp(
+            q[j], q[j + 1], q[j + 2], q[j + 3],
+            q[j + 4], q[j + 5], q[j + 6], q[j + 7],
+            g[j], g[j + 1], u,
+        )
+        k = 8 * i
+        b = self._slerp(
+            s[k], s[k + 1], s[k + 2], s[k + 3],
+            s[k + 4], s[k + 5], s[k + 6], s[k + 7],
+            g[j + 2], g[j + 3], u,
+        )
+        (w1, x1, y1, z1,) = a
+        (w2, x2, y2, z2,) = b
+        dot = w1*w2 + x1*x2 + y1*y2 + z1*z2
+        omega = math.acos(max(-1.0, min(1.0, dot)))
+        (w, qx, qy, qz,) = self._slerp(
+            w1, x1, y1, z1, w2, x2, y2, z2,
+            omega, math.sin(omega), 2.0*u*(1.0 - u),
+        )
+        return (x, y, z, w, qx, qy, qz,)
+
+    @staticmethod
+    def _slerp(
+        w1: float, x1: float, y1: float, z1: float,
+        w2: float, x2: float, y2: float, z2: float,
+        omega: float,
+        sin_omega: float,
+        f: float,
+    ) -> Tuple[float, float, float, float]:
+        if sin_omega < 1e-6:
+            w = w1 + f*(w2 - w1)
+            x = x1 + f*(x2 - x1)
+            y = y1 + f*(y2 - y1)
+            z = z1 + f*(z2 - z1)
+            norm = (w*w + x*x + y*y + z*z)**0.5
+            return (w/norm, x/norm, y/norm, z/norm,)
+        f1 = math.sin((1.0 - f)*omega) / sin_omega
+        f2 = math.sin(f*omega) / sin_omega
+        return (
+            f1*w1 + f2*w2,
+            f1*x1 + f2*x2,
+            f1*y1 + f2*y2,
+            f1*z1 + f2*z2,
+        )
+
+    @staticmethod
+    def _hermite(
+        timestamps: Union[array, memoryview],
+        points: Union[array, memoryview],
+    ) -> array:
+        ts = timestamps
+        n = len(ts)
+        if n == 1:
+            return array("d", (
+                points[0], 0.0, 0.0, 0.0,
+                points[1], 0.0, 0.0, 0.0,
+                points[2], 0.0, 0.0, 0.0,
+            ))
+        tangents = array("d", bytes(24 * n))
+        for i in range(n):
+            before = i - 1 if i > 0 else 0
+            after = i + 1 if i < n - 1 else n - 1
+            dt = ts[after] - ts[before]
+            for axis in range(3):
+                tangents[3*i + axis] = (
+                    points[3*after + axis] - points[3*before + axis]
+                ) / dt
+        coefficients = array("d", bytes(96 * (n - 1)))
+        for i in range(n - 1):
+            h = ts[i + 1] - ts[i]
+            for axis in range(3):
+                p0 = points[3*i + axis]
+                p1 = points[3*i + 3 + axis]
+                m0 = h * tangents[3*i + axis]
+                m1 = h * tangents[3*i + 3 + axis]
+                k = 12*i + 4*axis
+                coefficients[k] = p0
+                coefficients[k + 1] = m0
+                coefficients[k + 2] = 3.0*(p1 - p0) - 2.0*m0 - m1
+                coefficients[k + 3] = 2.0*(p0 - p1) + m0 + m1
+        return coefficients
+
+    @staticmethod
+    def _squad(
+        timestamps: Union[array, memoryview],
+        quaternions: Union[array, memoryview],
+    ) -> Tuple[array, array, array]:
+        n = len(quaternions) // 4
+        keys = array("d")
+        previous = None
+        for i in range(0, 4 * n, 4):
+            (w, x, y, z,) = quaternions[i:i + 4]
+            norm = (w*w + x*x + y*y + z*z)**0.5
+            q = (w/norm, x/norm, y/norm, z/norm,)
+            if previous is not None and _dot(previous, q) < 0.0:
+                q = (-q[0], -q[1], -q[2], -q[3],)
+            keys.extend(q)
+            previous = q
+        if n == 1:
+            keys.extend(keys)
+            timestamps = (0.0, 1.0,)
+            n = 2
+        outgoing = [tuple(keys[0:4])]
+        incoming = [None]
+        for i in range(1, n - 1):
+            q = tuple(keys[4*i:4*i + 4])
+            inverse = (q[0], -q[1], -q[2], -q[3],)
+            after = _log(_multiply(inverse, tuple(keys[4*i + 4:4*i + 8])))
+            before = _log(_multiply(inverse, tuple(keys[4*i - 4:4*i])))
+            h0 = timestamps[i] - timestamps[i - 1]
+            h1 = timestamps[i + 1] - timestamps[i]
+            velocity = [(a - b) / (h0 + h1) for a, b in zip(after, before)]
+            outgoing.append(
+                _multiply(q, _exp(tuple(
+                    0.5 * (h1*v - a) for v, a in zip(velocity, after)
+                )))
+            )
+            incoming.append(
+                _multiply(q, _exp(tuple(
+                    0.5 * (-h0*v - b) for v, b in zip(velocity, before)
+                )))
+            )
+        incoming.append(tuple(keys[4*n - 4:4*n]))
+        inner = array("d")
+        angles = array("d")
+        for i in range(n - 1):
+            inner.extend(outgoing[i])
+            inner.extend(incoming[i + 1])
+            for (q1, q2,) in (
+                (tuple(keys[4*i:4*i + 4]), tuple(keys[4*i + 4:4*i + 8]),),
+                (outgoing[i], incoming[i + 1],),
+            ):
+                omega = math.acos(max(-1.0, min(1.0, _dot(q1, q2))))
+                angles.extend((omega, math.sin(omega),))
+        return (keys, inner, angles,)
+
+
+def _dot(
+    q1: Tuple[float, ...],
+    q2: Tuple[float, ...],
+) -> float:
+    return q1[0]*q2[0] + q1[1]*q2[1] + q1[2]*q2[2] + q1[3]*q2[3]
+
+
+def _multiply(
+    q1: Tuple[float, ...],
+    q2: Tuple[float, ...],
+) -> Tuple[float, float, float, float]:
+    (w1, x1, y1, z1,) = q1
+    (w2, x2, y2, z2,) = q2
+    return (
+        w1*w2 - x1*x2 - y1*y2 - z1*z2,
+        w1*x2 + x1*w2 + y1*z2 - z1*y2,
+        w1*y2 - x1*z2 + y1*w2 + z1*x2,
+        w1*z2 + x1*y2 - y1*x2 + z1*w2,
+    )
+
+
+def _log(
+    q: Tuple[float, ...],
+) -> Tuple[float, float, float]:
+    (w, x, y, z,) = q
+    sin_theta = (x*x + y*y + z*z)**0.5
+    if sin_theta < 1e-12:
+        return (0.0, 0.0, 0.0,)
+    f = math.atan2(sin_theta, w) / sin_theta
+    return (f*x, f*y, f*z,)
+
+
+def _exp(
+    v: Tuple[float, float, float],
+) -> Tuple[float, float, float, float]:
+    (x, y, z,) = v
+    theta = (x*x + y*y + z*z)**0.5
+    if theta < 1e-12:
+        return (1.0, x, y, z,)
+    f = math.sin(theta) / theta
+    return (math.cos(theta), f*x, f*y, f*z,)
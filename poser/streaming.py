@@ -0,0 +1,116 @@
+from array import array
+from typing import Iterable, Iterator, Tuple, Union
+
+import poser.point
+import poser.point_array
+import poser.buffers
+
+
+Point = poser.point.Point
+PointArray = poser.point_array.PointArray
+
+as_float_buffer = poser.buffers.as_float_buffer
+as_float_array = poser.buffers.as_float_array
+np = poser.buffers.np
+
+CHUNK_TYPES = (array, memoryview) if np is None else (
+    array, memoryview, np.ndarray,
+)
+
+
+def transform_iter(
+    points: Iterable[
+        Union[Point, Tuple[float], PointArray, array, memoryview, "np.ndarray"]
+    ],
+    rotation: Tuple[Tuple[float]] = (
+        (1.0, 0.0, 0.0,),
+        (0.0, 1.0, 0.0,),
+        (0.0, 0.0, 1.0,),
+    ),
+    translation: Tuple[float] = (0.0, 0.0, 0.0,),
+    chunk_size: int = 1024,
+) -> Iterator[Union[list, PointArray, array]]:
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive.")
+    return _transform_iter(
+        points=points,
+        rotation=rotation,
+        translation=translation,
+        chunk_size=chunk_size,
+    )
+
+
+def _transform_iter(
+    points: Iterable[
+        Union[Point, Tuple[float], PointArray, array, memoryview, "np.ndarray"]
+    ],
+    rotation: Tuple[Tuple[float]],
+    translation: Tuple[float],
+    chunk_size: int,
+) -> Iterator[Union[list, PointArray, array]]:
+    (
+        (r11, r12, r13,),
+        (r21, r22, r23,),
+        (r31, r32, r33,),
+    ) = rotation
+    (tx, ty, tz,) = translation
+    batch = []
+    for point in points:
+        if isinstance(point, Point):
+            x, y, z = point.x, point.y, point.z
+            batch.append(
+                type(point)._unchecked(
+                    r11*x + r12*y + r13*z + tx,
+                    r21*x + r22*y + r23*z + ty,
+                    r31*x + r32*y + r33*z + tz,
+                )
+            )
+        elif isinstance(point, (tuple, list)):
+            (x, y, z,) = point
+            batch.append(
+                (
+                    r11*x + r12*y + r13*z + tx,
+                    r21*x + r22*y + r23*z + ty,
+                    r31*x + r32*y + r33*z + tz,
+                )
+            )
+        elif isinstance(point, (PointArray,) + CHUNK_TYPES):
+            if batch:
+                yield batch
+                batch = []
+            if isinstance(point, PointArray):
+                yield point._transformed(
+                    rotation=rotation,
+                    translation=translation,
+                )
+                continue
+            ndarray = np is not None and isinstance(point, np.ndarray)
+            source = (
+                as_float_array(values=point) if ndarray
+                else as_float_buffer(values=point)
+            )
+            if len(source) % 3:
+                raise ValueError(
+                    "chunk length is not a multiple of 3."
+                )
+            result = (
+                np.empty(len(source)) if ndarray
+                else array("d", bytes(8 * len(source)))
+            )
+            PointArray._affine(
+                source=source,
+                target=result,
+                rotation=rotation,
+                translation=translation,
+            )
+            yield result.reshape(point.shape) if ndarray else result
+            continue
+        else:
+            raise TypeError(
+                f"point has an unsupported type: {type(point)}"
+            )
+        if len(batch) >= chunk_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
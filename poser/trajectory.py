@@ -0,0 +1,168 @@
+from array import array
+from bisect import bisect_right
+from typing import Union, Iterable, Iterator, Sequence
+
+import poser
+import poser.pose_array
+
+
+Pose = poser.pose.Pose
+PoseArray = poser.pose_array.PoseArray
+
+as_float_buffer = poser.buffers.as_float_buffer
+as_float_array = poser.buffers.as_float_array
+np = poser.buffers.np
+
+
+OUT_OF_RANGE_POLICIES = ("raise", "clamp", "extrapolate", "nan",)
+
+
+class Trajectory(object):
+    def __init__(
+        self,
+        timestamps: Iterable[float],
+        poses: Union[PoseArray, Iterable[Pose]],
+        out_of_range: str = "raise",
+    ) -> None:
+        if not isinstance(poses, PoseArray):
+            poses = PoseArray.from_poses(poses=poses)
+        self.timestamps = as_float_buffer(values=timestamps)
+        self.poses = poses
+        self.out_of_range = self._check_policy(policy=out_of_range)
+        if len(self.timestamps) != len(self.poses):
+            raise ValueError(
+                f"timestamps and poses differ in length: "
+                f"{len(self.timestamps)} != {len(self.poses)}."
+            )
+        ts = self.timestamps
+        if np is not None:
+            unordered = np.flatnonzero(~(np.diff(as_float_array(values=ts)) > 0))
+            if len(unordered):
+                raise ValueError(
+                    f"timestamps are not strictly increasing at index "
+                    f"{int(unordered[0]) + 1}."
+                )
+            return
+        for i in range(1, len(ts)):
+            if not ts[i - 1] < ts[i]:
+                raise ValueError(
+                    f"timestamps are not strictly increasing at index {i}."
+                )
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __iter__(self) -> Iterator[tuple]:
+        return zip(self.timestamps, self.poses)
+
+    @property
+    def start(self) -> float:
+        return self.timestamps[0]
+
+    @property
+    def end(self) -> float:
+        return self.timestamps[-1]
+
+    def at(
+        self,
+        times: Union[float, Sequence[float]],
+        out_of_range: Union[str, None] = None,
+    ) -> Union[Pose, PoseArray]:
+        policy = self._check_policy(
+            policy=self.out_of_range if out_of_range is None else out_of_range
+        )
+        if isinstance(times, (int, float)):
+            return self.at(times=(times,), out_of_range=policy)[0]
+        ts = self.timestamps
+        n = len(ts)
+        if not n:
+            raise ValueError("trajectory is empty.")
+        first, last = ts[0], ts[n - 1]
+        if np is not None:
+            return self._at_numpy(
+                queries=as_float_array(values=times),
+                policy=policy,
+            )
+        queries = as_float_buffer(values=times)
+        left = array("q", bytes(8 * len(queries)))
+        factors = array("d", bytes(8 * len(queries)))
+        outside = []
+        lo = 0
+        previous = first
+        for j, t in enumerate(queries):
+            if t < previous:
+                lo = 0
+            previous = t
+            if not first <= t <= last:
+                if policy == "raise":
+                    raise ValueError(
+                        f"time {t} is outside the trajectory range "
+                        f"[{first}, {last}]."
+                    )
+                if policy == "nan":
+                    outside.append(j)
+            if n == 1:
+                continue
+            i = bisect_right(ts, t, lo) - 1
+            if i < 0:
+                i = 0
+            elif i > n - 2:
+                i = n - 2
+            lo = i
+            f = (t - ts[i]) / (ts[i + 1] - ts[i])
+            if policy == "clamp":
+                f = 0.0 if f < 0.0 else 1.0 if f > 1.0 else f
+            left[j] = i
+            factors[j] = f
+        right = array("q", (i + 1 for i in left)) if n > 1 else left
+        result = self.poses.take(indices=left).interpolated(
+            other=self.poses.take(indices=right),
+            factor=factors,
+        )
+        nan = float("nan")
+        for j in outside:
+            result.translations.coordinates[3*j:3*j + 3] = array("d", (nan,)*3)
+            result.rotations.quaternions[4*j:4*j + 4] = array("d", (nan,)*4)
+        return result
+
+    def _at_numpy(
+        self,
+        queries: "np.ndarray",
+        policy: str,
+    ) -> PoseArray:
+        ts = as_float_array(values=self.timestamps)
+        n = len(ts)
+        inside = (queries >= ts[0]) & (queries <= ts[-1])
+        if policy == "raise" and not inside.all():
+            raise ValueError(
+                f"time {float(queries[np.argmin(inside)])} is outside the "
+                f"trajectory range [{float(ts[0])}, {float(ts[-1])}]."
+            )
+        if n == 1:
+            left = right = np.zeros(len(queries), dtype=np.intp)
+            factors = np.zeros(len(queries))
+        else:
+            left = np.searchsorted(ts, queries, side="right") - 1
+            np.clip(left, 0, n - 2, out=left)
+            right = left + 1
+            factors = (queries - ts[left]) / (ts[right] - ts[left])
+            if policy == "clamp":
+                np.clip(factors, 0.0, 1.0, out=factors)
+        result = self.poses.take(indices=left).interpolated(
+            other=self.poses.take(indices=right),
+            factor=factors,
+        )
+        if policy == "nan":
+            outside = ~inside
+            result.translations.xyz[outside] = np.nan
+            result.rotations.wxyz[outside] = np.nan
+        return result
+
+    @staticmethod
+    def _check_policy(policy: str) -> str:
+        if policy not in OUT_OF_RANGE_POLICIES:
+            raise ValueError(
+                f"out_of_range has an unsupported value: {policy!r}, "
+                f"expected one of {OUT_OF_RANGE_POLICIES}."
+            )
+        return policy
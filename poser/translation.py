@@ -1,16 +1,20 @@
-from typing import Union
+from array import array
+from typing import Union, Iterable, Iterator
 from dataclasses import dataclass
 
 import poser.point
+import poser.point_array
+import poser.streaming
 
 
 Point = poser.point.Point
+PointArray = poser.point_array.PointArray
 
 
-@dataclass
+@dataclass(slots=True)
 class Translation(Point):
     def __invert__(self) -> "Translation":
-        return Translation(
+        return Translation._unchecked(
             x=-self.x,
             y=-self.y,
             z=-self.z,
@@ -25,7 +29,7 @@ class Translation(Point):
         self, 
         other: "Translation",
     ) -> "Translation":
-        return Translation(
+        return Translation._unchecked(
             x=self.x + other.x,
             y=self.y + other.y,
             z=self.z + other.z,
@@ -36,7 +40,7 @@ class Translation(Point):
         other: "Translation",
         factor: float,
     ) -> "Translation":
-        return Translation(
+        return Translation._unchecked(
             x=self.x * (1.0-factor) + other.x * factor,
             y=self.y * (1.0-factor) + other.y * factor,
             z=self.z * (1.0-factor) + other.z * factor,
@@ -61,8 +65,11 @@ class Translation(Point):
     
     def transform_points(
         self,
-        points: Union[list, tuple],
+        points: Union[list, tuple, PointArray],
     ) -> None:
+        if isinstance(points, PointArray):
+            points._transform(translation=self.as_tuple)
+            return
         (x, y, z,) = self.as_tuple
         for point in points:
             if not isinstance(point, (Point, self)):
@@ -83,7 +90,7 @@ class Translation(Point):
         point: Union[Point, "Translation"],
     ) -> Union[Point, "Translation"]:
         if isinstance(point, Point):
-            return Point(
+            return Point._unchecked(
                 *self._translate(
                     x=point.x,
                     y=point.y,
@@ -94,7 +101,7 @@ class Translation(Point):
                 )
             )
         elif isinstance(point, Translation):
-            return Translation(
+            return Translation._unchecked(
                 *self._translate(
                     x=point.x,
                     y=point.y,
@@ -111,12 +118,21 @@ class Translation(Point):
 
     def transformed_points(
         self,
-        points: Union[list, tuple]
-    ) -> Union[list, tuple]:
+        points: Union[list, tuple, PointArray],
+        out: Union[list, PointArray, array, memoryview, None] = None,
+    ) -> Union[list, tuple, PointArray, array, memoryview]:
+        if out is not None:
+            return PointArray._transformed_into(
+                points=points,
+                out=out,
+                translation=self.as_tuple,
+            )
+        if isinstance(points, PointArray):
+            return points._transformed(translation=self.as_tuple)
         (x, y, z) = self.as_tuple
         if isinstance(points, tuple):
             return tuple(
-                Point(
+                Point._unchecked(
                     *self._translate(
                         x=point.x,
                         y=point.y,
@@ -126,7 +142,7 @@ class Translation(Point):
                         tz=z,
                     )
                 ) if isinstance(point, Point) else
-                Translation(
+                Translation._unchecked(
                     *self._translate(
                         x=point.x,
                         y=point.y,
@@ -141,7 +157,7 @@ class Translation(Point):
             )
         elif isinstance(points, list):
             return [
-                Point(
+                Point._unchecked(
                     *self._translate(
                         x=point.x,
                         y=point.y,
@@ -151,7 +167,7 @@ class Translation(Point):
                         tz=z,
                     )
                 ) if isinstance(point, Point) else
-                Translation(
+                Translation._unchecked(
                     *self._translate(
                         x=point.x,
                         y=point.y,
@@ -165,6 +181,17 @@ class Translation(Point):
                 if (isinstance(point, Point) or isinstance(point, Translation))
             ]
         
+    def transform_iter(
+        self,
+        points: Iterable,
+        chunk_size: int = 1024,
+    ) -> Iterator[Union[list, PointArray, array]]:
+        return poser.streaming.transform_iter(
+            points=points,
+            translation=self.as_tuple,
+            chunk_size=chunk_size,
+        )
+
     @staticmethod
     def _translate(
         x: float,
@@ -0,0 +1,128 @@
+import unittest
+
+import poser
+import poser.frames
+import poser.rotation.representations
+
+
+OPKDeg = poser.rotation.representations.OPKDeg
+
+FrameGraph = poser.frames.FrameGraph
+
+
+def pose(x, y, z, omega, phi, kappa) -> poser.Pose:
+    return poser.Pose(
+        translation=poser.Translation(x=x, y=y, z=z),
+        rotation=poser.Rotation(
+            rotation=OPKDeg(omega=omega, phi=phi, kappa=kappa)
+        ),
+    )
+
+
+class TestFrameGraph(unittest.TestCase):
+    def setUp(self) -> None:
+        self.edges = {
+            "block": pose(1000.0, 2000.0, 0.0, 0.0, 0.0, 30.0),
+            "antenna": pose(5.0, -3.0, 120.0, 2.0, -1.0, 95.0),
+            "imu": pose(0.1, 0.2, -0.5, 180.0, 0.0, 90.0),
+            "camera": pose(0.05, 0.0, -0.1, 0.5, 0.3, -0.2),
+            "lidar": pose(-0.3, 0.1, -0.2, 10.0, 0.0, 0.0),
+        }
+        self.graph = FrameGraph()
+        self.graph.add(name="world")
+        self.graph.add(name="block", parent="world", pose=self.edges["block"])
+        self.graph.add(
+            name="antenna", parent="block", pose=self.edges["antenna"]
+        )
+        self.graph.add(name="imu", parent="antenna", pose=self.edges["imu"])
+        self.graph.add(name="camera", parent="imu", pose=self.edges["camera"])
+        self.graph.add(name="lidar", parent="imu", pose=self.edges["lidar"])
+
+    def assertPoseAlmostEqual(self, a: poser.Pose, b: poser.Pose) -> None:
+        for row_a, row_b in zip(a.as_tuple, b.as_tuple):
+            for value_a, value_b in zip(row_a, row_b):
+                self.assertAlmostEqual(value_a, value_b, places=9)
+
+    def world_camera(self) -> poser.Pose:
+        e = self.edges
+        return e["block"] * e["antenna"] * e["imu"] * e["camera"]
+
+    def test_lookup(self) -> None:
+        self.assertPoseAlmostEqual(
+            self.graph.lookup(target="world", source="camera"),
+            self.world_camera(),
+        )
+        self.assertPoseAlmostEqual(
+            self.graph.lookup(target="camera", source="world"),
+            ~self.world_camera(),
+        )
+        self.assertPoseAlmostEqual(
+            self.graph.lookup(target="lidar", source="camera"),
+            ~self.edges["lidar"] * self.edges["camera"],
+        )
+        self.assertPoseAlmostEqual(
+            self.graph.lookup(target="imu", source="imu"), poser.Pose()
+        )
+        self.assertListEqual(
+            self.graph.path(target="lidar", source="camera"),
+            ["lidar", "imu", "camera"],
+        )
+
+    def test_cached_copies(self) -> None:
+        first = self.graph.lookup(target="world", source="camera")
+        first.translation.x = 0.0
+        second = self.graph.lookup(target="world", source="camera")
+        self.assertIsNot(first, second)
+        self.assertPoseAlmostEqual(second, self.world_camera())
+        self.assertIn(("world", "camera"), self.graph._cache)
+
+    def test_invalidation(self) -> None:
+        self.graph.lookup(target="world", source="camera")
+        self.graph.lookup(target="lidar", source="camera")
+        self.graph.lookup(target="world", source="antenna")
+        self.edges["imu"] = pose(0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+        self.graph.set_pose(name="imu", pose=self.edges["imu"])
+        self.assertNotIn(("world", "camera"), self.graph._cache)
+        self.assertIn(("lidar", "camera"), self.graph._cache)
+        self.assertIn(("world", "antenna"), self.graph._cache)
+        self.assertPoseAlmostEqual(
+            self.graph.lookup(target="world", source="camera"),
+            self.world_camera(),
+        )
+        self.edges["camera"] = pose(1.0, 2.0, 3.0, 4.0, 5.0, 6.0)
+        self.graph.set_pose(name="camera", pose=self.edges["camera"])
+        self.assertNotIn(("lidar", "camera"), self.graph._cache)
+        self.assertPoseAlmostEqual(
+            self.graph.lookup(target="lidar", source="camera"),
+            ~self.edges["lidar"] * self.edges["camera"],
+        )
+
+    def test_edges_are_copied(self) -> None:
+        self.graph.lookup(target="world", source="camera")
+        self.edges["camera"].translation.x = 100.0
+        self.graph.pose(name="camera").translation.x = 100.0
+        self.assertAlmostEqual(self.graph.pose(name="camera").translation.x, 0.05)
+
+    def test_structure(self) -> None:
+        self.assertEqual(len(self.graph), 6)
+        self.assertIn("camera", self.graph)
+        self.assertEqual(self.graph.parent(name="camera"), "imu")
+        with self.assertRaises(ValueError):
+            self.graph.add(name="camera", parent="imu")
+        with self.assertRaises(KeyError):
+            self.graph.add(name="gimbal", parent="missing")
+        with self.assertRaises(KeyError):
+            self.graph.lookup(target="world", source="missing")
+        with self.assertRaises(ValueError):
+            self.graph.remove(name="imu")
+        self.graph.lookup(target="world", source="lidar")
+        self.graph.remove(name="lidar")
+        self.assertNotIn("lidar", self.graph)
+        self.assertNotIn(("world", "lidar"), self.graph._cache)
+        self.graph.add(name="local")
+        with self.assertRaises(ValueError):
+            self.graph.lookup(target="local", source="camera")
+
+
+if __name__ == "__main__":
+    unittest.main()
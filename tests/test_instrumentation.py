@@ -0,0 +1,117 @@
+import json
+import unittest
+
+import poser
+import poser.instrumentation
+import poser.rotation.cache
+import poser.rotation.converter
+import poser.rotation.representations
+
+
+OPKDeg = poser.rotation.representations.OPKDeg
+
+Converter = poser.rotation.converter.Converter
+instrumentation = poser.instrumentation
+cache = poser.rotation.cache
+
+
+class TestInstrumentation(unittest.TestCase):
+    def tearDown(self) -> None:
+        instrumentation.disable()
+        instrumentation.reset()
+        cache.disable()
+
+    def test_disabled_restores_originals(self) -> None:
+        init = vars(poser.Pose)["__init__"]
+        converter = vars(Converter)["matrix_to_quaternion"]
+        affine = vars(poser.PointArray)["_affine"]
+        instrumentation.enable()
+        self.assertTrue(instrumentation.is_enabled())
+        self.assertIsNot(vars(poser.Pose)["__init__"], init)
+        instrumentation.disable()
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertIs(vars(poser.Pose)["__init__"], init)
+        self.assertIs(vars(Converter)["matrix_to_quaternion"], converter)
+        self.assertIs(vars(poser.PointArray)["_affine"], affine)
+        poser.Pose()
+        self.assertDictEqual(instrumentation.snapshot(), {})
+
+    def test_counts(self) -> None:
+        pose = poser.Pose(
+            rotation=poser.Rotation(
+                rotation=OPKDeg(omega=45.0, phi=-20.0, kappa=130.0)
+            )
+        )
+        points = poser.PointArray(coordinates=[1.0, 2.0, 3.0] * 4)
+        with instrumentation.instrumented() as snapshot:
+            (pose * pose).rotation.opk_deg
+            pose.transformed_points(points=points)
+            stats = snapshot()
+        self.assertEqual(stats["Pose.__init__"]["calls"], 1)
+        self.assertEqual(stats["Pose.transformed_points"]["calls"], 1)
+        self.assertEqual(stats["PointArray._affine"]["calls"], 1)
+        self.assertEqual(stats["Converter.opk_deg_to_matrix"]["calls"], 1)
+        self.assertEqual(stats["Converter.matrix_to_opk_deg"]["calls"], 1)
+        self.assertEqual(
+            stats["Rotation._update_from_quaternion"]["calls"], 1
+        )
+        self.assertGreater(stats["Pose.transformed_points"]["seconds"], 0.0)
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertDictEqual(json.loads(instrumentation.to_json()), stats)
+
+    def test_results_unchanged(self) -> None:
+        expected = Converter.opk_deg_to_quaternion_batch(
+            opk_degs=[10.0, 20.0, 30.0]
+        )
+        with instrumentation.instrumented():
+            result = Converter.opk_deg_to_quaternion_batch(
+                opk_degs=[10.0, 20.0, 30.0]
+            )
+            point = poser.Translation._unchecked(1.0, 2.0, 3.0)
+        self.assertEqual(result.tolist(), expected.tolist())
+        self.assertIs(type(point), poser.Translation)
+        stats = instrumentation.snapshot()
+        self.assertEqual(stats["Point._unchecked"]["calls"], 1)
+        self.assertEqual(
+            stats["Converter.opk_deg_to_quaternion_batch"]["calls"], 1
+        )
+
+    def test_reset(self) -> None:
+        with instrumentation.instrumented():
+            poser.Point()
+        self.assertIn("Point.__init__", instrumentation.snapshot())
+        instrumentation.reset()
+        self.assertDictEqual(instrumentation.snapshot(), {})
+
+    def test_interleaved_with_cache(self) -> None:
+        original = vars(Converter)["opk_deg_to_matrix"]
+        opk = OPKDeg(omega=10.0, phi=20.0, kappa=30.0)
+        for first, second in (
+            (cache, instrumentation,),
+            (instrumentation, cache,),
+        ):
+            first.enable()
+            second.enable()
+            first.disable()
+            self.assertFalse(first.is_enabled())
+            self.assertTrue(second.is_enabled())
+            instrumentation.reset()
+            Converter.opk_deg_to_matrix(opk_deg=opk)
+            Converter.opk_deg_to_matrix(opk_deg=opk)
+            if second is instrumentation:
+                stats = instrumentation.snapshot()
+                self.assertEqual(
+                    stats["Converter.opk_deg_to_matrix"]["calls"], 2
+                )
+                self.assertFalse(cache.stats()["enabled"])
+            else:
+                self.assertEqual(cache.stats()["hits"], 1)
+                self.assertDictEqual(instrumentation.snapshot(), {})
+            second.disable()
+            self.assertFalse(cache.is_enabled())
+            self.assertFalse(instrumentation.is_enabled())
+            self.assertIs(vars(Converter)["opk_deg_to_matrix"], original)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,320 @@
+import math
+import unittest
+from unittest import mock
+
+import poser
+import poser.lie
+import poser.rotation.representations
+
+
+OPKDeg = poser.rotation.representations.OPKDeg
+
+lie = poser.lie
+
+
+TWISTS = [
+    (1.0, -2.0, 0.5, 0.0, 0.0, 0.0),
+    (0.3, 0.2, -0.1, 1e-9, -2e-9, 1e-9),
+    (-0.4, 1.5, 2.0, 0.01, 0.02, -0.03),
+    (2.0, 0.0, -1.0, 0.05, -0.04, 0.03),
+    (0.5, 0.5, 0.5, 0.3, -0.7, 0.4),
+    (-1.0, 3.0, 0.2, 1.2, 0.9, -1.6),
+    (0.1, -0.2, 0.3, 0.0, 0.0, math.pi - 1e-7),
+]
+
+
+def flatten(rows) -> list:
+    return [value for row in rows for value in row]
+
+
+def numeric_left_jacobian(twist, step=1e-6) -> list:
+    pose = poser.Pose.exp(twist=twist)
+    columns = []
+    for k in range(6):
+        shifted = list(twist)
+        shifted[k] += step
+        delta = (poser.Pose.exp(twist=shifted) * ~pose).log()
+        shifted[k] -= 2 * step
+        delta = [
+            (a - b) / (2 * step) for a, b in zip(
+                delta, (poser.Pose.exp(twist=shifted) * ~pose).log()
+            )
+        ]
+        columns.append(delta)
+    return [[columns[k][r] for k in range(6)] for r in range(6)]
+
+
+class TestSO3(unittest.TestCase):
+    def assertValuesAlmostEqual(self, a, b, places=9) -> None:
+        self.assertEqual(len(a), len(b))
+        for u, v in zip(a, b):
+            self.assertAlmostEqual(u, v, places=places)
+
+    def test_exp_matches_axis_angle(self) -> None:
+        rotation = poser.Rotation.exp(vector=(0.0, 0.0, math.pi / 2))
+        self.assertValuesAlmostEqual(
+            rotation.transformed_point(poser.Point(x=1.0)).as_tuple,
+            (0.0, 1.0, 0.0),
+        )
+
+    def test_log_round_trip(self) -> None:
+        for twist in TWISTS:
+            vector = twist[3:]
+            self.assertValuesAlmostEqual(
+                poser.Rotation.exp(vector=vector).log(), vector, places=12,
+            )
+
+    def test_log_of_identity_and_negated_quaternion(self) -> None:
+        self.assertEqual(poser.Rotation().log(), (0.0, 0.0, 0.0))
+        self.assertValuesAlmostEqual(
+            lie.so3_log(quaternion=(-math.cos(0.1), 0.0, -math.sin(0.1), 0.0)),
+            (0.0, 0.2, 0.0),
+            places=12,
+        )
+
+    def test_log_of_opk_rotation(self) -> None:
+        rotation = poser.Rotation(
+            rotation=OPKDeg(omega=20.0, phi=-35.0, kappa=140.0)
+        )
+        q1 = poser.Rotation.exp(vector=rotation.log()).quaternion
+        q2 = rotation.quaternion
+        self.assertValuesAlmostEqual(
+            (q1.w, q1.x, q1.y, q1.z),
+            (q2.w, q2.x, q2.y, q2.z),
+            places=12,
+        )
+
+    def test_log_of_zero_quaternion(self) -> None:
+        with self.assertRaises(ValueError):
+            lie.so3_log(quaternion=(0.0, 0.0, 0.0, 0.0))
+
+    def test_jacobians_are_inverse(self) -> None:
+        for twist in TWISTS:
+            vector = twist[3:]
+            for jacobian in (
+                poser.Rotation.left_jacobian,
+                poser.Rotation.right_jacobian,
+            ):
+                j = jacobian(vector=vector)
+                inverse = jacobian(vector=vector, inverse=True)
+                for r in range(3):
+                    for c in range(3):
+                        self.assertAlmostEqual(
+                            sum(j[r][k] * inverse[k][c] for k in range(3)),
+                            float(r == c),
+                            places=12,
+                        )
+
+    def test_right_jacobian_is_rotated_left_jacobian(self) -> None:
+        for twist in TWISTS:
+            vector = twist[3:]
+            r = poser.Rotation.exp(vector=vector).adjoint()
+            left = poser.Rotation.left_jacobian(vector=vector)
+            right = poser.Rotation.right_jacobian(vector=vector)
+            for i in range(3):
+                for j in range(3):
+                    self.assertAlmostEqual(
+                        left[i][j],
+                        sum(r[i][k] * right[k][j] for k in range(3)),
+                        places=12,
+                    )
+
+    def test_small_angle_branch_is_continuous(self) -> None:
+        for inverse in (False, True):
+            below = lie.so3_left_jacobian(
+                vector=(0.0, 0.0, lie.SMALL_ANGLE * (1 - 1e-9)),
+                inverse=inverse,
+            )
+            above = lie.so3_left_jacobian(
+                vector=(0.0, 0.0, lie.SMALL_ANGLE * (1 + 1e-9)),
+                inverse=inverse,
+            )
+            self.assertValuesAlmostEqual(
+                flatten(below), flatten(above), places=9,
+            )
+
+    def test_batch_matches_scalar(self) -> None:
+        vectors = [value for twist in TWISTS for value in twist[3:]]
+        rotations = poser.RotationArray.exp(vectors=vectors)
+        self.assertEqual(len(rotations), len(TWISTS))
+        self.assertValuesAlmostEqual(rotations.log(), vectors, places=12)
+        for inverse in (False, True):
+            for (batch, scalar,) in (
+                (poser.RotationArray.left_jacobian, lie.so3_left_jacobian),
+                (poser.RotationArray.right_jacobian, lie.so3_right_jacobian),
+            ):
+                expected = []
+                for twist in TWISTS:
+                    expected += flatten(
+                        scalar(vector=twist[3:], inverse=inverse)
+                    )
+                self.assertValuesAlmostEqual(
+                    batch(vectors=vectors, inverse=inverse),
+                    expected,
+                    places=15,
+                )
+
+    def test_batch_rejects_bad_length(self) -> None:
+        with self.assertRaises(ValueError):
+            lie.so3_exp_batch(vectors=[0.0, 1.0])
+
+
+class TestSE3(unittest.TestCase):
+    def assertValuesAlmostEqual(self, a, b, places=9) -> None:
+        self.assertEqual(len(a), len(b))
+        for u, v in zip(a, b):
+            self.assertAlmostEqual(u, v, places=places)
+
+    def test_exp_of_pure_translation(self) -> None:
+        pose = poser.Pose.exp(twist=(1.0, -2.0, 0.5, 0.0, 0.0, 0.0))
+        self.assertEqual(pose.translation.as_tuple, (1.0, -2.0, 0.5))
+        self.assertEqual(pose.rotation, poser.Rotation())
+
+    def test_log_round_trip(self) -> None:
+        for twist in TWISTS:
+            self.assertValuesAlmostEqual(
+                poser.Pose.exp(twist=twist).log(), twist, places=9,
+            )
+
+    def test_exp_of_scaled_twist_is_power(self) -> None:
+        twist = TWISTS[4]
+        pose = poser.Pose.exp(twist=twist)
+        self.assertValuesAlmostEqual(
+            flatten(poser.Pose.exp(twist=[2 * v for v in twist]).as_tuple),
+            flatten((pose * pose).as_tuple),
+            places=12,
+        )
+
+    def test_adjoint(self) -> None:
+        pose = poser.Pose.exp(twist=TWISTS[5])
+        adjoint = pose.adjoint()
+        twist = (0.2, -0.1, 0.3, 0.05, 0.1, -0.2)
+        self.assertValuesAlmostEqual(
+            (pose * poser.Pose.exp(twist=twist) * ~pose).log(),
+            [sum(a * b for a, b in zip(row, twist)) for row in adjoint],
+            places=12,
+        )
+
+    def test_left_jacobian_matches_finite_differences(self) -> None:
+        for twist in TWISTS[:-1]:
+            self.assertValuesAlmostEqual(
+                flatten(poser.Pose.left_jacobian(twist=twist)),
+                flatten(numeric_left_jacobian(twist=twist)),
+                places=7,
+            )
+
+    def test_jacobians_are_inverse(self) -> None:
+        for twist in TWISTS:
+            for jacobian in (
+                poser.Pose.left_jacobian,
+                poser.Pose.right_jacobian,
+            ):
+                j = jacobian(twist=twist)
+                inverse = jacobian(twist=twist, inverse=True)
+                for r in range(6):
+                    for c in range(6):
+                        self.assertAlmostEqual(
+                            sum(j[r][k] * inverse[k][c] for k in range(6)),
+                            float(r == c),
+                            places=9,
+                        )
+
+    def test_small_angle_branch_is_continuous(self) -> None:
+        below = lie.se3_left_jacobian(
+            twist=(1.0, 2.0, 3.0, 0.0, lie.SMALL_ANGLE * (1 - 1e-9), 0.0)
+        )
+        above = lie.se3_left_jacobian(
+            twist=(1.0, 2.0, 3.0, 0.0, lie.SMALL_ANGLE * (1 + 1e-9), 0.0)
+        )
+        self.assertValuesAlmostEqual(flatten(below), flatten(above), places=9)
+
+    def test_batch_matches_scalar(self) -> None:
+        twists = [value for twist in TWISTS for value in twist]
+        poses = poser.PoseArray.exp(twists=twists)
+        self.assertEqual(len(poses), len(TWISTS))
+        self.assertValuesAlmostEqual(poses.log(), twists, places=9)
+        adjoints = poses.adjoint()
+        for i, pose in enumerate(poses):
+            self.assertEqual(pose, poser.Pose.exp(twist=TWISTS[i]))
+            self.assertValuesAlmostEqual(
+                adjoints[36 * i:36 * i + 36],
+                flatten(pose.adjoint()),
+                places=15,
+            )
+        for inverse in (False, True):
+            for (batch, scalar,) in (
+                (poser.PoseArray.left_jacobian, lie.se3_left_jacobian),
+                (poser.PoseArray.right_jacobian, lie.se3_right_jacobian),
+            ):
+                expected = []
+                for twist in TWISTS:
+                    expected += flatten(scalar(twist=twist, inverse=inverse))
+                self.assertValuesAlmostEqual(
+                    batch(twists=twists, inverse=inverse),
+                    expected,
+                    places=15,
+                )
+
+    def test_pure_python_fallback(self) -> None:
+        twists = [value for twist in TWISTS for value in twist]
+        vectors = [value for twist in TWISTS for value in twist[3:]]
+        translations = [value for twist in TWISTS for value in twist[:3]]
+        quaternions = list(lie.so3_exp_batch(vectors=vectors))
+        quaternions[4:8] = [-value for value in quaternions[4:8]]
+
+        def results() -> list:
+            values = [
+                lie.so3_exp_batch(vectors=vectors),
+                lie.so3_log_batch(quaternions=quaternions),
+                lie.se3_log_batch(
+                    translations=translations,
+                    quaternions=quaternions,
+                ),
+                lie.se3_adjoint_batch(
+                    translations=translations,
+                    quaternions=quaternions,
+                ),
+            ]
+            values += lie.se3_exp_batch(twists=twists)
+            for inverse in (False, True):
+                values += [
+                    lie.so3_left_jacobian_batch(
+                        vectors=vectors,
+                        inverse=inverse,
+                    ),
+                    lie.so3_right_jacobian_batch(
+                        vectors=vectors,
+                        inverse=inverse,
+                    ),
+                    lie.se3_left_jacobian_batch(
+                        twists=twists,
+                        inverse=inverse,
+                    ),
+                    lie.se3_right_jacobian_batch(
+                        twists=twists,
+                        inverse=inverse,
+                    ),
+                ]
+            return values
+
+        expected = results()
+        with mock.patch.object(lie, "np", None):
+            actual = results()
+            with self.assertRaises(ValueError):
+                lie.so3_log_batch(quaternions=[0.0] * 4)
+        with self.assertRaises(ValueError):
+            lie.so3_log_batch(quaternions=[1.0, 0.0, 0.0, 0.0] + [0.0] * 4)
+        with self.assertRaises(ValueError):
+            lie.se3_adjoint_batch(
+                translations=[0.0] * 3,
+                quaternions=[0.0] * 4,
+            )
+        for a, b in zip(actual, expected):
+            self.assertValuesAlmostEqual(a, b, places=12)
+
+    def test_batch_rejects_mismatched_lengths(self) -> None:
+        with self.assertRaises(ValueError):
+            lie.se3_log_batch(
+                translations=[0.0] * 6,
+                quaternions=[1.0, 0.0, 0.0, 0.0],
+            )
@@ -0,0 +1,131 @@
+import math
+import os
+import tempfile
+import unittest
+
+import poser
+import poser.io
+import poser.rotation.representations
+
+
+OPKDeg = poser.rotation.representations.OPKDeg
+
+
+TABLE = """# id x y z omega phi kappa
+IMG_001 1000.5 2000.25 350.0 1.5 -2.25 45.0
+IMG_002 1010.5 2001.25 351.0 -0.5 3.0 -135.0
+
+IMG_003 1020.5 2002.25 352.0 0.0 0.0 179.5
+"""
+
+
+class TestOPKFile(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "eo.txt")
+        with open(self.path, "w") as file:
+            file.write(TABLE)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def assertMatchesScalar(self, pose, row) -> None:
+        expected = poser.Pose(
+            translation=poser.Translation(*row[:3]),
+            rotation=poser.Rotation(rotation=OPKDeg(*row[3:])),
+        )
+        for a, b in zip(pose.translation.as_tuple, expected.translation.as_tuple):
+            self.assertAlmostEqual(a, b, places=10)
+        q1, q2 = pose.rotation.quaternion, expected.rotation.quaternion
+        for a, b in zip((q1.w, q1.x, q1.y, q1.z), (q2.w, q2.x, q2.y, q2.z)):
+            self.assertAlmostEqual(a, b, places=10)
+
+    def test_read(self) -> None:
+        (ids, poses,) = poser.io.read_opk_file(path=self.path)
+        self.assertListEqual(ids, ["IMG_001", "IMG_002", "IMG_003"])
+        self.assertIsInstance(poses, poser.PoseArray)
+        self.assertEqual(len(poses), 3)
+        self.assertMatchesScalar(
+            poses[1], (1010.5, 2001.25, 351.0, -0.5, 3.0, -135.0)
+        )
+
+    def test_read_columns_units_and_delimiter(self) -> None:
+        with open(self.path, "w") as file:
+            file.write("kappa,phi,omega,name,X,Y,Z\n")
+            file.write(
+                f"{math.radians(45.0)}, {math.radians(-2.25)}, "
+                f"{math.radians(1.5)}, a, 1.0, 2.0, 3.0\n"
+            )
+        (ids, poses,) = poser.io.read_opk_file(
+            path=self.path,
+            columns=("kappa", "phi", "omega", "id", "x", "y", "z"),
+            delimiter=",",
+            angle_unit="rad",
+            skip_rows=1,
+        )
+        self.assertListEqual(ids, ["a"])
+        self.assertMatchesScalar(poses[0], (1.0, 2.0, 3.0, 1.5, -2.25, 45.0))
+
+    def test_skip_columns_without_ids(self) -> None:
+        (ids, poses,) = poser.io.read_opk_file(
+            path=self.path,
+            columns=(None, "x", "y", "z", "omega", "phi", "kappa"),
+        )
+        self.assertIsNone(ids)
+        self.assertEqual(len(poses), 3)
+
+    def test_iter_chunks(self) -> None:
+        chunks = list(poser.io.iter_opk_file(path=self.path, chunk_size=2))
+        self.assertListEqual(
+            [ids for (ids, _,) in chunks],
+            [["IMG_001"], ["IMG_002"], ["IMG_003"]],
+        )
+        (_, poses,) = chunks[-1]
+        self.assertMatchesScalar(
+            poses[0], (1020.5, 2002.25, 352.0, 0.0, 0.0, 179.5)
+        )
+
+    def test_write_round_trip(self) -> None:
+        (ids, poses,) = poser.io.read_opk_file(path=self.path)
+        path = os.path.join(self.directory.name, "out.csv")
+        count = poser.io.write_opk_file(
+            path=path,
+            poses=poses,
+            ids=ids,
+            delimiter=",",
+            angle_unit="gon",
+            header="id,x,y,z,omega,phi,kappa",
+        )
+        self.assertEqual(count, 3)
+        (read_ids, read_poses,) = poser.io.read_opk_file(
+            path=path,
+            delimiter=",",
+            angle_unit="gon",
+            skip_rows=1,
+        )
+        self.assertListEqual(read_ids, ids)
+        for pose, row in zip(
+            read_poses,
+            (
+                (1000.5, 2000.25, 350.0, 1.5, -2.25, 45.0),
+                (1010.5, 2001.25, 351.0, -0.5, 3.0, -135.0),
+                (1020.5, 2002.25, 352.0, 0.0, 0.0, 179.5),
+            ),
+        ):
+            self.assertMatchesScalar(pose, row)
+
+    def test_invalid(self) -> None:
+        with self.assertRaises(ValueError):
+            poser.io.read_opk_file(path=self.path, angle_unit="turns")
+        with self.assertRaises(ValueError):
+            poser.io.read_opk_file(path=self.path, columns=("id", "x", "y"))
+        with self.assertRaises(ValueError):
+            poser.io.iter_opk_file(path=self.path, chunk_size=0)
+        with open(self.path, "a") as file:
+            file.write("IMG_004 1.0 2.0\n")
+        with self.assertRaises(ValueError):
+            poser.io.read_opk_file(path=self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+import poser
+import poser.parallel
+import poser.rotation.representations
+
+
+OPKDeg = poser.rotation.representations.OPKDeg
+
+
+class TestParallelTransform(unittest.TestCase):
+    def setUp(self) -> None:
+        self.pose = poser.Pose(
+            translation=poser.Translation(x=10.0, y=-2.0, z=1.0),
+            rotation=poser.Rotation(
+                rotation=OPKDeg(omega=45.0, phi=-20.0, kappa=130.0)
+            )
+        )
+        self.points = poser.PointArray(
+            coordinates=array("d", (0.5 * i for i in range(3 * 1001)))
+        )
+        self.expected = self.pose.transformed_points(points=self.points)
+
+    def test_transform_points(self) -> None:
+        poser.parallel.transform_points(
+            pose=self.pose,
+            points=self.points,
+            workers=2,
+        )
+        self.assertEqual(self.points, self.expected)
+
+    def test_pose_workers(self) -> None:
+        self.pose.transform_points(points=self.points, workers=3)
+        self.assertEqual(self.points, self.expected)
+
+    def test_memoryview_buffer(self) -> None:
+        buffer = bytearray(self.points.coordinates.tobytes())
+        points = poser.PointArray(coordinates=memoryview(buffer).cast("d"))
+        self.pose.transform_points(points=points, workers=2)
+        self.assertEqual(points, self.expected)
+
+    def test_single_worker(self) -> None:
+        poser.parallel.transform_points(
+            pose=self.pose,
+            points=self.points,
+            workers=1,
+        )
+        self.assertEqual(self.points, self.expected)
+
+    def test_shared_point_array(self) -> None:
+        with poser.parallel.SharedPointArray(
+            coordinates=self.points.coordinates,
+        ) as points:
+            self.assertEqual(points, self.points)
+            self.pose.transform_points(points=points, workers=2)
+            self.assertEqual(points, self.expected)
+            buffer = points.shared_memory.buf[:24 * len(points)].cast("d")
+            self.assertEqual(
+                poser.PointArray(coordinates=buffer), self.expected,
+            )
+            buffer.release()
+        self.assertEqual(len(points), 0)
+
+    def test_executor(self) -> None:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            for _ in range(2):
+                with poser.parallel.SharedPointArray(
+                    coordinates=self.points.coordinates,
+                ) as points:
+                    poser.parallel.transform_points(
+                        pose=self.pose,
+                        points=points,
+                        workers=2,
+                        executor=executor,
+                    )
+                    self.assertEqual(points, self.expected)
+            poser.parallel.transform_points(
+                pose=self.pose,
+                points=self.points,
+                workers=2,
+                executor=executor,
+            )
+        self.assertEqual(self.points, self.expected)
+
+    def test_shared_point_array_zeros(self) -> None:
+        points = poser.parallel.SharedPointArray.zeros(length=4)
+        try:
+            self.pose.transform_points(points=points, workers=2)
+            self.assertEqual(
+                points.as_list, [self.pose.translation.as_list] * 4
+            )
+        finally:
+            points.close()
+        points.close()
+
+    def test_wrong_type(self) -> None:
+        with self.assertRaises(TypeError):
+            self.pose.transform_points(points=[poser.Point()], workers=2)
+        with self.assertRaises(TypeError):
+            poser.parallel.transform_points(
+                pose=self.pose,
+                points=[poser.Point()],
+                workers=2,
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,278 @@
+import unittest
+from array import array
+from unittest import mock
+
+import poser
+import poser.buffers
+import poser.point_array
+import poser.rotation.representations
+
+
+Matrix = poser.rotation.representations.Matrix
+OPKDeg = poser.rotation.representations.OPKDeg
+
+
+class TestPointArrayInit(unittest.TestCase):
+    def test_init_empty(self) -> None:
+        pa = poser.PointArray()
+        self.assertIsInstance(pa, poser.PointArray)
+        self.assertEqual(len(pa), 0)
+
+    def test_init_array(self) -> None:
+        coordinates = array("d", [1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+        pa = poser.PointArray(coordinates=coordinates)
+        pa.coordinates[0] = 7.0
+        self.assertEqual(coordinates[0], 7.0)
+        self.assertEqual(len(pa), 2)
+
+    def test_init_buffer(self) -> None:
+        buffer = bytearray(array("d", [1.0, 2.0, 3.0]).tobytes())
+        pa = poser.PointArray(coordinates=memoryview(buffer).cast("d"))
+        pa.coordinates[0] = 7.0
+        self.assertEqual(array("d", buffer)[0], 7.0)
+
+    def test_init_bytes(self) -> None:
+        data = array("d", [1.0, 2.0, 3.0]).tobytes()
+        for values in (data, bytearray(data), memoryview(data)):
+            pa = poser.PointArray(coordinates=values)
+            self.assertListEqual(pa.as_list, [[1.0, 2.0, 3.0]])
+        with self.assertRaises(ValueError):
+            poser.PointArray(coordinates=bytes(12))
+
+    def test_init_float32_buffer(self) -> None:
+        pa = poser.PointArray(coordinates=array("f", [1.0, 2.0, 3.0]))
+        self.assertListEqual(pa.as_list, [[1.0, 2.0, 3.0]])
+
+    def test_init_iterable(self) -> None:
+        pa = poser.PointArray(coordinates=[1, 2, 3])
+        self.assertListEqual(pa.as_list, [[1.0, 2.0, 3.0]])
+
+    def test_init_wrong_length(self) -> None:
+        with self.assertRaises(ValueError):
+            poser.PointArray(coordinates=[1.0, 2.0])
+
+    def test_from_points(self) -> None:
+        pa = poser.PointArray.from_points(
+            points=[
+                poser.Point(x=1.0, y=2.0, z=3.0),
+                poser.Translation(x=4.0, y=5.0, z=6.0),
+            ]
+        )
+        self.assertEqual(len(pa), 2)
+        self.assertTupleEqual(
+            pa.as_tuple,
+            ((1.0, 2.0, 3.0,), (4.0, 5.0, 6.0,),)
+        )
+
+    def test_from_points_wrong_type(self) -> None:
+        with self.assertRaises(TypeError):
+            poser.PointArray.from_points(points=[Matrix()])
+
+
+class TestPointArrayAccess(unittest.TestCase):
+    def test_getitem(self) -> None:
+        pa = poser.PointArray(coordinates=[1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+        self.assertEqual(pa[1], poser.Point(x=4.0, y=5.0, z=6.0))
+        self.assertEqual(pa[-2], poser.Point(x=1.0, y=2.0, z=3.0))
+        with self.assertRaises(IndexError):
+            pa[2]
+
+    def test_getitem_slice(self) -> None:
+        pa = poser.PointArray(coordinates=range(9))
+        self.assertListEqual(pa[1:].as_list, [[3, 4, 5], [6, 7, 8]])
+        self.assertListEqual(pa[::2].as_list, [[0, 1, 2], [6, 7, 8]])
+
+    def test_setitem(self) -> None:
+        pa = poser.PointArray.zeros(length=2)
+        pa[1] = poser.Point(x=1.0, y=2.0, z=3.0)
+        self.assertListEqual(pa.as_list, [[0, 0, 0], [1, 2, 3]])
+
+    def test_iter(self) -> None:
+        pa = poser.PointArray(coordinates=[1.0, 2.0, 3.0])
+        points = pa.to_points()
+        self.assertIsInstance(points[0], poser.Point)
+        self.assertEqual(points[0], poser.Point(x=1.0, y=2.0, z=3.0))
+
+    @unittest.skipIf(poser.buffers.np is None, "numpy is not installed")
+    def test_init_row_view(self) -> None:
+        np = poser.buffers.np
+        records = np.arange(12, dtype=np.float64).reshape(3, 4)
+        pa = poser.PointArray(coordinates=records[:, 1:])
+        self.assertEqual(len(pa), 3)
+        self.assertIs(pa.xyz.base, records.base)
+        self.assertListEqual(pa[1].as_list, [5.0, 6.0, 7.0])
+        self.assertListEqual(
+            pa.coordinates.tolist(), [1.0, 2.0, 3.0, 5.0, 6.0, 7.0, 9.0, 10.0, 11.0],
+        )
+        pa.coordinates[0] = -1.0
+        self.assertEqual(records[0, 1], 1.0)
+        self.assertEqual(pa.xyz[0, 0], -1.0)
+
+    @unittest.skipIf(poser.buffers.np is None, "numpy is not installed")
+    def test_xyz(self) -> None:
+        pa = poser.PointArray(coordinates=[1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+        self.assertEqual(pa.xyz.shape, (2, 3))
+        pa.xyz[1, 2] = 9.0
+        self.assertListEqual(pa.as_list, [[1, 2, 3], [4, 5, 9]])
+
+
+class TestPointArrayTransformations(unittest.TestCase):
+    def test_translation(self) -> None:
+        pa = poser.PointArray(coordinates=[1.0, 2.0, 3.0])
+        t = poser.Translation(x=2.0, y=4.0, z=6.0)
+        res = t.transformed_points(points=pa)
+        self.assertIsInstance(res, poser.PointArray)
+        self.assertListEqual(res.as_list, [[3.0, 6.0, 9.0]])
+        self.assertListEqual(pa.as_list, [[1.0, 2.0, 3.0]])
+        t.transform_points(points=pa)
+        self.assertListEqual(pa.as_list, [[3.0, 6.0, 9.0]])
+
+    def test_rotation(self) -> None:
+        pa = poser.PointArray(coordinates=[1.0, 2.0, 3.0])
+        r = poser.Rotation(
+            rotation=Matrix(r11=-1, r22=-1, r33=-1)
+        )
+        res = r.transformed_points(points=pa)
+        self.assertIsInstance(res, poser.PointArray)
+        self.assertListEqual(res.as_list, [[-1.0, -2.0, -3.0]])
+        r.transform_points(points=pa)
+        self.assertListEqual(pa.as_list, [[-1.0, -2.0, -3.0]])
+
+    def test_pose(self) -> None:
+        points = [
+            poser.Point(x=0.0, y=1.414, z=1.414),
+            poser.Point(x=1.0, y=2.0, z=3.0),
+        ]
+        pose = poser.Pose(
+            translation=poser.Translation(z=1.0),
+            rotation=poser.Rotation(
+                rotation=OPKDeg(omega=45.0, phi=10.0, kappa=-20.0)
+            )
+        )
+        pa = poser.PointArray.from_points(points=points)
+        res = pose.transformed_points(points=pa)
+        self.assertIsInstance(res, poser.PointArray)
+        pose.transform_points(points=pa)
+        for point, a, b in zip(points, res, pa):
+            expected = pose.transformed_point(point=point)
+            for p in (a, b):
+                self.assertAlmostEqual(p.x, expected.x, places=10)
+                self.assertAlmostEqual(p.y, expected.y, places=10)
+                self.assertAlmostEqual(p.z, expected.z, places=10)
+
+    def test_pure_python_fallback(self) -> None:
+        pose = poser.Pose(
+            translation=poser.Translation(x=1.0, y=-2.0, z=0.5),
+            rotation=poser.Rotation(
+                rotation=OPKDeg(omega=45.0, phi=10.0, kappa=-20.0)
+            )
+        )
+        pa = poser.PointArray(coordinates=[0.5 * i for i in range(12)])
+        expected = pose.transformed_points(points=pa).as_list
+        records = array("d")
+        for point in pa:
+            records.extend(point.as_tuple + (-1.0,))
+        with mock.patch.object(poser.point_array, "np", None):
+            pose.transform_points(points=pa)
+            poser.PointArray._affine(
+                source=records,
+                target=records,
+                rotation=pose.rotation.as_tuple,
+                translation=pose.translation.as_tuple,
+                stride=4,
+            )
+        for a, b in zip(pa.as_list, expected):
+            for u, v in zip(a, b):
+                self.assertAlmostEqual(u, v, places=12)
+        for i in range(4):
+            for u, v in zip(records[4*i:4*i + 3], expected[i]):
+                self.assertAlmostEqual(u, v, places=12)
+            self.assertEqual(records[4*i + 3], -1.0)
+
+
+class TestTransformedPointsOut(unittest.TestCase):
+    def setUp(self) -> None:
+        self.points = [
+            poser.Point(x=1.0, y=2.0, z=3.0),
+            poser.Translation(x=-4.0, y=5.0, z=0.5),
+        ]
+        self.pose = poser.Pose(
+            translation=poser.Translation(x=10.0, y=-2.0, z=1.0),
+            rotation=poser.Rotation(
+                rotation=OPKDeg(omega=45.0, phi=-20.0, kappa=130.0)
+            )
+        )
+        self.expected = [
+            v for p in self.pose.transformed_points(points=self.points)
+            for v in p.as_tuple
+        ]
+
+    def assertExpected(self, values) -> None:
+        self.assertEqual(len(values), len(self.expected))
+        for a, b in zip(values, self.expected):
+            self.assertAlmostEqual(a, b, places=10)
+
+    def test_out_array(self) -> None:
+        out = array("d", bytes(48))
+        res = self.pose.transformed_points(points=self.points, out=out)
+        self.assertIs(res, out)
+        self.assertExpected(out)
+
+    def test_out_buffer(self) -> None:
+        buffer = bytearray(48)
+        out = memoryview(buffer).cast("d")
+        self.pose.transformed_points(
+            points=poser.PointArray.from_points(points=self.points),
+            out=out,
+        )
+        self.assertExpected(array("d", buffer))
+
+    def test_out_point_array(self) -> None:
+        out = poser.PointArray.zeros(length=2)
+        self.pose.transformed_points(
+            points=poser.PointArray.from_points(points=self.points),
+            out=out,
+        )
+        self.assertExpected(out.coordinates)
+
+    def test_out_list(self) -> None:
+        out = [poser.Point(), poser.Point()]
+        first = out[0]
+        res = self.pose.transformed_points(points=tuple(self.points), out=out)
+        self.assertIs(res, out)
+        self.assertIs(out[0], first)
+        self.assertExpected([v for p in out for v in p.as_tuple])
+        self.pose.transformed_points(
+            points=poser.PointArray.from_points(points=self.points),
+            out=out,
+        )
+        self.assertExpected([v for p in out for v in p.as_tuple])
+
+    def test_out_rotation_translation(self) -> None:
+        out = array("d", bytes(48))
+        self.pose.translation.transformed_points(
+            points=self.pose.rotation.transformed_points(
+                points=self.points,
+                out=[poser.Point(), poser.Point()],
+            ),
+            out=out,
+        )
+        self.assertExpected(out)
+
+    def test_out_wrong_length(self) -> None:
+        with self.assertRaises(ValueError):
+            self.pose.transformed_points(points=self.points, out=array("d", bytes(24)))
+        with self.assertRaises(ValueError):
+            self.pose.transformed_points(points=self.points, out=[poser.Point()])
+
+    def test_out_wrong_type(self) -> None:
+        with self.assertRaises(TypeError):
+            self.pose.transformed_points(points=self.points, out=bytes(48))
+        with self.assertRaises(TypeError):
+            self.pose.transformed_points(points=self.points, out=array("i", bytes(24)))
+        with self.assertRaises(TypeError):
+            self.pose.transformed_points(points=self.points, out=object())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+import os
+import struct
+import tempfile
+import unittest
+from array import array
+
+import poser
+import poser.io
+import poser.rotation.representations
+
+
+OPKDeg = poser.rotation.representations.OPKDeg
+
+
+class TestTransformPointFile(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "points.bin")
+        self.pose = poser.Pose(
+            translation=poser.Translation(x=10.0, y=-2.0, z=1.0),
+            rotation=poser.Rotation(
+                rotation=OPKDeg(omega=45.0, phi=-20.0, kappa=130.0)
+            )
+        )
+        self.coordinates = array("d", (0.25 * i for i in range(3 * 10)))
+        self.expected = self.pose.transformed_points(
+            points=poser.PointArray(coordinates=self.coordinates)
+        ).coordinates
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def assertExpected(self, values, places=10) -> None:
+        self.assertEqual(len(values), len(self.expected))
+        for a, b in zip(values, self.expected):
+            self.assertAlmostEqual(a, b, places=places)
+
+    def test_in_place_float64(self) -> None:
+        with open(self.path, "wb") as file:
+            self.coordinates.tofile(file)
+        count = poser.io.transform_point_file(
+            pose=self.pose,
+            path=self.path,
+            chunk_size=3,
+        )
+        self.assertEqual(count, 10)
+        with open(self.path, "rb") as file:
+            self.assertExpected(array("d", file.read()))
+
+    def test_out_path_float32_header(self) -> None:
+        out_path = os.path.join(self.directory.name, "out.bin")
+        with open(self.path, "wb") as file:
+            file.write(b"HEAD")
+            array("f", self.coordinates).tofile(file)
+        poser.io.transform_point_file(
+            pose=self.pose,
+            path=self.path,
+            out_path=out_path,
+            dtype="f",
+            header_size=4,
+            chunk_size=4,
+        )
+        with open(self.path, "rb") as file:
+            self.assertEqual(file.read(4), b"HEAD")
+            self.assertListEqual(
+                array("f", file.read()).tolist(),
+                array("f", self.coordinates).tolist(),
+            )
+        with open(out_path, "rb") as file:
+            self.assertEqual(file.read(4), b"HEAD")
+            self.assertExpected(array("f", file.read()), places=3)
+
+    def test_strided_attributes(self) -> None:
+        with open(self.path, "wb") as file:
+            for i in range(10):
+                file.write(struct.pack("=d", -i))
+                self.coordinates[3*i:3*i + 3].tofile(file)
+                file.write(struct.pack("=d", i))
+        poser.io.transform_point_file(
+            pose=self.pose,
+            path=self.path,
+            record_size=40,
+            xyz_offset=8,
+            chunk_size=3,
+        )
+        with open(self.path, "rb") as file:
+            values = array("d", file.read())
+        self.assertListEqual(values[0::5].tolist(), [-i for i in range(10)])
+        self.assertListEqual(values[4::5].tolist(), list(range(10)))
+        self.assertExpected([v for i in range(10) for v in values[5*i + 1:5*i + 4]])
+
+    def test_packed_attributes(self) -> None:
+        with open(self.path, "wb") as file:
+            for i in range(10):
+                file.write(struct.pack("=B", i))
+                self.coordinates[3*i:3*i + 3].tofile(file)
+        poser.io.transform_point_file(
+            pose=self.pose,
+            path=self.path,
+            record_size=25,
+            xyz_offset=1,
+        )
+        with open(self.path, "rb") as file:
+            data = file.read()
+        self.assertListEqual([data[25*i] for i in range(10)], list(range(10)))
+        self.assertExpected(
+            [v for i in range(10) for v in struct.unpack_from("=3d", data, 25*i + 1)]
+        )
+
+    def test_wrong_size(self) -> None:
+        with open(self.path, "wb") as file:
+            file.write(bytes(25))
+        with self.assertRaises(ValueError):
+            poser.io.transform_point_file(pose=self.pose, path=self.path)
+
+    def test_wrong_layout(self) -> None:
+        with self.assertRaises(ValueError):
+            poser.io.transform_point_file(pose=self.pose, path=self.path, dtype="i")
+        with self.assertRaises(ValueError):
+            poser.io.transform_point_file(
+                pose=self.pose,
+                path=self.path,
+                record_size=24,
+                xyz_offset=8,
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -44,6 +44,18 @@ class TestPoint(unittest.TestCase):
         self.assertAlmostEqual(res.y, 2.0, places=4)
         self.assertAlmostEqual(res.z, 3.0, places=4)
 
+    def test_slots(self) -> None:
+        res = Point()
+        self.assertFalse(hasattr(res, "__dict__"))
+        with self.assertRaises(AttributeError):
+            res.w = 1.0
+
+    def test_unchecked(self) -> None:
+        res = Point._unchecked(1.0, 2.0, 3.0)
+        self.assertIsInstance(res, Point)
+        self.assertEqual(res, Point(x=1, y=2, z=3))
+        self.assertEqual(poser.Translation._unchecked(1.0, 2.0, 3.0), poser.Translation(x=1, y=2, z=3))
+
     def test_init_wrong(self) -> None:
         with self.assertRaises(ValueError):
             Point(x=1.0, y=2, z="drei")
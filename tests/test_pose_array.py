@@ -0,0 +1,210 @@
+import unittest
+from unittest import mock
+
+import poser
+import poser.buffers
+import poser.pose_array
+import poser.rotation.representations
+
+
+OPKDeg = poser.rotation.representations.OPKDeg
+
+
+POSES = [
+    poser.Pose(
+        translation=poser.Translation(x=1.0, y=2.0, z=3.0),
+        rotation=poser.Rotation(rotation=OPKDeg(omega=10.0, phi=20.0, kappa=30.0)),
+    ),
+    poser.Pose(
+        translation=poser.Translation(x=-4.0, y=0.5, z=100.0),
+        rotation=poser.Rotation(rotation=OPKDeg(omega=-170.0, phi=5.0, kappa=95.0)),
+    ),
+    poser.Pose(
+        translation=poser.Translation(x=0.0, y=-7.0, z=1.0),
+        rotation=poser.Rotation(rotation=OPKDeg(omega=0.0, phi=-45.0, kappa=-60.0)),
+    ),
+]
+
+
+class PoseAssertions(unittest.TestCase):
+    def assertPoseAlmostEqual(self, a: poser.Pose, b: poser.Pose) -> None:
+        for r1, r2 in zip(a.as_tuple, b.as_tuple):
+            for v1, v2 in zip(r1, r2):
+                self.assertAlmostEqual(v1, v2, places=8)
+
+
+class TestPoseArrayInit(PoseAssertions):
+    def test_init_empty(self) -> None:
+        pa = poser.PoseArray()
+        self.assertIsInstance(pa, poser.PoseArray)
+        self.assertEqual(len(pa), 0)
+
+    def test_init_defaults(self) -> None:
+        pa = poser.PoseArray(translations=[1.0, 2.0, 3.0])
+        self.assertEqual(len(pa), 1)
+        self.assertListEqual(pa.rotations.quaternions.tolist(), [1.0, 0.0, 0.0, 0.0])
+        pa = poser.PoseArray(rotations=[1.0, 0.0, 0.0, 0.0])
+        self.assertListEqual(pa.translations.as_list, [[0.0, 0.0, 0.0]])
+
+    def test_init_wrong_length(self) -> None:
+        with self.assertRaises(ValueError):
+            poser.PoseArray(
+                translations=poser.PointArray.zeros(length=2),
+                rotations=poser.RotationArray.identity(length=3),
+            )
+
+    def test_from_poses(self) -> None:
+        pa = poser.PoseArray.from_poses(poses=POSES)
+        self.assertEqual(len(pa), 3)
+        for a, b in zip(pa, POSES):
+            self.assertIsInstance(a, poser.Pose)
+            self.assertPoseAlmostEqual(a, b)
+
+    def test_from_poses_wrong_type(self) -> None:
+        with self.assertRaises(TypeError):
+            poser.PoseArray.from_poses(poses=[poser.Translation()])
+
+    def test_slice(self) -> None:
+        pa = poser.PoseArray.from_poses(poses=POSES)[1:]
+        self.assertIsInstance(pa, poser.PoseArray)
+        self.assertPoseAlmostEqual(pa[0], POSES[1])
+
+
+class TestPoseArrayMagics(PoseAssertions):
+    def test_invert(self) -> None:
+        res = ~poser.PoseArray.from_poses(poses=POSES)
+        self.assertIsInstance(res, poser.PoseArray)
+        for a, b in zip(res, POSES):
+            self.assertPoseAlmostEqual(a, ~b)
+
+    def test_multiply(self) -> None:
+        pa = poser.PoseArray.from_poses(poses=POSES)
+        other = poser.PoseArray.from_poses(poses=reversed(POSES))
+        res = pa * other
+        for a, b, c in zip(res, POSES, reversed(POSES)):
+            self.assertPoseAlmostEqual(a, b * c)
+
+    def test_multiply_broadcast(self) -> None:
+        pa = poser.PoseArray.from_poses(poses=POSES)
+        boresight = POSES[0]
+        for a, b in zip(pa * boresight, POSES):
+            self.assertPoseAlmostEqual(a, b * boresight)
+        for a, b in zip(boresight * pa, POSES):
+            self.assertPoseAlmostEqual(a, boresight * b)
+
+    def test_multiply_inverse(self) -> None:
+        pa = poser.PoseArray.from_poses(poses=POSES)
+        for a in ~pa * pa:
+            self.assertPoseAlmostEqual(a, poser.Pose())
+
+
+class TestPoseArrayMethods(PoseAssertions):
+    def test_interpolated(self) -> None:
+        pa = poser.PoseArray.from_poses(poses=POSES)
+        other = poser.PoseArray.from_poses(poses=reversed(POSES))
+        for factor in (0.0, 0.25, 1.0):
+            res = pa.interpolated(other=other, factor=factor)
+            for a, b, c in zip(res, POSES, reversed(POSES)):
+                self.assertPoseAlmostEqual(
+                    a, b.interpolated(other=c, factor=factor)
+                )
+
+    def test_interpolated_factors(self) -> None:
+        p1 = poser.Pose(translation=poser.Translation(x=1.0))
+        p2 = poser.Pose(
+            translation=poser.Translation(x=2.0),
+            rotation=poser.Rotation(rotation=OPKDeg(omega=90.0)),
+        )
+        res = poser.PoseArray.from_poses(poses=[p1]).interpolated(
+            other=p2,
+            factor=[0.0, 0.5, 1.0],
+        )
+        self.assertEqual(len(res), 3)
+        self.assertAlmostEqual(res[1].translation.x, 1.5, places=8)
+        self.assertAlmostEqual(res[1].rotation.opk_deg.omega, 45.0, places=8)
+        self.assertPoseAlmostEqual(res[2], p2)
+
+    def test_interpolated_identical(self) -> None:
+        pa = poser.PoseArray.from_poses(poses=POSES)
+        res = pa.interpolated(other=pa, factor=0.3)
+        for a, b in zip(res, POSES):
+            self.assertPoseAlmostEqual(a, b)
+
+    def test_transformed_points_per_pose(self) -> None:
+        points = poser.PointArray(coordinates=[1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0])
+        pa = poser.PoseArray.from_poses(poses=POSES)
+        res = pa.transformed_points(points=points)
+        self.assertIsInstance(res, poser.PointArray)
+        pa.transform_points(points=points)
+        for pose, a, b, c in zip(POSES, res, points, [(1, 2, 3), (4, 5, 6), (7, 8, 9)]):
+            expected = pose.transformed_point(point=poser.Point(*c))
+            for p in (a, b):
+                self.assertAlmostEqual(p.x, expected.x, places=8)
+                self.assertAlmostEqual(p.y, expected.y, places=8)
+                self.assertAlmostEqual(p.z, expected.z, places=8)
+
+    def test_transformed_point_sets(self) -> None:
+        point_sets = [
+            poser.PointArray(coordinates=[1.0, 2.0, 3.0] * (i + 1))
+            for i in range(3)
+        ]
+        pa = poser.PoseArray.from_poses(poses=POSES)
+        res = pa.transformed_points(points=point_sets)
+        self.assertEqual(len(res), 3)
+        for pose, point_set in zip(POSES, res):
+            expected = pose.transformed_point(point=poser.Point(1.0, 2.0, 3.0))
+            for p in point_set:
+                self.assertAlmostEqual(p.x, expected.x, places=8)
+                self.assertAlmostEqual(p.y, expected.y, places=8)
+                self.assertAlmostEqual(p.z, expected.z, places=8)
+
+    def test_transformed_points_wrong_length(self) -> None:
+        pa = poser.PoseArray.from_poses(poses=POSES)
+        with self.assertRaises(ValueError):
+            pa.transformed_points(points=poser.PointArray.zeros(length=2))
+
+    def test_take(self) -> None:
+        pa = poser.PoseArray.from_poses(poses=POSES)
+        for indices in ([2, 0, -1, 0], (i for i in (2, 0, -1, 0))):
+            res = pa.take(indices=indices)
+            self.assertEqual(len(res), 4)
+            for a, b in zip(res, (POSES[2], POSES[0], POSES[2], POSES[0])):
+                self.assertPoseAlmostEqual(a, b)
+        self.assertEqual(len(pa.take(indices=[])), 0)
+        with self.assertRaises(IndexError):
+            pa.take(indices=[0, 3])
+        with self.assertRaises(IndexError):
+            pa.take(indices=[-4])
+
+    @unittest.skipIf(poser.buffers.np is None, "numpy is not installed")
+    def test_pure_python_fallback(self) -> None:
+        pa = poser.PoseArray.from_poses(poses=POSES)
+        other = poser.PoseArray.from_poses(poses=POSES[::-1])
+        points = poser.PointArray(coordinates=[1.0, -2.0, 3.5, 0.0, 4.0, -1.0, 7.0, 0.5, 2.0])
+
+        def results() -> list:
+            return [
+                pa * other,
+                pa * poser.PoseArray.from_poses(poses=POSES[:1]),
+                ~pa,
+                pa.interpolated(other=other, factor=0.25),
+                pa.interpolated(other=other, factor=[0.0, 0.5, 1.0]),
+                pa.take(indices=[2, -3, 1, 1]),
+            ]
+
+        expected = results()
+        expected_points = pa.transformed_points(points=points).as_list
+        with mock.patch.object(poser.pose_array, "np", None):
+            actual = results()
+            actual_points = pa.transformed_points(points=points).as_list
+        for a, b in zip(actual, expected):
+            self.assertEqual(len(a), len(b))
+            for p1, p2 in zip(a, b):
+                self.assertPoseAlmostEqual(p1, p2)
+        for p1, p2 in zip(actual_points, expected_points):
+            for v1, v2 in zip(p1, p2):
+                self.assertAlmostEqual(v1, v2, places=8)
+
+
+if __name__ == "__main__":
+    unittest.main()
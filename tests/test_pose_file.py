@@ -0,0 +1,153 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import poser
+import poser.buffers
+import poser.io
+import poser.io.pose_file
+import poser.rotation.representations
+
+
+OPKDeg = poser.rotation.representations.OPKDeg
+
+
+POSES = [
+    poser.Pose(
+        translation=poser.Translation(x=1.0, y=2.0, z=3.0),
+        rotation=poser.Rotation(rotation=OPKDeg(omega=10.0, phi=20.0, kappa=30.0)),
+    ),
+    poser.Pose(
+        translation=poser.Translation(x=-4.0, y=0.5, z=100.0),
+        rotation=poser.Rotation(rotation=OPKDeg(omega=-170.0, phi=5.0, kappa=95.0)),
+    ),
+    poser.Pose(
+        translation=poser.Translation(x=0.0, y=-7.0, z=1.0),
+        rotation=poser.Rotation(rotation=OPKDeg(omega=0.0, phi=-45.0, kappa=-60.0)),
+    ),
+]
+
+
+class TestPoseFile(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "poses.bin")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def assertPoseEqual(self, a: poser.Pose, b: poser.Pose) -> None:
+        self.assertTupleEqual(a.translation.as_tuple, b.translation.as_tuple)
+        q1, q2 = a.rotation.quaternion, b.rotation.quaternion
+        self.assertTupleEqual((q1.w, q1.x, q1.y, q1.z), (q2.w, q2.x, q2.y, q2.z))
+
+    def test_create_empty(self) -> None:
+        with poser.io.PoseFile.create(path=self.path) as pose_file:
+            self.assertEqual(len(pose_file), 0)
+            (timestamps, ids, poses,) = pose_file.read()
+            self.assertEqual(len(poses), 0)
+        self.assertEqual(os.path.getsize(self.path), 16)
+
+    def test_append_and_read(self) -> None:
+        with poser.io.PoseFile.create(path=self.path) as pose_file:
+            pose_file.append(timestamps=[0.0, 0.5], poses=POSES[:2], ids=[7, 9])
+            pose_file.append(
+                timestamps=[1.0],
+                poses=poser.PoseArray.from_poses(poses=POSES[2:]),
+            )
+            self.assertEqual(len(pose_file), 3)
+            self.assertPoseEqual(pose_file[1], POSES[1])
+        self.assertEqual(os.path.getsize(self.path), 16 + 3 * 72)
+        with poser.io.PoseFile(path=self.path) as pose_file:
+            self.assertEqual(len(pose_file), 3)
+            (timestamp, identifier, pose,) = pose_file.record(index=-1)
+            self.assertEqual(timestamp, 1.0)
+            self.assertEqual(identifier, 2)
+            self.assertPoseEqual(pose, POSES[2])
+            (timestamps, ids, poses,) = pose_file.read()
+            self.assertListEqual(timestamps.tolist(), [0.0, 0.5, 1.0])
+            self.assertListEqual(ids.tolist(), [7, 9, 2])
+            self.assertIsInstance(poses, poser.PoseArray)
+            for a, b in zip(poses, POSES):
+                self.assertPoseEqual(a, b)
+            part = pose_file[1:]
+            self.assertEqual(len(part), 2)
+            self.assertPoseEqual(part[0], POSES[1])
+            with self.assertRaises(IndexError):
+                pose_file[3]
+
+    def test_ids_round_trip(self) -> None:
+        ids = [0x7FF8000000000001, 1, -1, -(2**63), 2**63 - 1]
+        poses = [POSES[0]] * len(ids)
+        with poser.io.PoseFile.create(path=self.path) as pose_file:
+            pose_file.append(timestamps=range(len(ids)), poses=poses, ids=ids)
+            self.assertListEqual(pose_file.read()[1].tolist(), ids)
+            with mock.patch.object(poser.io.pose_file, "np", None):
+                self.assertListEqual(pose_file.read()[1].tolist(), ids)
+                pose_file.append(timestamps=[5.0], poses=POSES[:1], ids=ids[:1])
+            self.assertListEqual(pose_file.read()[1].tolist(), ids + ids[:1])
+
+    @unittest.skipIf(poser.buffers.np is None, "numpy is not installed")
+    def test_read_views(self) -> None:
+        np = poser.buffers.np
+        with poser.io.PoseFile.create(path=self.path) as pose_file:
+            pose_file.append(timestamps=[0.0, 0.5, 1.0], poses=POSES)
+            (timestamps, ids, poses,) = pose_file.read(start=1)
+            records = np.frombuffer(pose_file._map(), dtype=np.uint8)
+            for values in (
+                timestamps, ids, poses.translations.xyz, poses.rotations.wxyz,
+            ):
+                self.assertTrue(np.shares_memory(values, records))
+                self.assertFalse(values.flags.writeable)
+            self.assertEqual(len(poses), 2)
+            for a, b in zip(poses.take(indices=[1, 0]), POSES[:0:-1]):
+                self.assertPoseEqual(a, b)
+            self.assertTrue(np.shares_memory(poses.translations.xyz, records))
+            copied = pose_file.read(start=1, copy=True)
+            for values in (copied[0], copied[1], copied[2].translations.xyz):
+                self.assertFalse(np.shares_memory(values, records))
+                self.assertTrue(values.flags.writeable)
+            self.assertListEqual(copied[0].tolist(), timestamps.tolist())
+            for a, b in zip(copied[2], POSES[1:]):
+                self.assertPoseEqual(a, b)
+            for a, b in zip(poses, POSES[1:]):
+                self.assertPoseEqual(a, b)
+            del records
+            pose_file.append(timestamps=[2.0], poses=POSES[:1])
+            self.assertEqual(len(pose_file.read()[2]), 4)
+
+    def test_trajectory(self) -> None:
+        with poser.io.PoseFile.create(path=self.path) as pose_file:
+            pose_file.append(timestamps=[0.0, 0.5, 1.0], poses=POSES)
+            trajectory = pose_file.trajectory()
+        self.assertIsInstance(trajectory, poser.Trajectory)
+        self.assertAlmostEqual(
+            trajectory.at(times=0.25).translation.x, -1.5, places=10
+        )
+
+    def test_read_only(self) -> None:
+        poser.io.PoseFile.create(path=self.path).close()
+        with poser.io.PoseFile(path=self.path) as pose_file:
+            with self.assertRaises(ValueError):
+                pose_file.append(timestamps=[0.0], poses=POSES[:1])
+
+    def test_append_wrong_length(self) -> None:
+        with poser.io.PoseFile.create(path=self.path) as pose_file:
+            with self.assertRaises(ValueError):
+                pose_file.append(timestamps=[0.0], poses=POSES)
+
+    def test_invalid_file(self) -> None:
+        with open(self.path, "wb") as file:
+            file.write(b"NOTAPOSEFILE....")
+        with self.assertRaises(ValueError):
+            poser.io.PoseFile(path=self.path)
+        poser.io.PoseFile.create(path=self.path).close()
+        with open(self.path, "ab") as file:
+            file.write(bytes(10))
+        with self.assertRaises(ValueError):
+            poser.io.PoseFile(path=self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,11 @@
+import copy
+import dataclasses
 import unittest
+from unittest import mock
 
 import poser
+import poser.buffers
+import poser.pose
 import poser.rotation.representations
 
 
@@ -16,6 +21,24 @@ class TestPoseInit(unittest.TestCase):
         self.assertIsInstance(pose.rotation, poser.Rotation)
         self.assertIsInstance(pose.translation, poser.Translation)
 
+    def test_slots(self) -> None:
+        pose = poser.Pose()
+        for obj in (pose, pose.translation, pose.rotation):
+            self.assertFalse(hasattr(obj, "__dict__"))
+
+    def test_cache_field(self) -> None:
+        pose = poser.Pose(translation=poser.Translation(x=1.0))
+        pose.as_tuple
+        ~pose
+        self.assertTupleEqual(
+            tuple(f.name for f in dataclasses.fields(pose) if f.init),
+            ("translation", "rotation",),
+        )
+        self.assertEqual(pose, poser.Pose(translation=poser.Translation(x=1.0)))
+        self.assertNotIn("_cache", repr(pose))
+        self.assertEqual(copy.copy(pose).as_tuple, pose.as_tuple)
+        self.assertEqual(dataclasses.replace(pose).as_tuple, pose.as_tuple)
+
 
 class TestPoseMagics(unittest.TestCase):
     def test_invert(self) -> None:
@@ -179,6 +202,167 @@ class TestPoseMethods(unittest.TestCase):
         self.assertIsInstance(new_points[0], poser.Point)
         self.assertAlmostEqual(new_points[0].z, 3.0, places=2)             
 
+    def test_transformed_points_fused(self) -> None:
+        points = (
+            poser.Point(x=1.0, y=2.0, z=3.0),
+            poser.Translation(x=-4.0, y=5.0, z=0.5),
+        )
+        pose = poser.Pose(
+            translation=poser.Translation(x=10.0, y=-2.0, z=1.0),
+            rotation=poser.Rotation(
+                rotation=OPKDeg(omega=45.0, phi=-20.0, kappa=130.0)
+            )
+        )
+        new_points = pose.transformed_points(points=points)
+        self.assertIsInstance(new_points, tuple)
+        self.assertIs(type(new_points[0]), poser.Point)
+        self.assertIs(type(new_points[1]), poser.Translation)
+        expected_points = [
+            pose.translation + pose.rotation.transformed_point(
+                point=poser.Translation(*point.as_tuple)
+            )
+            for point in points
+        ]
+        pose.transform_points(points=points)
+        for point, new_point, expected in zip(points, new_points, expected_points):
+            self.assertTupleEqual(point.as_tuple, new_point.as_tuple)
+            for a, b in zip(new_point.as_tuple, expected.as_tuple):
+                self.assertAlmostEqual(a, b, places=10)
+
+    def test_transform_points_wrong_type(self) -> None:
+        with self.assertRaises(TypeError):
+            poser.Pose().transform_points(points=[Matrix()])
+        with self.assertRaises(TypeError):
+            poser.Pose().transform_point(point=Matrix())
+
+
+class TestPoseInterpolatedMany(unittest.TestCase):
+    def test_interpolated_many(self) -> None:
+        p1 = poser.Pose(
+            translation=poser.Translation(x=0.0, y=10.0, z=-4.0),
+            rotation=poser.Rotation(rotation=OPKDeg(omega=5.0, kappa=40.0)),
+        )
+        p2 = poser.Pose(
+            translation=poser.Translation(x=8.0, y=-2.0, z=6.0),
+            rotation=poser.Rotation(rotation=OPKDeg(phi=-30.0, kappa=-20.0)),
+        )
+        factors = (f / 10.0 for f in range(11))
+        result = p1.interpolated_many(other=p2, factors=factors)
+        self.assertIsInstance(result, poser.PoseArray)
+        self.assertEqual(len(result), 11)
+        for i, pose in enumerate(result):
+            expected = p1.interpolated(other=p2, factor=i / 10.0)
+            for u, v in zip(pose.as_tuple, expected.as_tuple):
+                for x, y in zip(u, v):
+                    self.assertAlmostEqual(x, y, places=12)
+
+    @unittest.skipIf(poser.buffers.np is None, "numpy is not installed")
+    def test_pure_python_fallback(self) -> None:
+        p1 = poser.Pose(translation=poser.Translation(x=1.0, y=-2.0, z=3.0))
+        p2 = poser.Pose(translation=poser.Translation(x=-5.0, y=4.0, z=0.5))
+        factors = [-0.5, 0.0, 0.3, 1.0, 2.0]
+        expected = p1.interpolated_many(other=p2, factors=factors)
+        with mock.patch.object(poser.pose, "np", None):
+            actual = p1.interpolated_many(other=p2, factors=factors)
+        for u, v in zip(
+            actual.translations.coordinates, expected.translations.coordinates,
+        ):
+            self.assertAlmostEqual(u, v, places=12)
+        self.assertEqual(
+            len(p1.interpolated_many(other=p2, factors=[])), 0,
+        )
+
+
+class TestPoseCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.pose = poser.Pose(
+            translation=poser.Translation(x=10.0, y=-2.0, z=1.0),
+            rotation=poser.Rotation(
+                rotation=OPKDeg(omega=45.0, phi=-20.0, kappa=130.0)
+            )
+        )
+
+    def assertMatrixAlmostEqual(self, a, b) -> None:
+        for row_a, row_b in zip(a, b):
+            for value_a, value_b in zip(row_a, row_b):
+                self.assertAlmostEqual(value_a, value_b, places=10)
+
+    def test_as_tuple_cached(self) -> None:
+        self.assertIs(self.pose.as_tuple, self.pose.as_tuple)
+        self.assertListEqual(
+            self.pose.as_list,
+            [list(row) for row in self.pose.as_tuple],
+        )
+        self.assertIsNot(self.pose.as_list, self.pose.as_list)
+
+    def test_invert_cached(self) -> None:
+        inverse = ~self.pose
+        again = ~self.pose
+        self.assertIsNot(inverse, again)
+        self.assertIsNot(inverse.rotation, again.rotation)
+        self.assertEqual(inverse, again)
+        identity = (self.pose * inverse).as_tuple
+        self.assertMatrixAlmostEqual(identity, poser.Pose().as_tuple)
+        inverse.translation.x += 1.0
+        self.assertEqual((~self.pose).translation, again.translation)
+
+    def test_translation_mutation(self) -> None:
+        matrix = self.pose.as_tuple
+        inverse = ~self.pose
+        self.pose.translation.x = 20.0
+        self.assertEqual(self.pose.as_tuple[0][3], 20.0)
+        self.assertNotEqual(matrix, self.pose.as_tuple)
+        self.assertNotEqual(inverse, ~self.pose)
+        self.pose.translation = poser.Translation(x=1.0, y=2.0, z=3.0)
+        self.assertTupleEqual(
+            tuple(row[3] for row in self.pose.as_tuple[:3]),
+            (1.0, 2.0, 3.0,),
+        )
+
+    def test_rotation_mutation(self) -> None:
+        matrix = self.pose.as_tuple
+        inverse = ~self.pose
+        self.pose.rotation.opk_deg = OPKDeg(omega=0.0, phi=0.0, kappa=90.0)
+        self.assertNotEqual(matrix, self.pose.as_tuple)
+        self.assertAlmostEqual(self.pose.as_tuple[0][1], -1.0, places=10)
+        self.assertNotEqual(inverse, ~self.pose)
+        self.pose.rotation = poser.Rotation()
+        self.assertMatrixAlmostEqual(
+            (row[:3] for row in self.pose.as_tuple),
+            poser.Rotation().as_tuple,
+        )
+
+    def test_representation_mutation(self) -> None:
+        matrix = self.pose.as_tuple
+        self.pose.rotation.matrix.r11 = 5.0
+        self.assertEqual(self.pose.as_tuple[0][0], 5.0)
+        self.assertNotEqual(matrix, self.pose.as_tuple)
+        inverse = ~self.pose
+        self.pose.rotation.quaternion.w = -self.pose.rotation.quaternion.w
+        self.pose.rotation.quaternion.x = 0.0
+        self.assertNotEqual(inverse, ~self.pose)
+        self.pose.translation.as_tuple = (4.0, 5.0, 6.0)
+        self.assertTupleEqual(
+            tuple(row[3] for row in self.pose.as_tuple[:3]),
+            (4.0, 5.0, 6.0,),
+        )
+
+    def test_setters_invalidate(self) -> None:
+        ~self.pose
+        matrix = poser.Pose().as_tuple
+        self.pose.as_tuple = matrix
+        self.assertMatrixAlmostEqual(self.pose.as_tuple, matrix)
+        self.assertMatrixAlmostEqual((~self.pose).as_tuple, matrix)
+        other = poser.Pose(
+            translation=poser.Translation(x=1.0, y=2.0, z=3.0),
+            rotation=poser.Rotation(
+                rotation=OPKDeg(omega=10.0, phi=20.0, kappa=30.0)
+            )
+        )
+        self.pose.as_list = other.as_list
+        self.assertMatrixAlmostEqual(self.pose.as_tuple, other.as_tuple)
+        self.assertMatrixAlmostEqual((~self.pose).as_tuple, (~other).as_tuple)
+
 
 if __name__ == "__main__":
     unittest.main()
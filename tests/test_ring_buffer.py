@@ -0,0 +1,121 @@
+import math
+import threading
+import unittest
+
+import poser
+import poser.ring_buffer
+import poser.rotation.representations
+
+
+OPKDeg = poser.rotation.representations.OPKDeg
+
+PoseRingBuffer = poser.ring_buffer.PoseRingBuffer
+
+
+def pose(i: float) -> poser.Pose:
+    return poser.Pose(
+        translation=poser.Translation(x=i, y=2.0 * i, z=0.0),
+        rotation=poser.Rotation(rotation=OPKDeg(kappa=float(i))),
+    )
+
+
+class TestPoseRingBuffer(unittest.TestCase):
+    def assertPoseAlmostEqual(self, a: poser.Pose, b: poser.Pose) -> None:
+        for row_a, row_b in zip(a.as_tuple, b.as_tuple):
+            for value_a, value_b in zip(row_a, row_b):
+                self.assertAlmostEqual(value_a, value_b, places=10)
+
+    def test_append_and_at(self) -> None:
+        buffer = PoseRingBuffer(capacity=8)
+        for i in range(5):
+            buffer.append(timestamp=0.1 * i, pose=pose(i))
+        self.assertEqual(len(buffer), 5)
+        self.assertEqual(buffer.start, 0.0)
+        self.assertAlmostEqual(buffer.end, 0.4)
+        self.assertPoseAlmostEqual(
+            buffer.at(timestamp=0.25),
+            pose(2).interpolated(other=pose(3), factor=0.5),
+        )
+        self.assertPoseAlmostEqual(buffer.at(timestamp=0.4), pose(4))
+        (timestamp, latest,) = buffer.latest()
+        self.assertAlmostEqual(timestamp, 0.4)
+        self.assertPoseAlmostEqual(latest, pose(4))
+
+    def test_retention(self) -> None:
+        buffer = PoseRingBuffer(capacity=4)
+        for i in range(10):
+            buffer.append(timestamp=float(i), pose=pose(i))
+        self.assertEqual(len(buffer), 4)
+        self.assertEqual(buffer.start, 6.0)
+        self.assertPoseAlmostEqual(
+            buffer.at(timestamp=7.5),
+            pose(7).interpolated(other=pose(8), factor=0.5),
+        )
+        trajectory = buffer.to_trajectory()
+        self.assertListEqual(
+            trajectory.timestamps.tolist(), [6.0, 7.0, 8.0, 9.0]
+        )
+        self.assertPoseAlmostEqual(trajectory.poses[0], pose(6))
+        aged = PoseRingBuffer(capacity=100, max_age=2.5)
+        for i in range(10):
+            aged.append(timestamp=float(i), pose=pose(i))
+        self.assertEqual(aged.start, 7.0)
+        self.assertEqual(len(aged), 3)
+
+    def test_out_of_range(self) -> None:
+        buffer = PoseRingBuffer(capacity=4)
+        with self.assertRaises(ValueError):
+            buffer.at(timestamp=0.0)
+        buffer.append(timestamp=1.0, pose=pose(1))
+        self.assertPoseAlmostEqual(buffer.at(timestamp=1.0), pose(1))
+        buffer.append(timestamp=2.0, pose=pose(2))
+        with self.assertRaises(ValueError):
+            buffer.at(timestamp=2.5)
+        with self.assertRaises(ValueError):
+            buffer.append(timestamp=2.0, pose=pose(3))
+        self.assertPoseAlmostEqual(
+            buffer.at(timestamp=5.0, out_of_range="clamp"), pose(2)
+        )
+        outside = buffer.at(timestamp=0.0, out_of_range="nan")
+        self.assertTrue(math.isnan(outside.translation.x))
+        self.assertAlmostEqual(
+            buffer.at(timestamp=3.0, out_of_range="extrapolate").translation.x,
+            3.0,
+        )
+        buffer.clear()
+        self.assertEqual(len(buffer), 0)
+        with self.assertRaises(ValueError):
+            PoseRingBuffer(capacity=0)
+
+    def test_concurrent_readers(self) -> None:
+        buffer = PoseRingBuffer(capacity=64, out_of_range="clamp")
+        buffer.append(timestamp=0.0, pose=pose(0))
+        errors = []
+        done = threading.Event()
+
+        def produce() -> None:
+            for i in range(1, 2000):
+                buffer.append(timestamp=float(i), pose=pose(i))
+            done.set()
+
+        def consume() -> None:
+            while not done.is_set():
+                (timestamp, latest,) = buffer.latest()
+                result = buffer.at(timestamp=timestamp - 0.5)
+                if latest.translation.x != timestamp:
+                    errors.append((timestamp, latest.translation.x))
+                if result.translation.y != 2.0 * result.translation.x:
+                    errors.append((timestamp, result.translation.as_tuple))
+
+        threads = [threading.Thread(target=consume) for _ in range(4)]
+        threads.append(threading.Thread(target=produce))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertListEqual(errors, [])
+        self.assertEqual(len(buffer), 64)
+
+
+if __name__ == "__main__":
+    unittest.main()
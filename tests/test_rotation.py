@@ -151,6 +151,77 @@ class TestRotationProperties(unittest.TestCase):
         self.assertAlmostEqual(rot.opk_deg.omega, 90.0, places=3)
 
 
+class TestRotationLazyRepresentations(unittest.TestCase):
+    def test_init_keeps_source_only(self) -> None:
+        rot = poser.Rotation(
+            rotation=Quaternion(w=0.7071, x=0.7071)
+        )
+        self.assertIsNone(rot._matrix)
+        self.assertIsNone(rot._opk_deg)
+        self.assertAlmostEqual(rot.opk_deg.omega, 90.0, places=3)
+        self.assertIsInstance(rot._matrix, Matrix)
+
+    def test_cached(self) -> None:
+        rot = poser.Rotation(rotation=OPKDeg(omega=30.0))
+        self.assertIs(rot.quaternion, rot.quaternion)
+        self.assertIs(rot.matrix, rot.matrix)
+
+    def test_multiply_quaternion_only(self) -> None:
+        rot_1 = poser.Rotation(rotation=Quaternion(w=0.7071, x=0.7071))
+        rot_2 = poser.Rotation(rotation=Quaternion(w=0.7071, y=0.7071))
+        res = ~(rot_1 * rot_2)
+        self.assertIsNone(res._matrix)
+        self.assertIsNone(res._opk_deg)
+        self.assertIsNone(rot_1._matrix)
+
+    def test_set_as_tuple_invalidates(self) -> None:
+        rot = poser.Rotation(rotation=OPKDeg(omega=30.0))
+        self.assertAlmostEqual(rot.quaternion.x, 0.2588, places=4)
+        rot.as_tuple = (
+            (1.0, 0.0, 0.0,),
+            (0.0, 0.0, -1.0,),
+            (0.0, 1.0, 0.0,),
+        )
+        self.assertAlmostEqual(rot.quaternion.x, 0.7071, places=4)
+        self.assertAlmostEqual(rot.opk_deg.omega, 90.0, places=3)
+
+    def test_set_representation_invalidates(self) -> None:
+        rot = poser.Rotation()
+        self.assertAlmostEqual(rot.opk_deg.omega, 0.0, places=3)
+        rot.quaternion = Quaternion(w=0.7071, x=0.7071)
+        self.assertAlmostEqual(rot.opk_deg.omega, 90.0, places=3)
+        self.assertAlmostEqual(rot.matrix.r32, 1.0, places=3)
+
+    def test_equal(self) -> None:
+        self.assertEqual(
+            poser.Rotation(rotation=OPKDeg()),
+            poser.Rotation(rotation=Quaternion()),
+        )
+
+
+class TestRotationInterpolation(unittest.TestCase):
+    def test_interpolated_many(self) -> None:
+        a = poser.Rotation(rotation=OPKDeg(omega=10.0, phi=20.0, kappa=30.0))
+        b = poser.Rotation(rotation=OPKDeg(omega=-40.0, phi=5.0, kappa=170.0))
+        factors = [0.0, 0.3, 0.7, 1.0]
+        result = a.interpolated_many(other=b, factors=factors)
+        self.assertIsInstance(result, poser.RotationArray)
+        self.assertEqual(len(result), 4)
+        for factor, rotation in zip(factors, result):
+            expected = a.interpolated(other=b, factor=factor)
+            for u, v in zip(rotation.as_tuple, expected.as_tuple):
+                for x, y in zip(u, v):
+                    self.assertAlmostEqual(x, y, places=12)
+
+    def test_interpolated_identical(self) -> None:
+        a = poser.Rotation(rotation=OPKDeg(omega=10.0, phi=20.0, kappa=30.0))
+        result = a.interpolated_many(other=a, factors=[0.25, 0.75])
+        for rotation in result:
+            for u, v in zip(rotation.as_tuple, a.as_tuple):
+                for x, y in zip(u, v):
+                    self.assertAlmostEqual(x, y, places=12)
+
+
 class TestRotationTransformations(unittest.TestCase):
     def test_transform_point(self) -> None:
         p = poser.Point(x=1.0, y=2.0, z=3.0)
@@ -0,0 +1,183 @@
+import unittest
+from array import array
+from unittest import mock
+
+import poser
+import poser.buffers
+import poser.rotation.representations
+import poser.rotation.rotation_array
+
+
+Matrix = poser.rotation.representations.Matrix
+Quaternion = poser.rotation.representations.Quaternion
+OPKDeg = poser.rotation.representations.OPKDeg
+
+
+OPK_DEGS = (
+    (10.0, 20.0, 30.0,),
+    (-12.417, -19.0871, -178.4477,),
+    (170.0, -45.0, 95.0,),
+)
+
+
+class TestRotationArrayInit(unittest.TestCase):
+    def test_init_empty(self) -> None:
+        ra = poser.RotationArray()
+        self.assertIsInstance(ra, poser.RotationArray)
+        self.assertEqual(len(ra), 0)
+
+    def test_init_wrong_length(self) -> None:
+        with self.assertRaises(ValueError):
+            poser.RotationArray(quaternions=[1.0, 0.0, 0.0])
+
+    def test_identity(self) -> None:
+        ra = poser.RotationArray.identity(length=2)
+        self.assertEqual(len(ra), 2)
+        self.assertListEqual(
+            ra.quaternions.tolist(),
+            [1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0],
+        )
+
+    def test_from_rotations(self) -> None:
+        rotations = [
+            poser.Rotation(rotation=OPKDeg(*opk)) for opk in OPK_DEGS
+        ]
+        ra = poser.RotationArray.from_rotations(rotations=rotations)
+        self.assertEqual(len(ra), 3)
+        for i, rotation in enumerate(rotations):
+            q = rotation.quaternion
+            self.assertListEqual(
+                ra.quaternions[4*i:4*i + 4].tolist(),
+                [q.w, q.x, q.y, q.z],
+            )
+
+    def test_from_rotations_wrong_type(self) -> None:
+        with self.assertRaises(TypeError):
+            poser.RotationArray.from_rotations(rotations=[Quaternion()])
+
+    def test_from_opk_deg(self) -> None:
+        ra = poser.RotationArray.from_opk_deg(
+            opk_degs=[a for opk in OPK_DEGS for a in opk]
+        )
+        for opk, rotation in zip(OPK_DEGS, ra):
+            expected = poser.Rotation(rotation=OPKDeg(*opk)).quaternion
+            self.assertAlmostEqual(rotation.quaternion.w, expected.w, places=10)
+            self.assertAlmostEqual(rotation.quaternion.x, expected.x, places=10)
+            self.assertAlmostEqual(rotation.quaternion.y, expected.y, places=10)
+            self.assertAlmostEqual(rotation.quaternion.z, expected.z, places=10)
+
+    def test_to_opk_deg(self) -> None:
+        opk_degs = [a for opk in OPK_DEGS for a in opk]
+        ra = poser.RotationArray.from_opk_deg(opk_degs=opk_degs)
+        for a, b in zip(ra.to_opk_deg(), opk_degs):
+            self.assertAlmostEqual(a, b, places=8)
+
+    def test_to_matrix(self) -> None:
+        ra = poser.RotationArray.from_opk_deg(
+            opk_degs=[a for opk in OPK_DEGS for a in opk]
+        )
+        matrices = ra.to_matrix()
+        self.assertEqual(len(matrices), 27)
+        for i, opk in enumerate(OPK_DEGS):
+            expected = poser.Rotation(rotation=OPKDeg(*opk)).as_tuple
+            for a, b in zip(
+                matrices[9*i:9*i + 9],
+                [r for row in expected for r in row],
+            ):
+                self.assertAlmostEqual(a, b, places=10)
+
+
+class TestRotationArrayAccess(unittest.TestCase):
+    def test_getitem(self) -> None:
+        ra = poser.RotationArray.from_opk_deg(opk_degs=[0.0, 0.0, 0.0, 90.0, 0.0, 0.0])
+        rotation = ra[-1]
+        self.assertIsInstance(rotation, poser.Rotation)
+        self.assertAlmostEqual(rotation.opk_deg.omega, 90.0, places=8)
+        with self.assertRaises(IndexError):
+            ra[2]
+
+    def test_getitem_slice(self) -> None:
+        ra = poser.RotationArray.identity(length=3)
+        self.assertIsInstance(ra[1:], poser.RotationArray)
+        self.assertEqual(len(ra[1:]), 2)
+        self.assertEqual(len(ra[::2]), 2)
+
+    @unittest.skipIf(poser.buffers.np is None, "numpy is not installed")
+    def test_wxyz(self) -> None:
+        ra = poser.RotationArray.identity(length=2)
+        self.assertEqual(ra.wxyz.shape, (2, 4))
+        ra.wxyz[1] = (0.0, 1.0, 0.0, 0.0)
+        self.assertAlmostEqual(abs(ra[1].opk_deg.omega), 180.0, places=8)
+
+
+class TestRotationArrayMagics(unittest.TestCase):
+    def test_invert(self) -> None:
+        ra = poser.RotationArray(quaternions=array("d", [2.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0]))
+        self.assertListEqual(
+            (~ra).quaternions.tolist(),
+            [1.0, 0.0, 0.0, 0.0, 0.0, -1.0, -0.0, -0.0],
+        )
+
+    def test_multiply(self) -> None:
+        r1 = [poser.Rotation(rotation=OPKDeg(*opk)) for opk in OPK_DEGS]
+        r2 = [poser.Rotation(rotation=OPKDeg(*reversed(opk))) for opk in OPK_DEGS]
+        res = (
+            poser.RotationArray.from_rotations(rotations=r1)
+            * poser.RotationArray.from_rotations(rotations=r2)
+        )
+        self.assertIsInstance(res, poser.RotationArray)
+        for a, b, rotation in zip(r1, r2, res):
+            expected = (a * b).quaternion
+            self.assertAlmostEqual(rotation.quaternion.w, expected.w, places=10)
+            self.assertAlmostEqual(rotation.quaternion.x, expected.x, places=10)
+            self.assertAlmostEqual(rotation.quaternion.y, expected.y, places=10)
+            self.assertAlmostEqual(rotation.quaternion.z, expected.z, places=10)
+
+    def test_multiply_broadcast(self) -> None:
+        ra = poser.RotationArray.from_opk_deg(
+            opk_degs=[a for opk in OPK_DEGS for a in opk]
+        )
+        rotation = poser.Rotation(rotation=OPKDeg(omega=5.0, phi=-3.0))
+        for res in (ra * rotation, rotation * ra):
+            self.assertEqual(len(res), 3)
+        for a, b in zip((rotation * ra).to_opk_deg(), (ra * ~ra * rotation * ra).to_opk_deg()):
+            self.assertAlmostEqual(a, b, places=8)
+
+    def test_multiply_inverse(self) -> None:
+        ra = poser.RotationArray.from_opk_deg(
+            opk_degs=[a for opk in OPK_DEGS for a in opk]
+        )
+        for a in (~ra * ra).to_opk_deg():
+            self.assertAlmostEqual(a, 0.0, places=8)
+
+    def test_multiply_wrong_length(self) -> None:
+        with self.assertRaises(ValueError):
+            poser.RotationArray.identity(length=2) * poser.RotationArray.identity(length=3)
+
+    def test_pure_python_fallback(self) -> None:
+        r1 = poser.RotationArray.from_opk_deg(
+            opk_degs=[a for opk in OPK_DEGS for a in opk]
+        )
+        r2 = poser.RotationArray.from_opk_deg(
+            opk_degs=[a for opk in reversed(OPK_DEGS) for a in opk]
+        )
+        results = []
+        for module_np in (poser.buffers.np, None):
+            with mock.patch.object(
+                poser.rotation.rotation_array, "np", module_np,
+            ):
+                results.append([
+                    (r1 * r2).quaternions.tolist(),
+                    (~r1).quaternions.tolist(),
+                    r1.interpolated(other=r2, factor=0.3).quaternions.tolist(),
+                    r1.interpolated(
+                        other=r2[:1], factor=[0.0, 0.5, 1.0],
+                    ).quaternions.tolist(),
+                ])
+        for a, b in zip(*results):
+            for u, v in zip(a, b):
+                self.assertAlmostEqual(u, v, places=12)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import threading
+import unittest
+
+import poser
+import poser.rotation.cache
+import poser.rotation.converter
+import poser.rotation.representations
+
+
+Matrix = poser.rotation.representations.Matrix
+Quaternion = poser.rotation.representations.Quaternion
+OPKDeg = poser.rotation.representations.OPKDeg
+
+Converter = poser.rotation.converter.Converter
+cache = poser.rotation.cache
+
+
+class TestConversionCache(unittest.TestCase):
+    def tearDown(self) -> None:
+        cache.disable()
+
+    def test_disabled_by_default(self) -> None:
+        self.assertFalse(cache.is_enabled())
+        self.assertFalse(cache.stats()["enabled"])
+        opk_deg_to_matrix = Converter.opk_deg_to_matrix
+        cache.enable()
+        self.assertIsNot(Converter.opk_deg_to_matrix, opk_deg_to_matrix)
+        cache.disable()
+        self.assertIs(Converter.opk_deg_to_matrix, opk_deg_to_matrix)
+
+    def test_hits_and_copies(self) -> None:
+        opk_deg = OPKDeg(omega=10.0, phi=-20.0, kappa=30.0)
+        expected = Converter.opk_deg_to_matrix(opk_deg=opk_deg)
+        cache.enable(capacity=8)
+        first = Converter.opk_deg_to_matrix(opk_deg=opk_deg)
+        second = Converter.opk_deg_to_matrix(opk_deg)
+        self.assertEqual(first, expected)
+        self.assertEqual(second, expected)
+        self.assertIsNot(first, second)
+        first.r11 = 5.0
+        self.assertEqual(Converter.opk_deg_to_matrix(opk_deg=opk_deg), expected)
+        stats = cache.stats()
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["size"], 1)
+        self.assertTrue(stats["enabled"])
+
+    def test_exact_keys(self) -> None:
+        original = Converter.matrix_to_opk_deg
+        cache.enable()
+        m1 = Matrix(r11=-1.0, r22=-1.0, r23=0.0)
+        m2 = Matrix(r11=-1.0, r22=-1.0, r23=-0.0)
+        self.assertEqual(
+            Converter.matrix_to_opk_deg(matrix=m1),
+            original(matrix=m1),
+        )
+        self.assertEqual(
+            Converter.matrix_to_opk_deg(matrix=m2),
+            original(matrix=m2),
+        )
+        self.assertEqual(cache.stats()["misses"], 2)
+
+    def test_eviction(self) -> None:
+        cache.enable(capacity=2)
+        for kappa in (1.0, 2.0, 3.0, 1.0):
+            Converter.opk_deg_to_matrix(opk_deg=OPKDeg(kappa=kappa))
+        stats = cache.stats()
+        self.assertEqual(stats["misses"], 4)
+        self.assertEqual(stats["evictions"], 2)
+        self.assertEqual(stats["size"], 2)
+        cache.enable(capacity=1)
+        self.assertEqual(cache.stats()["size"], 1)
+        cache.clear()
+        self.assertEqual(cache.stats()["size"], 0)
+        with self.assertRaises(ValueError):
+            cache.enable(capacity=0)
+
+    def test_rotation_uses_cache(self) -> None:
+        cache.enable()
+        for _ in range(3):
+            rotation = poser.Rotation(rotation=OPKDeg(omega=1.0, phi=2.0))
+            rotation.quaternion
+        stats = cache.stats()
+        self.assertEqual(stats["misses"], 2)
+        self.assertEqual(stats["hits"], 4)
+
+    def test_threads(self) -> None:
+        cache.enable(capacity=16)
+        results = []
+
+        def convert() -> None:
+            for i in range(200):
+                results.append(
+                    Converter.quaternion_to_matrix(
+                        quaternion=Quaternion(w=1.0, x=0.01 * (i % 32))
+                    )
+                )
+
+        threads = [threading.Thread(target=convert) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = cache.stats()
+        self.assertEqual(stats["hits"] + stats["misses"], 800)
+        self.assertLessEqual(stats["size"], 16)
+        self.assertEqual(len(results), 800)
+
+
+if __name__ == "__main__":
+    unittest.main()
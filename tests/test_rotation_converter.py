@@ -1,5 +1,8 @@
 import unittest
+from array import array
+from unittest import mock
 
+import poser.buffers
 import poser.rotation.representations
 import poser.rotation.converter
 
@@ -9,6 +12,7 @@ Quaternion = poser.rotation.representations.Quaternion
 OPKDeg = poser.rotation.representations.OPKDeg
 
 Converter = poser.rotation.converter.Converter
+FloatArray = poser.buffers.FloatArray
 
 
 class TestRotationConverter(unittest.TestCase):
@@ -76,6 +80,189 @@ class TestRotationConverter(unittest.TestCase):
         self.assertAlmostEqual(m.r32, 0.2236, places=4)
         self.assertAlmostEqual(m.r33, 0.9229, places=4)
 
+    def test_quaternion_to_matrix(self) -> None:
+        half = 0.5 ** 0.5
+        m = Converter.quaternion_to_matrix(
+            quaternion=Quaternion(w=half, x=half, y=0.0, z=0.0)
+        )
+        self.assertIsInstance(m, Matrix)
+        expected = ((1.0, 0.0, 0.0,), (0.0, 0.0, -1.0,), (0.0, 1.0, 0.0,))
+        for row, expected_row in zip(m.as_tuple, expected):
+            for value, expected_value in zip(row, expected_row):
+                self.assertAlmostEqual(value, expected_value, places=12)
+
+    def test_quaternion_to_matrix_round_trip(self) -> None:
+        m = Converter.opk_deg_to_matrix(
+            opk_deg=OPKDeg(omega=-12.4170, phi=-19.0871, kappa=-178.4477)
+        )
+        res = Converter.quaternion_to_matrix(
+            quaternion=Converter.matrix_to_quaternion(matrix=m)
+        )
+        for row, expected_row in zip(res.as_tuple, m.as_tuple):
+            for value, expected_value in zip(row, expected_row):
+                self.assertAlmostEqual(value, expected_value, places=12)
+        self.assertAlmostEqual(res.r32, 0.2236, places=4)
+
+
+class TestRotationConverterBatch(unittest.TestCase):
+    MATRICES = (
+        (
+            (-0.9447, 0.0256, -0.3270,),
+            (-0.0967, -0.9743, 0.2032,),
+            (-0.3134, 0.2236, 0.9229,),
+        ),
+        (
+            (0.0, 0.0, 1.0,),
+            (0.3420201433256687, 0.9396926207859084, 0.0,),
+            (-0.9396926207859084, 0.3420201433256687, 0.0,),
+        ),
+        (
+            (1.0, 0.0, 0.0,),
+            (0.0, 0.0, -1.0,),
+            (0.0, 1.0, 0.0,),
+        ),
+        (
+            (1.0, 0.0, 0.0,),
+            (0.0, -1.0, 0.0,),
+            (0.0, 0.0, -1.0,),
+        ),
+        (
+            (-1.0, 0.0, 0.0,),
+            (0.0, 1.0, 0.0,),
+            (0.0, 0.0, -1.0,),
+        ),
+        (
+            (-1.0, 0.0, 0.0,),
+            (0.0, -1.0, 0.0,),
+            (0.0, 0.0, 1.0,),
+        ),
+    )
+
+    def test_matrix_to_opk_deg_batch(self) -> None:
+        res = Converter.matrix_to_opk_deg_batch(matrices=self.MATRICES)
+        self.assertIsInstance(res, FloatArray)
+        self.assertEqual(len(res), 3 * len(self.MATRICES))
+        for i, matrix in enumerate(self.MATRICES):
+            m = Matrix()
+            m.as_tuple = matrix
+            opk = Converter.matrix_to_opk_deg(matrix=m)
+            self.assertAlmostEqual(res[3*i], opk.omega, places=10)
+            self.assertAlmostEqual(res[3*i + 1], opk.phi, places=10)
+            self.assertAlmostEqual(res[3*i + 2], opk.kappa, places=10)
+
+    def test_matrix_to_quaternion_batch(self) -> None:
+        res = Converter.matrix_to_quaternion_batch(matrices=self.MATRICES)
+        self.assertIsInstance(res, FloatArray)
+        self.assertEqual(len(res), 4 * len(self.MATRICES))
+        for i, matrix in enumerate(self.MATRICES):
+            m = Matrix()
+            m.as_tuple = matrix
+            q = Converter.matrix_to_quaternion(matrix=m)
+            self.assertAlmostEqual(res[4*i], q.w, places=10)
+            self.assertAlmostEqual(res[4*i + 1], q.x, places=10)
+            self.assertAlmostEqual(res[4*i + 2], q.y, places=10)
+            self.assertAlmostEqual(res[4*i + 3], q.z, places=10)
+
+    def test_opk_deg_to_matrix_batch(self) -> None:
+        opk_degs = array("d", [-12.417, -19.0871, -178.4477, 0.0, 90.0, 20.0])
+        res = Converter.opk_deg_to_matrix_batch(opk_degs=opk_degs)
+        self.assertIsInstance(res, FloatArray)
+        self.assertEqual(len(res), 18)
+        for i in range(2):
+            m = Converter.opk_deg_to_matrix(
+                opk_deg=OPKDeg(*opk_degs[3*i:3*i + 3])
+            )
+            for a, b in zip(res[9*i:9*i + 9], sum(m.as_list, [])):
+                self.assertAlmostEqual(a, b, places=10)
+
+    def test_quaternion_to_matrix_batch(self) -> None:
+        quaternions = [(0.7071, 0.7071, 0.0, 0.0,), (1.0, 2.0, 3.0, 4.0,)]
+        res = Converter.quaternion_to_matrix_batch(quaternions=quaternions)
+        self.assertIsInstance(res, FloatArray)
+        self.assertEqual(len(res), 18)
+        for i, quaternion in enumerate(quaternions):
+            m = Converter.quaternion_to_matrix(
+                quaternion=Quaternion(*quaternion)
+            )
+            for a, b in zip(res[9*i:9*i + 9], sum(m.as_list, [])):
+                self.assertAlmostEqual(a, b, places=10)
+
+    def test_round_trip_batch(self) -> None:
+        opk_degs = [(10.0, 20.0, 30.0,), (-170.0, 45.0, -95.0,)]
+        quaternions = Converter.opk_deg_to_quaternion_batch(opk_degs=opk_degs)
+        self.assertEqual(len(quaternions), 8)
+        res = Converter.quaternion_to_opk_deg_batch(quaternions=quaternions)
+        for a, b in zip(res, sum(opk_degs, ())):
+            self.assertAlmostEqual(a, b, places=8)
+
+    def test_empty_batch(self) -> None:
+        self.assertEqual(len(Converter.matrix_to_opk_deg_batch(matrices=[])), 0)
+        self.assertEqual(len(Converter.opk_deg_to_matrix_batch(opk_degs=[])), 0)
+
+    @unittest.skipIf(poser.buffers.np is None, "numpy is not installed")
+    def test_shaped_batch(self) -> None:
+        flat = Converter.matrix_to_quaternion_batch(matrices=self.MATRICES)
+        quaternions = Converter.matrix_to_quaternion_batch(
+            matrices=self.MATRICES, shaped=True,
+        )
+        self.assertEqual(quaternions.shape, (len(self.MATRICES), 4))
+        self.assertListEqual(quaternions.reshape(-1).tolist(), flat.tolist())
+        for (method, values, shape,) in (
+            (Converter.matrix_to_opk_deg_batch, self.MATRICES, (3,)),
+            (Converter.quaternion_to_matrix_batch, quaternions, (3, 3)),
+            (Converter.opk_deg_to_matrix_batch, [10.0, 20.0, 30.0], (3, 3)),
+            (Converter.opk_deg_to_quaternion_batch, [10.0, 20.0, 30.0], (4,)),
+            (Converter.quaternion_to_opk_deg_batch, quaternions, (3,)),
+        ):
+            res = method(values, shaped=True)
+            self.assertEqual(res.shape[1:], shape)
+            self.assertListEqual(
+                res.reshape(-1).tolist(), method(values).tolist(),
+            )
+
+    def test_zero_quaternion_batch(self) -> None:
+        quaternions = [1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+        with self.assertRaises(ValueError):
+            Converter.quaternion_to_matrix_batch(quaternions=quaternions)
+        with mock.patch.object(poser.rotation.converter, "np", None):
+            with self.assertRaises(ValueError):
+                Converter.quaternion_to_matrix_batch(quaternions=quaternions)
+            with self.assertRaises(ImportError):
+                Converter.opk_deg_to_matrix_batch(
+                    opk_degs=[0.0, 0.0, 0.0], shaped=True,
+                )
+
+    def test_pure_python_fallback(self) -> None:
+        opk_degs = [
+            -12.417, -19.0871, -178.4477,
+            0.0, 90.0, 20.0,
+            30.0, -90.0, 10.0,
+            170.0, -45.0, 95.0,
+        ]
+        quaternions = [0.7071, 0.7071, 0.0, 0.0, 1.0, 2.0, 3.0, 4.0]
+        results = []
+        for module_np in (poser.buffers.np, None):
+            with mock.patch.object(
+                poser.rotation.converter, "np", module_np,
+            ):
+                results.append([
+                    Converter.matrix_to_opk_deg_batch(
+                        matrices=self.MATRICES,
+                    ).tolist(),
+                    Converter.matrix_to_quaternion_batch(
+                        matrices=self.MATRICES,
+                    ).tolist(),
+                    Converter.opk_deg_to_quaternion_batch(
+                        opk_degs=opk_degs,
+                    ).tolist(),
+                    Converter.quaternion_to_opk_deg_batch(
+                        quaternions=quaternions,
+                    ).tolist(),
+                ])
+        for a, b in zip(*results):
+            self.assertEqual(len(a), len(b))
+            for u, v in zip(a, b):
+                self.assertAlmostEqual(u, v, places=10)
 
 
 if __name__ == '__main__':
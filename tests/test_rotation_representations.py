@@ -8,6 +8,17 @@ OPKDeg = poser.rotation.representations.OPKDeg
 Quaternion = poser.rotation.representations.Quaternion
 
 
+class TestRepresentationSlots(unittest.TestCase):
+    def test_slots(self) -> None:
+        for cls in (Matrix, Quaternion, OPKDeg):
+            self.assertFalse(hasattr(cls(), "__dict__"))
+
+    def test_unchecked(self) -> None:
+        self.assertEqual(Matrix._unchecked(*range(9)), Matrix(*range(9)))
+        self.assertEqual(Quaternion._unchecked(1.0, 0.0, 0.0, 0.0), Quaternion())
+        self.assertEqual(OPKDeg._unchecked(1.0, 2.0, 3.0), OPKDeg(1, 2, 3))
+
+
 class TestRotationMatrix(unittest.TestCase):
     def test_init_empty(self) -> None:
         m = Matrix()
@@ -416,6 +427,38 @@ class TestRotationQuaternion(unittest.TestCase):
         self.assertIsInstance(r.z, float)
         self.assertAlmostEqual(r.z, 0.0, places=3)
 
+    def test_interpolated_identical(self) -> None:
+        a = Quaternion(w=0.7071, x=0.7071, y=0.0, z=0.0)
+        r = a.interpolated(other=Quaternion(w=0.7071, x=0.7071), factor=0.3)
+        self.assertAlmostEqual(r.w, 2**-0.5, places=10)
+        self.assertAlmostEqual(r.x, 2**-0.5, places=10)
+        self.assertEqual(a.w, 0.7071)
+
+    def test_interpolated_shortest_arc(self) -> None:
+        a = Quaternion(w=0.7071, x=0.7071, y=0.0, z=0.0)
+        r = a.interpolated(other=Quaternion(w=-1.0), factor=0.5)
+        self.assertAlmostEqual(r.w, 0.9238, places=3)
+        self.assertAlmostEqual(r.x, 0.3827, places=3)
+
+    def test_interpolated_many(self) -> None:
+        a = Quaternion(w=0.7071, x=0.7071, y=0.0, z=0.0)
+        b = Quaternion(w=0.5, x=-0.5, y=0.5, z=0.5)
+        factors = [0.0, 0.1, 0.25, 0.5, 0.9, 1.0]
+        results = a.interpolated_many(other=b, factors=factors)
+        self.assertEqual(len(results), len(factors))
+        for factor, r in zip(factors, results):
+            self.assertIsInstance(r, Quaternion)
+            expected = a.interpolated(other=b, factor=factor)
+            for u, v in zip(
+                (r.w, r.x, r.y, r.z,),
+                (expected.w, expected.x, expected.y, expected.z,),
+            ):
+                self.assertAlmostEqual(u, v, places=12)
+            self.assertAlmostEqual(abs(r), 1.0, places=12)
+        self.assertListEqual(a.interpolated_many(other=b, factors=[]), [])
+        with self.assertRaises(ValueError):
+            a.interpolated_many(other=Quaternion(w=0.0), factors=[0.5])
+
 
 class TestRotationOPKDeg(unittest.TestCase):
     def test_init(self) -> None:
@@ -0,0 +1,131 @@
+import math
+import os
+import random
+import tempfile
+import unittest
+from array import array
+
+import poser
+import poser.spatial
+
+
+KDTree = poser.spatial.KDTree
+
+
+class TestKDTree(unittest.TestCase):
+    def setUp(self) -> None:
+        generator = random.Random(7)
+        self.coordinates = array(
+            "d", (generator.uniform(-50.0, 50.0) for _ in range(3 * 500))
+        )
+        self.coordinates.extend((1.0, 1.0, 1.0) * 20)
+        self.tree = KDTree(points=self.coordinates, leaf_size=4)
+        self.queries = [
+            tuple(generator.uniform(-60.0, 60.0) for _ in range(3))
+            for _ in range(20)
+        ] + [(1.0, 1.0, 1.0)]
+
+    def distance(self, index: int, point) -> float:
+        return math.dist(self.coordinates[3*index:3*index + 3], point)
+
+    def test_query(self) -> None:
+        for point in self.queries:
+            (indices, distances,) = self.tree.query(point=point, k=5)
+            expected = sorted(
+                self.distance(i, point) for i in range(len(self.tree))
+            )[:5]
+            self.assertEqual(len(indices), 5)
+            for index, distance, reference in zip(
+                indices, distances, expected
+            ):
+                self.assertAlmostEqual(distance, reference, places=10)
+                self.assertAlmostEqual(
+                    self.distance(index, point), distance, places=10
+                )
+
+    def test_query_radius(self) -> None:
+        for point in self.queries:
+            self.assertListEqual(
+                sorted(self.tree.query_radius(point=point, radius=15.0)),
+                [
+                    i for i in range(len(self.tree))
+                    if self.distance(i, point) <= 15.0
+                ],
+            )
+
+    def test_query_box(self) -> None:
+        lower, upper = (-10.0, 0.0, -20.0), (25.0, 1.0, 30.0)
+        expected = [
+            i for i in range(len(self.tree))
+            if all(
+                lower[k] <= self.coordinates[3*i + k] <= upper[k]
+                for k in range(3)
+            )
+        ]
+        self.assertListEqual(
+            sorted(
+                self.tree.query_box(
+                    lower=poser.Point(*lower),
+                    upper=poser.Point(*upper),
+                )
+            ),
+            expected,
+        )
+
+    def test_batched(self) -> None:
+        points = poser.PointArray.from_points(
+            points=[poser.Point(*point) for point in self.queries]
+        )
+        (indices, distances,) = self.tree.query_many(points=points, k=3)
+        self.assertEqual(len(indices), 3 * len(self.queries))
+        for i, point in enumerate(self.queries):
+            (expected, _,) = self.tree.query(point=point, k=3)
+            self.assertListEqual(indices[3*i:3*i + 3].tolist(), expected)
+        self.assertListEqual(
+            self.tree.query_radius_many(points=points, radius=10.0),
+            [
+                self.tree.query_radius(point=point, radius=10.0)
+                for point in self.queries
+            ],
+        )
+
+    def test_inputs(self) -> None:
+        translations = [
+            poser.Translation(x=float(i), y=0.0, z=0.0) for i in range(10)
+        ]
+        tree = KDTree(points=translations, leaf_size=2)
+        self.assertEqual(tree.query(point=(6.2, 0.0, 0.0))[0], [6])
+        poses = poser.PoseArray(
+            translations=poser.PointArray.from_points(points=translations)
+        )
+        self.assertEqual(
+            KDTree(points=poses).query(point=(2.9, 0.0, 0.0))[0], [3]
+        )
+        empty = KDTree(points=[])
+        self.assertEqual(len(empty), 0)
+        self.assertEqual(empty.query(point=(0.0, 0.0, 0.0)), ([], []))
+        self.assertEqual(len(tree.query(point=(0.0, 0.0, 0.0), k=20)[0]), 10)
+        with self.assertRaises(ValueError):
+            KDTree(points=[1.0, 2.0])
+        with self.assertRaises(ValueError):
+            tree.query(point=(0.0, 0.0, 0.0), k=0)
+
+    def test_save_load(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "tree.kdt")
+            self.tree.save(path=path)
+            tree = KDTree.load(path=path)
+            with open(path, "r+b") as file:
+                file.truncate(100)
+            with self.assertRaises(ValueError):
+                KDTree.load(path=path)
+        self.assertEqual(len(tree), len(self.tree))
+        for point in self.queries:
+            self.assertEqual(
+                tree.query(point=point, k=4),
+                self.tree.query(point=point, k=4),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+import math
+import unittest
+from unittest import mock
+
+import poser
+import poser.spline
+import poser.rotation.representations
+
+
+OPKDeg = poser.rotation.representations.OPKDeg
+Quaternion = poser.rotation.representations.Quaternion
+
+SplineTrajectory = poser.spline.SplineTrajectory
+
+
+POSES = [
+    poser.Pose(
+        translation=poser.Translation(x=0.0, y=0.0, z=0.0),
+        rotation=poser.Rotation(rotation=OPKDeg(omega=0.0, kappa=10.0)),
+    ),
+    poser.Pose(
+        translation=poser.Translation(x=10.0, y=2.0, z=1.0),
+        rotation=poser.Rotation(rotation=OPKDeg(omega=30.0, kappa=40.0)),
+    ),
+    poser.Pose(
+        translation=poser.Translation(x=15.0, y=12.0, z=-1.0),
+        rotation=poser.Rotation(rotation=OPKDeg(omega=45.0, phi=20.0)),
+    ),
+    poser.Pose(
+        translation=poser.Translation(x=14.0, y=30.0, z=0.0),
+        rotation=poser.Rotation(rotation=OPKDeg(phi=-10.0, kappa=-60.0)),
+    ),
+]
+TIMESTAMPS = [0.0, 1.0, 2.5, 3.0]
+
+
+def values(pose: poser.Pose) -> tuple:
+    q = pose.rotation.quaternion
+    if q.w < 0.0:
+        return pose.translation.as_tuple + (-q.w, -q.x, -q.y, -q.z,)
+    return pose.translation.as_tuple + (q.w, q.x, q.y, q.z,)
+
+
+class TestSplineTrajectory(unittest.TestCase):
+    def setUp(self) -> None:
+        self.spline = SplineTrajectory(poses=POSES, timestamps=TIMESTAMPS)
+
+    def assertValuesAlmostEqual(self, a, b, places=9) -> None:
+        for u, v in zip(a, b):
+            self.assertAlmostEqual(u, v, places=places)
+
+    def test_interpolates_keyframes(self) -> None:
+        self.assertEqual(len(self.spline), 4)
+        for t, pose in zip(TIMESTAMPS, POSES):
+            self.assertValuesAlmostEqual(
+                values(self.spline.at(times=t)), values(pose)
+            )
+
+    def test_c1_continuity(self) -> None:
+        h = 1e-6
+        for t in TIMESTAMPS[1:-1]:
+            before = values(self.spline.at(times=t - h))
+            at = values(self.spline.at(times=t))
+            after = values(self.spline.at(times=t + h))
+            for b, a, c in zip(before, at, after):
+                self.assertAlmostEqual((a - b) / h, (c - a) / h, places=3)
+
+    def test_linear_motion_is_reproduced(self) -> None:
+        poses = [
+            poser.Pose(translation=poser.Translation(x=2.0 * i, y=-i, z=5.0))
+            for i in range(5)
+        ]
+        spline = SplineTrajectory(poses=poses)
+        pose = spline.at(times=2.25)
+        self.assertValuesAlmostEqual(
+            pose.translation.as_tuple, (4.5, -2.25, 5.0)
+        )
+        self.assertValuesAlmostEqual(values(pose)[3:], (1.0, 0.0, 0.0, 0.0))
+
+    def test_batched(self) -> None:
+        times = [0.0, 0.3, 1.7, 2.9, 0.5, 3.0]
+        result = self.spline.at(times=times)
+        self.assertIsInstance(result, poser.PoseArray)
+        self.assertEqual(len(result), len(times))
+        for t, pose in zip(times, result):
+            self.assertValuesAlmostEqual(
+                values(pose), values(self.spline.at(times=t)), places=12
+            )
+        for pose in result:
+            self.assertAlmostEqual(abs(pose.rotation.quaternion), 1.0)
+
+    def test_hemisphere(self) -> None:
+        poses = [
+            poser.Pose(rotation=poser.Rotation(rotation=Quaternion(w=1.0))),
+            poser.Pose(rotation=poser.Rotation(rotation=Quaternion(w=-1.0))),
+            poser.Pose(rotation=poser.Rotation(rotation=Quaternion(w=2.0))),
+        ]
+        pose = SplineTrajectory(poses=poses).at(times=0.5)
+        self.assertValuesAlmostEqual(values(pose)[3:], (1.0, 0.0, 0.0, 0.0))
+
+    def test_out_of_range(self) -> None:
+        with self.assertRaises(ValueError):
+            self.spline.at(times=3.5)
+        clamped = self.spline.at(times=-1.0, out_of_range="clamp")
+        self.assertValuesAlmostEqual(values(clamped), values(POSES[0]))
+        result = self.spline.at(times=[1.0, 4.0], out_of_range="nan")
+        self.assertTrue(math.isnan(result.translations.coordinates[3]))
+        self.assertFalse(math.isnan(result.translations.coordinates[0]))
+        extrapolated = self.spline.at(times=3.1, out_of_range="extrapolate")
+        self.assertGreater(extrapolated.translation.y, 30.0)
+
+    def test_single_pose_and_errors(self) -> None:
+        spline = SplineTrajectory(poses=POSES[:1], out_of_range="clamp")
+        self.assertValuesAlmostEqual(
+            values(spline.at(times=5.0)), values(POSES[0])
+        )
+        with self.assertRaises(ValueError):
+            SplineTrajectory(poses=[])
+        with self.assertRaises(ValueError):
+            SplineTrajectory(poses=POSES, timestamps=[0.0, 1.0, 1.0, 2.0])
+        with self.assertRaises(ValueError):
+            SplineTrajectory(poses=POSES, timestamps=[0.0, 1.0])
+
+    def test_pure_python_fallback(self) -> None:
+        times = [2.5, -1.0, 0.25, 3.0, 1.5, 4.0, 0.0, 1.0, 2.75]
+        policies = ("clamp", "extrapolate", "nan")
+
+        def results(spline: SplineTrajectory) -> list:
+            return [
+                spline.at(times=times, out_of_range=policy)
+                for policy in policies
+            ]
+
+        single = SplineTrajectory(poses=POSES[:1])
+        expected = results(self.spline) + results(single)
+        with mock.patch.object(poser.spline, "np", None):
+            actual = results(self.spline) + results(single)
+            with self.assertRaises(ValueError):
+                self.spline.at(times=times)
+        with self.assertRaises(ValueError):
+            self.spline.at(times=times)
+        for a, b in zip(actual, expected):
+            for (values_, expected_values,) in (
+                (a.translations.coordinates, b.translations.coordinates),
+                (a.rotations.quaternions, b.rotations.quaternions),
+            ):
+                for v1, v2 in zip(values_, expected_values):
+                    if math.isnan(v2):
+                        self.assertTrue(math.isnan(v1))
+                    else:
+                        self.assertAlmostEqual(v1, v2, places=10)
+
+
+if __name__ == "__main__":
+    unittest.main()
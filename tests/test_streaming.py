@@ -0,0 +1,117 @@
+import unittest
+from array import array
+
+import poser
+import poser.buffers
+import poser.rotation.representations
+
+
+Matrix = poser.rotation.representations.Matrix
+OPKDeg = poser.rotation.representations.OPKDeg
+
+
+class TestTransformIter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.pose = poser.Pose(
+            translation=poser.Translation(x=10.0, y=-2.0, z=1.0),
+            rotation=poser.Rotation(
+                rotation=OPKDeg(omega=45.0, phi=-20.0, kappa=130.0)
+            )
+        )
+
+    def assertPointAlmostEqual(self, a, b) -> None:
+        for v1, v2 in zip(a, b):
+            self.assertAlmostEqual(v1, v2, places=10)
+
+    def test_lazy_batches(self) -> None:
+        consumed = []
+
+        def generate():
+            for i in range(5):
+                consumed.append(i)
+                yield poser.Point(x=i, y=2.0*i, z=-i)
+
+        batches = self.pose.transform_iter(generate(), chunk_size=2)
+        self.assertListEqual(consumed, [])
+        first = next(batches)
+        self.assertListEqual(consumed, [0, 1])
+        rest = list(batches)
+        self.assertListEqual([len(b) for b in [first] + rest], [2, 2, 1])
+        for i, point in enumerate(first + rest[0] + rest[1]):
+            self.assertIsInstance(point, poser.Point)
+            self.assertPointAlmostEqual(
+                point.as_tuple,
+                self.pose.transformed_point(
+                    point=poser.Point(x=i, y=2.0*i, z=-i)
+                ).as_tuple,
+            )
+
+    def test_tuples_and_types(self) -> None:
+        points = [poser.Translation(x=1.0), (1.0, 0.0, 0.0), [1.0, 0.0, 0.0]]
+        (batch,) = self.pose.transform_iter(iter(points))
+        self.assertIsInstance(batch[0], poser.Translation)
+        self.assertIsInstance(batch[1], tuple)
+        self.assertPointAlmostEqual(batch[1], batch[0].as_tuple)
+        self.assertPointAlmostEqual(batch[2], batch[0].as_tuple)
+
+    def test_chunks(self) -> None:
+        chunk = array("d", [1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+        items = [
+            (0.0, 0.0, 0.0),
+            chunk,
+            poser.PointArray(coordinates=array("d", chunk)),
+            poser.Point(),
+        ]
+        res = list(self.pose.transform_iter(items))
+        self.assertEqual(len(res), 4)
+        self.assertIsInstance(res[0], list)
+        self.assertIsInstance(res[1], array)
+        self.assertIsInstance(res[2], poser.PointArray)
+        self.assertIsInstance(res[3], list)
+        expected = self.pose.transformed_points(
+            points=poser.PointArray(coordinates=chunk)
+        )
+        self.assertEqual(poser.PointArray(coordinates=res[1]), expected)
+        self.assertEqual(res[2], expected)
+        self.assertListEqual(chunk.tolist(), [1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+
+    @unittest.skipIf(poser.buffers.np is None, "numpy is not installed")
+    def test_ndarray_chunks(self) -> None:
+        np = poser.buffers.np
+        xyz = np.arange(12, dtype=np.float64).reshape(4, 3)
+        expected = self.pose.transformed_points(
+            points=poser.PointArray(coordinates=xyz.copy())
+        )
+        for chunk in (xyz, xyz.reshape(-1), xyz.astype(np.float32), xyz.T.T):
+            (res,) = self.pose.transform_iter([chunk])
+            self.assertIsInstance(res, np.ndarray)
+            self.assertEqual(res.shape, chunk.shape)
+            self.assertEqual(poser.PointArray(coordinates=res), expected)
+        self.assertListEqual(xyz.reshape(-1).tolist(), list(range(12)))
+        with self.assertRaises(ValueError):
+            list(self.pose.transform_iter([np.zeros(4)]))
+
+    def test_components(self) -> None:
+        point = poser.Point(x=1.0, y=2.0, z=3.0)
+        for transform in (
+            self.pose.rotation,
+            self.pose.rotation.matrix,
+            self.pose.translation,
+        ):
+            (batch,) = transform.transform_iter([point])
+            self.assertPointAlmostEqual(
+                batch[0].as_tuple,
+                transform.transformed_point(point=point).as_tuple,
+            )
+
+    def test_wrong_input(self) -> None:
+        with self.assertRaises(ValueError):
+            self.pose.transform_iter([], chunk_size=0)
+        with self.assertRaises(TypeError):
+            list(self.pose.transform_iter([Matrix()]))
+        with self.assertRaises(ValueError):
+            list(self.pose.transform_iter([array("d", [1.0])]))
+
+
+if __name__ == "__main__":
+    unittest.main()
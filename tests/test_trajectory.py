@@ -0,0 +1,158 @@
+import math
+import unittest
+from unittest import mock
+
+import poser
+import poser.buffers
+import poser.pose_array
+import poser.trajectory
+import poser.rotation.representations
+
+
+OPKDeg = poser.rotation.representations.OPKDeg
+
+
+POSES = [
+    poser.Pose(
+        translation=poser.Translation(x=0.0),
+    ),
+    poser.Pose(
+        translation=poser.Translation(x=10.0),
+        rotation=poser.Rotation(rotation=OPKDeg(omega=90.0)),
+    ),
+    poser.Pose(
+        translation=poser.Translation(x=10.0, y=20.0),
+        rotation=poser.Rotation(rotation=OPKDeg(omega=90.0, kappa=40.0)),
+    ),
+]
+
+
+class TestTrajectoryInit(unittest.TestCase):
+    def test_init(self) -> None:
+        trajectory = poser.Trajectory(timestamps=[0.0, 1.0, 3.0], poses=POSES)
+        self.assertIsInstance(trajectory.poses, poser.PoseArray)
+        self.assertEqual(len(trajectory), 3)
+        self.assertEqual(trajectory.start, 0.0)
+        self.assertEqual(trajectory.end, 3.0)
+
+    def test_init_wrong_length(self) -> None:
+        with self.assertRaises(ValueError):
+            poser.Trajectory(timestamps=[0.0, 1.0], poses=POSES)
+
+    def test_init_unsorted(self) -> None:
+        with self.assertRaises(ValueError):
+            poser.Trajectory(timestamps=[0.0, 2.0, 1.0], poses=POSES)
+        with self.assertRaises(ValueError):
+            poser.Trajectory(timestamps=[0.0, 1.0, 1.0], poses=POSES)
+
+    def test_init_wrong_policy(self) -> None:
+        with self.assertRaises(ValueError):
+            poser.Trajectory(
+                timestamps=[0.0, 1.0, 3.0],
+                poses=POSES,
+                out_of_range="wrap",
+            )
+
+
+class TestTrajectoryAt(unittest.TestCase):
+    def setUp(self) -> None:
+        self.trajectory = poser.Trajectory(
+            timestamps=[0.0, 1.0, 3.0],
+            poses=POSES,
+        )
+
+    def test_at_scalar(self) -> None:
+        pose = self.trajectory.at(times=0.5)
+        self.assertIsInstance(pose, poser.Pose)
+        self.assertAlmostEqual(pose.translation.x, 5.0, places=8)
+        self.assertAlmostEqual(pose.rotation.opk_deg.omega, 45.0, places=8)
+
+    def test_at_samples(self) -> None:
+        res = self.trajectory.at(times=[0.0, 1.0, 3.0])
+        for a, b in zip(res, POSES):
+            for r1, r2 in zip(a.as_tuple, b.as_tuple):
+                for v1, v2 in zip(r1, r2):
+                    self.assertAlmostEqual(v1, v2, places=8)
+
+    def test_at_matches_pose_interpolated(self) -> None:
+        times = [2.5, 0.25, 1.5, 2.0]
+        res = self.trajectory.at(times=times)
+        self.assertIsInstance(res, poser.PoseArray)
+        for t, pose in zip(times, res):
+            i = 0 if t < 1.0 else 1
+            t0, t1 = (0.0, 1.0, 3.0)[i:i + 2]
+            expected = POSES[i].interpolated(
+                other=POSES[i + 1],
+                factor=(t - t0) / (t1 - t0),
+            )
+            for r1, r2 in zip(pose.as_tuple, expected.as_tuple):
+                for v1, v2 in zip(r1, r2):
+                    self.assertAlmostEqual(v1, v2, places=8)
+
+    def test_at_raise(self) -> None:
+        with self.assertRaises(ValueError):
+            self.trajectory.at(times=[0.5, 3.5])
+        with self.assertRaises(ValueError):
+            self.trajectory.at(times=-0.1)
+
+    def test_at_clamp(self) -> None:
+        res = self.trajectory.at(times=[-1.0, 4.0], out_of_range="clamp")
+        self.assertAlmostEqual(res[0].translation.x, 0.0, places=8)
+        self.assertAlmostEqual(res[1].translation.y, 20.0, places=8)
+        self.assertAlmostEqual(res[1].rotation.opk_deg.kappa, 40.0, places=8)
+
+    def test_at_extrapolate(self) -> None:
+        res = self.trajectory.at(times=[-1.0, 5.0], out_of_range="extrapolate")
+        self.assertAlmostEqual(res[0].translation.x, -10.0, places=8)
+        self.assertAlmostEqual(res[0].rotation.opk_deg.omega, -90.0, places=8)
+        self.assertAlmostEqual(res[1].translation.y, 40.0, places=8)
+
+    def test_at_nan(self) -> None:
+        res = self.trajectory.at(times=[0.5, 5.0], out_of_range="nan")
+        self.assertAlmostEqual(res[0].translation.x, 5.0, places=8)
+        self.assertTrue(math.isnan(res.translations.coordinates[3]))
+        self.assertTrue(math.isnan(res.rotations.quaternions[4]))
+
+    def test_at_single_sample(self) -> None:
+        trajectory = poser.Trajectory(
+            timestamps=[1.0],
+            poses=POSES[1:2],
+            out_of_range="clamp",
+        )
+        res = trajectory.at(times=[0.0, 1.0, 2.0])
+        for pose in res:
+            self.assertAlmostEqual(pose.translation.x, 10.0, places=8)
+
+    def test_at_empty_query(self) -> None:
+        self.assertEqual(len(self.trajectory.at(times=[])), 0)
+
+    @unittest.skipIf(poser.buffers.np is None, "numpy is not installed")
+    def test_pure_python_fallback(self) -> None:
+        times = [2.5, -1.0, 0.25, 3.0, 1.5, 4.0, 0.0, 1.0]
+
+        def results() -> list:
+            return [
+                self.trajectory.at(times=times, out_of_range=policy)
+                for policy in ("clamp", "extrapolate", "nan")
+            ]
+
+        expected = results()
+        with mock.patch.object(poser.trajectory, "np", None), \
+                mock.patch.object(poser.pose_array, "np", None):
+            actual = results()
+            with self.assertRaises(ValueError):
+                poser.Trajectory(timestamps=[0.0, 2.0, 1.0], poses=POSES)
+        for a, b in zip(actual, expected):
+            for (values, expected_values,) in (
+                (a.translations.coordinates, b.translations.coordinates),
+                (a.rotations.quaternions, b.rotations.quaternions),
+            ):
+                for v1, v2 in zip(values, expected_values):
+                    if math.isnan(v2):
+                        self.assertTrue(math.isnan(v1))
+                    else:
+                        self.assertAlmostEqual(v1, v2, places=8)
+
+
+if __name__ == "__main__":
+    unittest.main()